@@ -0,0 +1,37 @@
+"""add_active_integration_config_index
+
+Revision ID: 2f7b9c4e1a86
+Revises: 8d4a2e6f1b57
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2f7b9c4e1a86"
+down_revision: str | None = "8d4a2e6f1b57"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Active-provider lookups only ever look at active rows
+    op.create_index(
+        "ix_integration_configs_active_type",
+        "integration_configs",
+        ["integration_type"],
+        sqlite_where=sa.text("is_active"),
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_integration_configs_active_type",
+        table_name="integration_configs",
+    )
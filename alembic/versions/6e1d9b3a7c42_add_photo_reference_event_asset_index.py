@@ -0,0 +1,33 @@
+"""add_photo_reference_event_asset_index
+
+Revision ID: 6e1d9b3a7c42
+Revises: 4b7c3d8e2f1a
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6e1d9b3a7c42"
+down_revision: str | None = "4b7c3d8e2f1a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Linked-photo lookups filter on both columns
+    op.create_index(
+        "ix_photo_references_event_id_immich_asset_id",
+        "photo_references",
+        ["event_id", "immich_asset_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_photo_references_event_id_immich_asset_id",
+        table_name="photo_references",
+    )
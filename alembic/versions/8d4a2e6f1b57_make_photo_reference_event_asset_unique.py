@@ -0,0 +1,47 @@
+"""make_photo_reference_event_asset_unique
+
+Revision ID: 8d4a2e6f1b57
+Revises: 6e1d9b3a7c42
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4a2e6f1b57"
+down_revision: str | None = "6e1d9b3a7c42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Drop duplicates left behind by concurrent inserts before enforcing them
+    op.execute(
+        "DELETE FROM photo_references WHERE id NOT IN ("
+        "SELECT MIN(id) FROM photo_references GROUP BY event_id, immich_asset_id)"
+    )
+    op.drop_index(
+        "ix_photo_references_event_id_immich_asset_id",
+        table_name="photo_references",
+    )
+    op.create_index(
+        "uq_photo_references_event_id_immich_asset_id",
+        "photo_references",
+        ["event_id", "immich_asset_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "uq_photo_references_event_id_immich_asset_id",
+        table_name="photo_references",
+    )
+    op.create_index(
+        "ix_photo_references_event_id_immich_asset_id",
+        "photo_references",
+        ["event_id", "immich_asset_id"],
+    )
@@ -0,0 +1,71 @@
+"""timestamp_server_defaults
+
+Revision ID: 9c1e4d7a2b35
+Revises: 2f7b9c4e1a86
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1e4d7a2b35"
+down_revision: str | None = "2f7b9c4e1a86"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables using TimestampMixin
+TIMESTAMPED_TABLES = (
+    "companies",
+    "company_contacts",
+    "contacts",
+    "email_templates",
+    "events",
+    "expenses",
+    "integration_configs",
+    "notes",
+    "photo_references",
+    "todos",
+    "users",
+)
+
+
+def _utcnow() -> sa.TextClause:
+    # Same expressions as src.models.base.UtcNow
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    if dialect == "sqlite":
+        return sa.text("STRFTIME('%Y-%m-%d %H:%M:%f', 'now')")
+    return sa.text("CURRENT_TIMESTAMP")
+
+
+def _set_defaults(
+    table: str, columns: Sequence[str], default: sa.TextClause | None
+) -> None:
+    with op.batch_alter_table(table) as batch_op:
+        for column in columns:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=default,
+            )
+
+
+def upgrade() -> None:
+    # Let the database fill in timestamps instead of the application
+    now = _utcnow()
+    for table in TIMESTAMPED_TABLES:
+        _set_defaults(table, ("created_at", "updated_at"), now)
+    _set_defaults("sessions", ("created_at",), now)
+
+
+def downgrade() -> None:
+    for table in TIMESTAMPED_TABLES:
+        _set_defaults(table, ("created_at", "updated_at"), None)
+    _set_defaults("sessions", ("created_at",), None)
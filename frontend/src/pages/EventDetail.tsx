@@ -600,13 +600,25 @@ export function EventDetail() {
     setIsSendingEmail(true)
     setEmailResult(null)
     try {
-      const result = await api.post<{ success: boolean; message: string }>(
+      const queued = await api.post<{ success: boolean; message: string; job_id: string | null }>(
         `/events/${id}/expense-report/send`,
         {
           recipient_email: emailAddress || null,
           template_id: selectedTemplateId,
         },
       )
+      let result = { success: queued.success, message: queued.message }
+      // Delivery runs in the background; poll until it succeeded or failed
+      for (let attempt = 0; queued.job_id && attempt < 60; attempt++) {
+        const job = await api.get<{ status: string; message: string }>(
+          `/events/${id}/expense-report/send/${queued.job_id}`,
+        )
+        if (job.status === 'sent' || job.status === 'failed') {
+          result = { success: job.status === 'sent', message: job.message }
+          break
+        }
+        await new Promise((resolve) => setTimeout(resolve, 1000))
+      }
       setEmailResult(result)
       if (result.success) {
         setTimeout(() => {
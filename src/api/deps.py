@@ -2,14 +2,21 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """API dependencies for dependency injection."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Coroutine, Generator
 
 from fastapi import Cookie, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from src.database import SessionLocal
+from src.integrations.base import (
+    DocumentProvider,
+    EmailProvider,
+    ImageSearchProvider,
+    IntegrationProvider,
+)
 from src.models import User
-from src.services import auth_service
+from src.models.enums import IntegrationType
+from src.services import auth_service, integration_service
 
 
 def get_db() -> Generator[Session]:
@@ -78,3 +85,49 @@ def get_optional_user(
         return None
 
     return user
+
+
+def _integration_provider[P: IntegrationProvider](
+    integration_type: IntegrationType,
+    kind: Callable[..., P],
+    label: str,
+) -> Callable[..., Coroutine[None, None, P]]:
+    """Build a dependency returning the provider for the ``config_id`` path param.
+
+    The provider is shared across requests and closed on application shutdown.
+    """
+
+    async def dependency(
+        config_id: str,
+        db: Session = Depends(get_db),
+    ) -> P:
+        config = integration_service.get_integration_config(db, config_id)
+        if not config:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Integration not found",
+            )
+        if config.integration_type is not integration_type:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"This endpoint is only available for {label} integrations",
+            )
+
+        provider = await integration_service.get_shared_provider(config, kind)
+        if not provider:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to create provider instance",
+            )
+        return provider
+
+    return dependency
+
+
+get_paperless_provider = _integration_provider(
+    IntegrationType.PAPERLESS, DocumentProvider, "Paperless"
+)
+get_smtp_provider = _integration_provider(IntegrationType.SMTP, EmailProvider, "SMTP")
+get_unsplash_provider = _integration_provider(
+    IntegrationType.UNSPLASH, ImageSearchProvider, "Unsplash"
+)
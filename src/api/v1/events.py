@@ -3,9 +3,10 @@
 """Event API endpoints."""
 
 import contextlib
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_current_user, get_db
@@ -196,31 +197,28 @@ async def get_event_documents(
     if not paperless_config:
         return []  # No Paperless integration configured
 
-    provider = integration_service.create_provider_instance(paperless_config)
-    if not provider or not isinstance(provider, DocumentProvider):
+    provider = await integration_service.get_shared_provider(
+        paperless_config, DocumentProvider
+    )
+    if not provider:
         return []
 
-    try:
-        # Get the custom field ID for filtering
-        decrypted_config = integration_service.get_decrypted_config(paperless_config)
-        custom_field_name = decrypted_config.get("custom_field_name", "Trip")
-        custom_field = await provider.get_custom_field_by_name(custom_field_name)
-        custom_field_id = custom_field["id"] if custom_field else None
-
-        # Get company storage path
-        storage_path_id = (
-            event.company.paperless_storage_path_id if event.company else None
-        )
+    # Get the custom field ID for filtering
+    decrypted_config = integration_service.get_decrypted_config(paperless_config)
+    custom_field_name = decrypted_config.get("custom_field_name", "Trip")
+    custom_field = await provider.get_custom_field_by_name(custom_field_name)
+    custom_field_id = custom_field["id"] if custom_field else None
 
-        # Get documents matching event criteria
-        documents = await provider.get_documents_for_event(
-            storage_path_id=storage_path_id,
-            custom_field_id=custom_field_id,
-            custom_field_value=event.paperless_custom_field_value,
-        )
-        return [DocumentResponse(**doc) for doc in documents]
-    finally:
-        await provider.close()
+    # Get company storage path
+    storage_path_id = event.company.paperless_storage_path_id if event.company else None
+
+    # Get documents matching event criteria
+    documents = await provider.get_documents_for_event(
+        storage_path_id=storage_path_id,
+        custom_field_id=custom_field_id,
+        custom_field_value=event.paperless_custom_field_value,
+    )
+    return [DocumentResponse(**doc) for doc in documents]
 
 
 @router.delete(
@@ -251,22 +249,21 @@ async def delete_event_document(
             detail="No Paperless integration configured",
         )
 
-    provider = integration_service.create_provider_instance(paperless_config)
-    if not provider or not isinstance(provider, DocumentProvider):
+    provider = await integration_service.get_shared_provider(
+        paperless_config, DocumentProvider
+    )
+    if not provider:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create Paperless provider",
         )
 
-    try:
-        success = await provider.delete_document(document_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete document from Paperless",
-            )
-    finally:
-        await provider.close()
+    success = await provider.delete_document(document_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete document from Paperless",
+        )
 
 
 @router.get("/{event_id}/documents/{document_id}/preview")
@@ -292,26 +289,37 @@ async def get_document_preview(
             detail="No Paperless integration configured",
         )
 
-    provider = integration_service.create_provider_instance(paperless_config)
-    if not provider or not isinstance(provider, DocumentProvider):
+    provider = await integration_service.get_shared_provider(
+        paperless_config, DocumentProvider
+    )
+    if not provider:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create Paperless provider",
         )
 
     try:
-        content, filename, content_type = await provider.download_document(document_id)
-        return Response(
-            content=content,
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f'inline; filename="{filename}"',
-            },
-        )
+        upstream, filename = await provider.stream_document(document_id)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to download document: {e!s}",
         ) from e
-    finally:
-        await provider.close()
+
+    async def body() -> AsyncIterator[bytes]:
+        # Closed here, since Starlette skips background tasks when the client
+        # disconnects and the shared client's connection would leak
+        try:
+            async for chunk in upstream.aiter_bytes():
+                yield chunk
+        finally:
+            await upstream.aclose()
+
+    # Pass the document through in chunks instead of buffering it
+    return StreamingResponse(
+        body(),
+        media_type=upstream.headers.get("content-type", "application/pdf"),
+        headers={
+            "Content-Disposition": f'inline; filename="{filename}"',
+        },
+    )
@@ -2,15 +2,30 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Integration API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import hashlib
+from functools import cache
+from operator import itemgetter
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from src.api.deps import get_current_admin, get_current_user, get_db
+from src.api.deps import (
+    get_current_admin,
+    get_current_user,
+    get_db,
+    get_paperless_provider,
+    get_smtp_provider,
+    get_unsplash_provider,
+)
 from src.integrations.base import DocumentProvider, EmailProvider, ImageSearchProvider
 from src.models import User
 from src.models.enums import IntegrationType
 from src.schemas.integration import (
     AddChoiceRequest,
+    CustomFieldChoice,
     CustomFieldChoicesResponse,
     CustomFieldResponse,
     EventCustomFieldChoicesResponse,
@@ -20,6 +35,7 @@ from src.schemas.integration import (
     IntegrationConfigUpdate,
     IntegrationTestResult,
     IntegrationTypeInfo,
+    PaperlessBundleResponse,
     StoragePathResponse,
     TagResponse,
     TestEmailRequest,
@@ -30,6 +46,20 @@ from src.services import integration_service
 
 router = APIRouter()
 
+# Static content for SMTP test emails
+_TEST_EMAIL_SUBJECT = "Test Email from Travel Manager"
+_TEST_EMAIL_BODY = (
+    "This is a test email from Travel Manager.\n\n"
+    "If you received this, your SMTP configuration is working."
+)
+
+# Serializers for list responses built from trusted data; returning the JSON
+# directly skips FastAPI's response_model validation pass
+_integration_list_adapter = TypeAdapter(list[IntegrationConfigResponse])
+_storage_path_list_adapter = TypeAdapter(list[StoragePathResponse])
+_tag_list_adapter = TypeAdapter(list[TagResponse])
+_custom_field_list_adapter = TypeAdapter(list[CustomFieldResponse])
+
 
 @router.get(
     "/event-custom-field-choices", response_model=EventCustomFieldChoicesResponse
@@ -48,49 +78,69 @@ async def get_event_custom_field_choices(
             choices=[],
         )
 
-    provider = integration_service.create_provider_instance(paperless_config)
-    if not provider or not isinstance(provider, DocumentProvider):
+    provider = await integration_service.get_shared_provider(
+        paperless_config, DocumentProvider
+    )
+    if not provider:
         return EventCustomFieldChoicesResponse(
             available=False,
             custom_field_name="",
             choices=[],
         )
 
-    try:
-        # Get the configured custom field name
-        decrypted_config = integration_service.get_decrypted_config(paperless_config)
-        custom_field_name = decrypted_config.get("custom_field_name", "Trip")
-
-        # Find the custom field and get its choices
-        custom_field = await provider.get_custom_field_by_name(custom_field_name)
-        if not custom_field:
-            return EventCustomFieldChoicesResponse(
-                available=False,
-                custom_field_name=custom_field_name,
-                choices=[],
-            )
+    # Get the configured custom field name
+    decrypted_config = integration_service.get_decrypted_config(paperless_config)
+    custom_field_name = decrypted_config.get("custom_field_name", "Trip")
 
-        choices = await provider.get_custom_field_choices_with_values(
-            custom_field["id"]
-        )
-        # Sort by label
-        choices_sorted = sorted(choices, key=lambda c: c["label"])
+    # Find the custom field and get its choices
+    custom_field = await provider.get_custom_field_by_name(custom_field_name)
+    if not custom_field:
         return EventCustomFieldChoicesResponse(
-            available=True,
+            available=False,
             custom_field_name=custom_field_name,
-            choices=choices_sorted,
+            choices=[],
         )
-    finally:
-        await provider.close()
+
+    # The name lookup already returns the select options
+    choices = provider.parse_select_choices(custom_field)
+    # Sort by label
+    choices_sorted = sorted(choices, key=itemgetter("label"))
+    return EventCustomFieldChoicesResponse(
+        available=True,
+        custom_field_name=custom_field_name,
+        choices=[CustomFieldChoice(**choice) for choice in choices_sorted],
+    )
+
+
+def _cacheable_json(request: Request, body: bytes) -> Response:
+    """Return a JSON body with an ETag, or 304 if the client already has it."""
+    etag = f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@cache
+def _integration_types_json() -> bytes:
+    """Serialize the registered integration types once.
+
+    Providers register themselves at import time, so the result never changes
+    while the application is running.
+    """
+    types = [
+        IntegrationTypeInfo(**t) for t in integration_service.list_integration_types()
+    ]
+    return TypeAdapter(list[IntegrationTypeInfo]).dump_json(types)
 
 
 @router.get("/types", response_model=list[IntegrationTypeInfo])
 def list_integration_types(
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> list[IntegrationTypeInfo]:
+) -> Response:
     """List all available integration types with their config schemas."""
-    types = integration_service.list_integration_types()
-    return [IntegrationTypeInfo(**t) for t in types]
+    return _cacheable_json(request, _integration_types_json())
 
 
 @router.get("", response_model=list[IntegrationConfigResponse])
@@ -98,10 +148,20 @@ def list_integrations(
     integration_type: IntegrationType | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> list[IntegrationConfigResponse]:
+) -> Response:
     """List all configured integrations."""
-    configs = integration_service.get_integration_configs(db, integration_type)
-    return [IntegrationConfigResponse.model_validate(c) for c in configs]
+    configs = integration_service.get_integration_configs(
+        db, integration_type, include_secrets=False
+    )
+    # Rows come straight from our own table, so skip re-validating each one
+    fields = IntegrationConfigResponse.model_fields
+    items = [
+        IntegrationConfigResponse.model_construct(**{f: getattr(c, f) for f in fields})
+        for c in configs
+    ]
+    return Response(
+        _integration_list_adapter.dump_json(items), media_type="application/json"
+    )
 
 
 @router.post(
@@ -200,51 +260,28 @@ async def test_integration(
     current_user: User = Depends(get_current_user),
 ) -> IntegrationTestResult:
     """Test connectivity for an integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
+    result = await integration_service.test_integration_by_id(db, config_id)
+    if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Integration not found",
         )
-    success, message = await integration_service.test_integration_connection(config)
+    success, message = result
     return IntegrationTestResult(success=success, message=message)
 
 
 @router.post("/{config_id}/test-email", response_model=TestEmailResponse)
 async def send_test_email(
-    config_id: str,
     data: TestEmailRequest,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    provider: EmailProvider = Depends(get_smtp_provider),
 ) -> TestEmailResponse:
     """Send a test email via an SMTP integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.SMTP:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for SMTP integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, EmailProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
     try:
         success = await provider.send_email(
             to=[data.to_email],
-            subject="Test Email from Travel Manager",
-            body=(
-                "This is a test email from Travel Manager.\n\n"
-                "If you received this, your SMTP configuration is working."
-            ),
+            subject=_TEST_EMAIL_SUBJECT,
+            body=_TEST_EMAIL_BODY,
         )
         if success:
             return TestEmailResponse(
@@ -253,146 +290,78 @@ async def send_test_email(
         return TestEmailResponse(success=False, message="Failed to send test email")
     except Exception as e:
         return TestEmailResponse(success=False, message=str(e))
-    finally:
-        await provider.close()
 
 
 @router.get("/{config_id}/storage-paths", response_model=list[StoragePathResponse])
 async def list_storage_paths(
-    config_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> list[StoragePathResponse]:
+    provider: DocumentProvider = Depends(get_paperless_provider),
+) -> Response:
     """List storage paths from a Paperless integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.PAPERLESS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Paperless integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, DocumentProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
-    try:
-        paths = await provider.list_storage_paths()
-        return [StoragePathResponse(**p) for p in paths]
-    finally:
-        await provider.close()
+    paths = await provider.list_storage_paths()
+    items = [StoragePathResponse.model_construct(**p) for p in paths]
+    return _cacheable_json(request, _storage_path_list_adapter.dump_json(items))
 
 
 @router.get("/{config_id}/tags", response_model=list[TagResponse])
 async def list_tags(
-    config_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> list[TagResponse]:
+    provider: DocumentProvider = Depends(get_paperless_provider),
+) -> Response:
     """List tags from a Paperless integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.PAPERLESS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Paperless integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, DocumentProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
-    try:
-        tags = await provider.list_tags()
-        return [TagResponse(**t) for t in tags]
-    finally:
-        await provider.close()
+    tags = await provider.list_tags()
+    items = [TagResponse.model_construct(**t) for t in tags]
+    return _cacheable_json(request, _tag_list_adapter.dump_json(items))
 
 
 @router.get("/{config_id}/custom-fields", response_model=list[CustomFieldResponse])
 async def list_custom_fields(
-    config_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> list[CustomFieldResponse]:
+    provider: DocumentProvider = Depends(get_paperless_provider),
+) -> Response:
     """List custom fields from a Paperless integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.PAPERLESS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Paperless integrations",
-        )
+    fields = await provider.list_custom_fields()
+    items = [CustomFieldResponse.model_construct(**f) for f in fields]
+    return _cacheable_json(request, _custom_field_list_adapter.dump_json(items))
 
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, DocumentProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
 
-    try:
-        fields = await provider.list_custom_fields()
-        return [CustomFieldResponse(**f) for f in fields]
-    finally:
-        await provider.close()
+@router.get("/{config_id}/paperless/bundle", response_model=PaperlessBundleResponse)
+async def get_paperless_bundle(
+    current_user: User = Depends(get_current_user),
+    provider: DocumentProvider = Depends(get_paperless_provider),
+) -> PaperlessBundleResponse:
+    """List tags, custom fields and storage paths of a Paperless integration.
+
+    The three lookups are independent, so they run concurrently on one
+    provider instead of as three separate requests.
+    """
+    tags, fields, paths = await asyncio.gather(
+        provider.list_tags(),
+        provider.list_custom_fields(),
+        provider.list_storage_paths(),
+    )
+    return PaperlessBundleResponse.model_validate(
+        {"tags": tags, "custom_fields": fields, "storage_paths": paths}
+    )
 
 
 @router.get("/{config_id}/custom-fields/{field_id}", response_model=CustomFieldResponse)
 async def get_custom_field(
-    config_id: str,
     field_id: int,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    provider: DocumentProvider = Depends(get_paperless_provider),
 ) -> CustomFieldResponse:
     """Get a custom field by ID from a Paperless integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
+    field = await provider.get_custom_field(field_id)
+    if not field:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
+            detail="Custom field not found",
         )
-    if config.integration_type != IntegrationType.PAPERLESS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Paperless integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, DocumentProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
-    try:
-        field = await provider.get_custom_field(field_id)
-        if not field:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Custom field not found",
-            )
-        return CustomFieldResponse(**field)
-    finally:
-        await provider.close()
+    return CustomFieldResponse(**field)
 
 
 @router.get(
@@ -400,36 +369,13 @@ async def get_custom_field(
     response_model=CustomFieldChoicesResponse,
 )
 async def get_custom_field_choices(
-    config_id: str,
     field_id: int,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    provider: DocumentProvider = Depends(get_paperless_provider),
 ) -> CustomFieldChoicesResponse:
     """Get choices for a select-type custom field from a Paperless integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.PAPERLESS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Paperless integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, DocumentProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
-    try:
-        choices = await provider.get_custom_field_choices(field_id)
-        return CustomFieldChoicesResponse(choices=choices)
-    finally:
-        await provider.close()
+    choices = await provider.get_custom_field_choices(field_id)
+    return CustomFieldChoicesResponse(choices=choices)
 
 
 @router.post(
@@ -437,112 +383,44 @@ async def get_custom_field_choices(
     response_model=CustomFieldChoicesResponse,
 )
 async def add_custom_field_choice(
-    config_id: str,
     field_id: int,
     data: AddChoiceRequest,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    provider: DocumentProvider = Depends(get_paperless_provider),
 ) -> CustomFieldChoicesResponse:
     """Add a choice to a select-type custom field in a Paperless integration."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.PAPERLESS:
+    try:
+        await provider.add_custom_field_choice(field_id, data.choice)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Paperless integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, DocumentProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
-    try:
-        try:
-            await provider.add_custom_field_choice(field_id, data.choice)
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=str(e),
-            ) from e
-        # Return updated choices
-        choices = await provider.get_custom_field_choices(field_id)
-        return CustomFieldChoicesResponse(choices=choices)
-    finally:
-        await provider.close()
+            detail=str(e),
+        ) from e
+    # Return updated choices
+    choices = await provider.get_custom_field_choices(field_id)
+    return CustomFieldChoicesResponse(choices=choices)
 
 
 @router.get("/{config_id}/unsplash/search", response_model=UnsplashSearchResponse)
 async def search_unsplash_images(
-    config_id: str,
     query: str,
     page: int = 1,
     per_page: int = 20,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> UnsplashSearchResponse:
+    provider: ImageSearchProvider = Depends(get_unsplash_provider),
+) -> Response:
     """Search for images on Unsplash."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.UNSPLASH:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Unsplash integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, ImageSearchProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
-    try:
-        result = await provider.search_images(query, page=page, per_page=per_page)
-        return UnsplashSearchResponse(**result)
-    finally:
-        await provider.close()
+    result = await provider.search_images(query, page=page, per_page=per_page)
+    # The provider already reshapes results to UnsplashSearchResponse
+    return Response(orjson.dumps(result), media_type="application/json")
 
 
 @router.post("/{config_id}/unsplash/download/{image_id}")
 async def trigger_unsplash_download(
-    config_id: str,
     image_id: str,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    provider: ImageSearchProvider = Depends(get_unsplash_provider),
 ) -> dict[str, str]:
     """Trigger download tracking for an Unsplash image (required by API guidelines)."""
-    config = integration_service.get_integration_config(db, config_id)
-    if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Integration not found",
-        )
-    if config.integration_type != IntegrationType.UNSPLASH:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This endpoint is only available for Unsplash integrations",
-        )
-
-    provider = integration_service.create_provider_instance(config)
-    if not provider or not isinstance(provider, ImageSearchProvider):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create provider instance",
-        )
-
-    try:
-        download_url = await provider.trigger_download(image_id)
-        return {"download_url": download_url}
-    finally:
-        await provider.close()
+    download_url = await provider.trigger_download(image_id)
+    return {"download_url": download_url}
@@ -5,6 +5,8 @@
 import logging
 
 import httpx
+import orjson
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Query
 
 from src.schemas.location import LocationSuggestion
@@ -17,6 +19,39 @@ router = APIRouter(prefix="/locations", tags=["locations"])
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 USER_AGENT = "TravelManager/0.2.0 (https://github.com/rknall/travel-manager)"
 
+# Address fields holding the place name, most specific first
+_CITY_FIELDS = ("city", "town", "village", "municipality", "state")
+
+# Nominatim allows ~1 request/s, so repeated prefixes are served from memory.
+# Keyed by (normalized query, limit, lang).
+_autocomplete_cache: TTLCache[tuple[str, int, str], list[LocationSuggestion]] = (
+    TTLCache(maxsize=1024, ttl=3600)
+)
+
+# Shared client so repeated lookups reuse the keep-alive connection
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared Nominatim client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            headers={"User-Agent": USER_AGENT},
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Nominatim client. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 @router.get("/autocomplete", response_model=list[LocationSuggestion])
 async def autocomplete_location(
@@ -29,75 +64,72 @@ async def autocomplete_location(
     Returns city, country, coordinates for location autocomplete.
     Supports German city names by default.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(
-                NOMINATIM_URL,
-                params={
-                    "q": q,
-                    "format": "json",
-                    "addressdetails": 1,
-                    "limit": limit,
-                },
-                headers={
-                    "User-Agent": USER_AGENT,
-                    "Accept-Language": lang,
-                },
-                timeout=10.0,
+    cache_key = (q.strip().casefold(), limit, lang)
+    cached = _autocomplete_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    client = _get_http_client()
+    try:
+        resp = await client.get(
+            NOMINATIM_URL,
+            params={
+                "q": q,
+                "format": "json",
+                "addressdetails": 1,
+                "limit": limit,
+            },
+            headers={"Accept-Language": lang},
+        )
+
+        if resp.status_code != 200:
+            logger.error(
+                f"Nominatim returned status {resp.status_code}: {resp.text[:200]}"
+            )
+            raise HTTPException(
+                status_code=502,
+                detail=f"Geocoding service unavailable (status {resp.status_code})",
             )
 
-            if resp.status_code != 200:
-                logger.error(
-                    f"Nominatim returned status {resp.status_code}: {resp.text[:200]}"
-                )
-                raise HTTPException(
-                    status_code=502,
-                    detail=f"Geocoding service unavailable (status {resp.status_code})",
-                )
+        results = orjson.loads(resp.content)
+        suggestions = []
 
-            results = resp.json()
-            suggestions = []
+        for result in results:
+            address = result.get("address", {})
 
-            for result in results:
-                address = result.get("address", {})
+            # Extract city name (try multiple fields)
+            city = next((address[k] for k in _CITY_FIELDS if address.get(k)), None)
 
-                # Extract city name (try multiple fields)
-                city = (
-                    address.get("city")
-                    or address.get("town")
-                    or address.get("village")
-                    or address.get("municipality")
-                    or address.get("state")
-                )
+            country = address.get("country", "")
+            country_code = address.get("country_code", "").upper()
 
-                country = address.get("country", "")
-                country_code = address.get("country_code", "").upper()
-
-                if not country:
-                    continue
-
-                suggestions.append(
-                    LocationSuggestion(
-                        city=city,
-                        country=country,
-                        country_code=country_code,
-                        latitude=float(result["lat"]),
-                        longitude=float(result["lon"]),
-                        display_name=result.get("display_name", ""),
-                    )
-                )
+            if not country:
+                continue
 
-            return suggestions
+            # Values are already coerced to the schema types, skip validation
+            suggestions.append(
+                LocationSuggestion.model_construct(
+                    city=city,
+                    country=country,
+                    country_code=country_code,
+                    latitude=float(result["lat"]),
+                    longitude=float(result["lon"]),
+                    display_name=result.get("display_name", ""),
+                )
+            )
 
-        except httpx.HTTPError as e:
-            logger.error(f"Nominatim HTTP error: {e}")
-            raise HTTPException(
-                status_code=502,
-                detail=f"Geocoding service error: {e}",
-            ) from e
-        except Exception as e:
-            logger.error(f"Nominatim unexpected error: {e}")
-            raise HTTPException(
-                status_code=502,
-                detail=f"Geocoding service error: {e}",
-            ) from e
+        _autocomplete_cache[cache_key] = suggestions
+        return suggestions
+
+    except httpx.HTTPError as e:
+        logger.error(f"Nominatim HTTP error: {e}")
+        raise HTTPException(
+            status_code=502,
+            detail=f"Geocoding service error: {e}",
+        ) from e
+    except Exception as e:
+        logger.error(f"Nominatim unexpected error: {e}")
+        raise HTTPException(
+            status_code=502,
+            detail=f"Geocoding service error: {e}",
+        ) from e
@@ -2,31 +2,43 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Note API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_current_user, get_db
-from src.models import Note, User
+from src.models import User
 from src.schemas.note import NoteCreate, NoteResponse, NoteUpdate
-from src.services import event_service
+from src.services import event_service, note_service
 
 router = APIRouter()
 
+# Serializer for the note list; returning the JSON directly skips FastAPI's
+# response_model validation pass
+_note_list_adapter = TypeAdapter(list[NoteResponse])
+
 
 @router.get("/{event_id}/notes", response_model=list[NoteResponse])
 def list_notes(
     event_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> list[NoteResponse]:
+) -> Response:
     """List notes for an event."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
+    event = event_service.get_event_for_user(
+        db, event_id, current_user.id, include_notes=True
+    )
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found",
         )
-    return [NoteResponse.model_validate(n) for n in event.notes]
+    fields = NoteResponse.model_fields
+    items = [
+        NoteResponse.model_construct(**{f: getattr(n, f) for f in fields})
+        for n in event.notes
+    ]
+    return Response(_note_list_adapter.dump_json(items), media_type="application/json")
 
 
 @router.post(
@@ -48,15 +60,11 @@ def create_note(
             detail="Event not found",
         )
 
-    note = Note(
-        event_id=event_id,
-        content=data.content,
-        note_type=data.note_type,
-    )
-    db.add(note)
+    note = note_service.create_note(db, event_id, data)
+    # Build the response before committing; commit expires the instance
+    response = NoteResponse.model_validate(note)
     db.commit()
-    db.refresh(note)
-    return NoteResponse.model_validate(note)
+    return response
 
 
 @router.get("/{event_id}/notes/{note_id}", response_model=NoteResponse)
@@ -67,14 +75,7 @@ def get_note(
     current_user: User = Depends(get_current_user),
 ) -> NoteResponse:
     """Get a specific note."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found",
-        )
-
-    note = db.query(Note).filter(Note.id == note_id, Note.event_id == event_id).first()
+    note = note_service.get_note_for_user(db, event_id, note_id, current_user.id)
     if not note:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -92,25 +93,23 @@ def update_note(
     current_user: User = Depends(get_current_user),
 ) -> NoteResponse:
     """Update a note."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found",
-        )
-
-    note = db.query(Note).filter(Note.id == note_id, Note.event_id == event_id).first()
+    note = note_service.update_note_for_user(
+        db,
+        event_id,
+        note_id,
+        current_user.id,
+        data.model_dump(exclude_unset=True),
+    )
     if not note:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Note not found",
         )
 
-    for field, value in data.model_dump(exclude_unset=True).items():
-        setattr(note, field, value)
+    # Build the response before committing; commit expires the instance
+    response = NoteResponse.model_validate(note)
     db.commit()
-    db.refresh(note)
-    return NoteResponse.model_validate(note)
+    return response
 
 
 @router.delete("/{event_id}/notes/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -121,14 +120,7 @@ def delete_note(
     current_user: User = Depends(get_current_user),
 ) -> None:
     """Delete a note."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found",
-        )
-
-    note = db.query(Note).filter(Note.id == note_id, Note.event_id == event_id).first()
+    note = note_service.get_note_for_user(db, event_id, note_id, current_user.id)
     if not note:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
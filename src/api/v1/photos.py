@@ -2,13 +2,19 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Photo API endpoints for Immich integration."""
 
+from collections.abc import AsyncIterator
 from datetime import date, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_current_user, get_db
-from src.integrations import IntegrationRegistry
+from src.integrations.base import PhotoProvider
 from src.integrations.immich import ImmichProvider
 from src.models import Event, IntegrationConfig, PhotoReference, User
 from src.models.enums import IntegrationType
@@ -19,30 +25,116 @@ from src.schemas.photo import (
     PhotoReferenceResponse,
     PhotoReferenceUpdate,
 )
-from src.services import location_image_service
+from src.services import (
+    event_service,
+    integration_service,
+    location_image_service,
+    thumbnail_cache,
+)
 
 router = APIRouter()
 
+_THUMBNAIL_CACHE_CONTROL = "private, max-age=604800, immutable"
+
+# Validator and serializer for Immich search results
+_photo_asset_list_adapter = TypeAdapter(list[PhotoAsset])
+
+# Serializer for the reference list; returning the JSON directly skips FastAPI's
+# response_model validation pass
+_photo_reference_list_adapter = TypeAdapter(list[PhotoReferenceResponse])
 
-def get_immich_provider(db: Session) -> ImmichProvider | None:
+# Maximum number of asset IDs per linked-photo lookup query
+_LINKED_ID_BATCH_SIZE = 500
+
+
+async def get_immich_provider(db: Session) -> ImmichProvider | None:
     """Get active Immich provider if configured."""
-    config = (
-        db.query(IntegrationConfig)
-        .filter(
-            IntegrationConfig.integration_type == IntegrationType.IMMICH,
-            IntegrationConfig.is_active.is_(True),
+    config = integration_service.get_active_config(db, IntegrationType.IMMICH)
+    if not config:
+        return None
+    return await _shared_immich_provider(config)
+
+
+async def _shared_immich_provider(config: IntegrationConfig) -> ImmichProvider | None:
+    """Get the live Immich provider for an integration config."""
+    provider = await integration_service.get_shared_provider(config, PhotoProvider)
+    return provider  # type: ignore
+
+
+def _linked_asset_ids(db: Session, event_id: str, asset_ids: list[str]) -> set[str]:
+    """Return which of the given Immich assets are already linked to the event.
+
+    Only linked IDs are kept, and large searches are checked in batches so the
+    IN clause stays within the database's bound parameter limits.
+    """
+    linked: set[str] = set()
+    for start in range(0, len(asset_ids), _LINKED_ID_BATCH_SIZE):
+        batch = asset_ids[start : start + _LINKED_ID_BATCH_SIZE]
+        linked.update(
+            asset_id
+            for (asset_id,) in db.query(PhotoReference.immich_asset_id).filter(
+                PhotoReference.event_id == event_id,
+                PhotoReference.immich_asset_id.in_(batch),
+            )
+        )
+    return linked
+
+
+def _get_owned_reference(
+    db: Session, event_id: str, photo_id: str, user_id: str
+) -> PhotoReference:
+    """Resolve event ownership and the photo reference in a single query."""
+    row = (
+        db.query(Event.user_id, PhotoReference)
+        .outerjoin(
+            PhotoReference,
+            and_(
+                PhotoReference.event_id == Event.id,
+                PhotoReference.id == photo_id,
+            ),
         )
+        .filter(Event.id == event_id)
         .first()
     )
+    if not row:
+        raise HTTPException(status_code=404, detail="Event not found")
 
-    if not config:
-        return None
+    owner_id, reference = row
+    if owner_id != user_id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    if not reference:
+        raise HTTPException(status_code=404, detail="Photo reference not found")
 
-    from src.encryption import decrypt_config
+    return reference
 
-    decrypted = decrypt_config(config.config_encrypted)
-    provider = IntegrationRegistry.create_provider("immich", decrypted)
-    return provider  # type: ignore
+
+def _photo_asset_response(
+    event_id: str, assets: list[dict], linked_ids: set[str]
+) -> Response:
+    """Convert Immich assets to the PhotoAsset list JSON in a single pass."""
+    thumbnail_prefix = f"/api/v1/events/{event_id}/photos/"
+    rows = []
+    for asset in assets:
+        exif = asset.get("exifInfo", {})
+        rows.append(
+            {
+                "id": asset["id"],
+                "original_filename": asset.get("originalFileName"),
+                "thumbnail_url": thumbnail_prefix + asset["id"] + "/thumbnail",
+                "taken_at": exif.get("dateTimeOriginal"),
+                "latitude": exif.get("latitude"),
+                "longitude": exif.get("longitude"),
+                "city": exif.get("city"),
+                "country": exif.get("country"),
+                "distance_km": asset.get("_distance_km"),
+                "is_linked": asset["id"] in linked_ids,
+            }
+        )
+
+    photos = _photo_asset_list_adapter.validate_python(rows)
+    return Response(
+        _photo_asset_list_adapter.dump_json(photos), media_type="application/json"
+    )
 
 
 @router.get("/{event_id}/photos", response_model=list[PhotoAsset])
@@ -50,13 +142,13 @@ async def get_event_photos(
     event_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> list[PhotoAsset]:
+) -> Response:
     """Get photos from Immich matching event location and dates.
 
     Requires Immich integration to be configured and event to have location data.
     """
     # Get event
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -65,59 +157,28 @@ async def get_event_photos(
 
     # Check if event has location
     if not event.latitude or not event.longitude:
-        return []  # No location, can't search
+        return _photo_asset_response(event_id, [], set())  # No location to search
 
     # Get Immich provider
-    provider = get_immich_provider(db)
+    provider = await get_immich_provider(db)
     if not provider:
         raise HTTPException(
             status_code=400,
             detail="Immich integration not configured",
         )
 
-    try:
-        # Search by location and date range
-        start_date = datetime.combine(event.start_date, datetime.min.time())
-        end_date = datetime.combine(event.end_date, datetime.max.time()) + timedelta(
-            days=1
-        )
-        assets = await provider.search_by_location_and_date(
-            latitude=event.latitude,
-            longitude=event.longitude,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        # Get already-linked photo IDs
-        linked_ids = {
-            ref.immich_asset_id
-            for ref in db.query(PhotoReference.immich_asset_id)
-            .filter(PhotoReference.event_id == event_id)
-            .all()
-        }
-
-        # Convert to response schema
-        result = []
-        for asset in assets:
-            exif = asset.get("exifInfo", {})
-            result.append(
-                PhotoAsset(
-                    id=asset["id"],
-                    original_filename=asset.get("originalFileName"),
-                    thumbnail_url=f"/api/v1/events/{event_id}/photos/{asset['id']}/thumbnail",
-                    taken_at=exif.get("dateTimeOriginal"),
-                    latitude=exif.get("latitude"),
-                    longitude=exif.get("longitude"),
-                    city=exif.get("city"),
-                    country=exif.get("country"),
-                    distance_km=asset.get("_distance_km"),
-                    is_linked=asset["id"] in linked_ids,
-                )
-            )
+    # Search by location and date range
+    start_date = datetime.combine(event.start_date, datetime.min.time())
+    end_date = datetime.combine(event.end_date, datetime.max.time()) + timedelta(days=1)
+    assets = await provider.search_by_location_and_date(
+        latitude=event.latitude,
+        longitude=event.longitude,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
-        return result
-    finally:
-        await provider.close()
+    linked_ids = _linked_asset_ids(db, event_id, [a["id"] for a in assets])
+    return _photo_asset_response(event_id, assets, linked_ids)
 
 
 @router.get("/{event_id}/photos/by-date", response_model=list[PhotoAsset])
@@ -125,13 +186,13 @@ async def get_event_photos_by_date(
     event_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> list[PhotoAsset]:
+) -> Response:
     """Get photos from Immich matching event date range only.
 
     This is a manual search option when location-based search doesn't find results.
     Only available for past events.
     """
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -146,65 +207,34 @@ async def get_event_photos_by_date(
             detail="Date-based search is only available for past events",
         )
 
-    provider = get_immich_provider(db)
+    provider = await get_immich_provider(db)
     if not provider:
         raise HTTPException(
             status_code=400,
             detail="Immich integration not configured",
         )
 
-    try:
-        start_date = datetime.combine(event.start_date, datetime.min.time())
-        end_date = datetime.combine(event.end_date, datetime.max.time()) + timedelta(
-            days=1
-        )
-        assets = await provider.search_by_date_only(
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        # Get already-linked photo IDs
-        linked_ids = {
-            ref.immich_asset_id
-            for ref in db.query(PhotoReference.immich_asset_id)
-            .filter(PhotoReference.event_id == event_id)
-            .all()
-        }
-
-        # Convert to response schema
-        result = []
-        for asset in assets:
-            exif = asset.get("exifInfo", {})
-            result.append(
-                PhotoAsset(
-                    id=asset["id"],
-                    original_filename=asset.get("originalFileName"),
-                    thumbnail_url=f"/api/v1/events/{event_id}/photos/{asset['id']}/thumbnail",
-                    taken_at=exif.get("dateTimeOriginal"),
-                    latitude=exif.get("latitude"),
-                    longitude=exif.get("longitude"),
-                    city=exif.get("city"),
-                    country=exif.get("country"),
-                    distance_km=None,
-                    is_linked=asset["id"] in linked_ids,
-                )
-            )
+    start_date = datetime.combine(event.start_date, datetime.min.time())
+    end_date = datetime.combine(event.end_date, datetime.max.time()) + timedelta(days=1)
+    assets = await provider.search_by_date_only(
+        start_date=start_date,
+        end_date=end_date,
+    )
 
-        return result
-    finally:
-        await provider.close()
+    linked_ids = _linked_asset_ids(db, event_id, [a["id"] for a in assets])
+    return _photo_asset_response(event_id, assets, linked_ids)
 
 
 @router.get(
     "/{event_id}/photos/references", response_model=list[PhotoReferenceResponse]
 )
-async def get_photo_references(
+def get_photo_references(
     event_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> list[PhotoReferenceResponse]:
+) -> Response:
     """Get saved photo references for an event."""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -218,56 +248,60 @@ async def get_photo_references(
         .all()
     )
 
-    return references
+    fields = PhotoReferenceResponse.model_fields
+    items = [
+        PhotoReferenceResponse.model_construct(**{f: getattr(r, f) for f in fields})
+        for r in references
+    ]
+    return Response(
+        _photo_reference_list_adapter.dump_json(items), media_type="application/json"
+    )
 
 
 @router.post("/{event_id}/photos", response_model=PhotoReferenceResponse)
-async def add_photo_reference(
+def add_photo_reference(
     event_id: str,
     photo: PhotoReferenceCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> PhotoReferenceResponse:
     """Add a photo reference to an event."""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     if event.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    # Check if already linked
-    existing = (
-        db.query(PhotoReference)
-        .filter(
-            PhotoReference.event_id == event_id,
-            PhotoReference.immich_asset_id == photo.immich_asset_id,
+    # Create reference; the unique index rejects photos that are already linked
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        insert(PhotoReference)
+        .values(
+            event_id=event_id,
+            immich_asset_id=photo.immich_asset_id,
+            caption=photo.caption,
+            include_in_report=photo.include_in_report,
+            thumbnail_url=photo.thumbnail_url,
+            taken_at=photo.taken_at,
+            latitude=photo.latitude,
+            longitude=photo.longitude,
         )
-        .first()
+        .on_conflict_do_nothing(index_elements=["event_id", "immich_asset_id"])
+        .returning(PhotoReference)
     )
-    if existing:
+    reference = db.execute(stmt).scalar_one_or_none()
+    if not reference:
         raise HTTPException(status_code=400, detail="Photo already linked to event")
 
-    # Create reference
-    reference = PhotoReference(
-        event_id=event_id,
-        immich_asset_id=photo.immich_asset_id,
-        caption=photo.caption,
-        include_in_report=photo.include_in_report,
-        thumbnail_url=photo.thumbnail_url,
-        taken_at=photo.taken_at,
-        latitude=photo.latitude,
-        longitude=photo.longitude,
-    )
-    db.add(reference)
+    response = PhotoReferenceResponse.model_validate(reference)
     db.commit()
-    db.refresh(reference)
 
-    return reference
+    return response
 
 
 @router.put("/{event_id}/photos/{photo_id}", response_model=PhotoReferenceResponse)
-async def update_photo_reference(
+def update_photo_reference(
     event_id: str,
     photo_id: str,
     update: PhotoReferenceUpdate,
@@ -275,20 +309,7 @@ async def update_photo_reference(
     current_user: User = Depends(get_current_user),
 ) -> PhotoReferenceResponse:
     """Update a photo reference caption or include_in_report flag."""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    if event.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    reference = (
-        db.query(PhotoReference)
-        .filter(PhotoReference.id == photo_id, PhotoReference.event_id == event_id)
-        .first()
-    )
-    if not reference:
-        raise HTTPException(status_code=404, detail="Photo reference not found")
+    reference = _get_owned_reference(db, event_id, photo_id, current_user.id)
 
     # Update fields
     if update.caption is not None:
@@ -303,27 +324,14 @@ async def update_photo_reference(
 
 
 @router.delete("/{event_id}/photos/{photo_id}")
-async def delete_photo_reference(
+def delete_photo_reference(
     event_id: str,
     photo_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """Remove a photo reference from an event."""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    if event.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    reference = (
-        db.query(PhotoReference)
-        .filter(PhotoReference.id == photo_id, PhotoReference.event_id == event_id)
-        .first()
-    )
-    if not reference:
-        raise HTTPException(status_code=404, detail="Photo reference not found")
+    reference = _get_owned_reference(db, event_id, photo_id, current_user.id)
 
     db.delete(reference)
     db.commit()
@@ -343,29 +351,53 @@ async def proxy_photo_thumbnail(
     Browsers can't send API key headers on img tags,
     so we proxy through the backend.
     """
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    if not event_service.user_owns_event(db, event_id, current_user.id):
         raise HTTPException(status_code=404, detail="Event not found")
 
-    if event.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    provider = get_immich_provider(db)
-    if not provider:
+    config = integration_service.get_active_config(db, IntegrationType.IMMICH)
+    provider = await _shared_immich_provider(config) if config else None
+    if not config or not provider:
         raise HTTPException(
             status_code=400,
             detail="Immich integration not configured",
         )
 
+    # Asset thumbnails never change, so let the browser keep them
+    config_id, version = config.id, config.config_encrypted
+    cached = thumbnail_cache.get_thumbnail(config_id, version, asset_id)
+    if cached:
+        content, media_type = cached
+        return Response(
+            content=content,
+            media_type=media_type,
+            headers={"Cache-Control": _THUMBNAIL_CACHE_CONTROL},
+        )
+
     try:
-        content, content_type = await provider.get_asset_thumbnail(asset_id)
-        return Response(content=content, media_type=content_type)
+        upstream = await provider.stream_asset_thumbnail(asset_id)
     except Exception as e:
         raise HTTPException(
             status_code=502, detail=f"Failed to fetch thumbnail: {e}"
         ) from e
-    finally:
-        await provider.close()
+
+    media_type = upstream.headers.get("content-type", "image/jpeg")
+
+    async def body() -> AsyncIterator[bytes]:
+        # Closed here, since Starlette skips background tasks when the client
+        # disconnects and the pooled connection would leak
+        try:
+            async for chunk in thumbnail_cache.cache_stream(
+                config_id, version, asset_id, upstream.aiter_bytes(), media_type
+            ):
+                yield chunk
+        finally:
+            await upstream.aclose()
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Cache-Control": _THUMBNAIL_CACHE_CONTROL},
+    )
 
 
 @router.get("/{event_id}/location-image", response_model=LocationImageResponse | None)
@@ -378,7 +410,7 @@ async def get_event_location_image(
 
     Returns None if no Unsplash API key is configured or location not set.
     """
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -2,12 +2,18 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Report API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+import uuid
+from typing import Literal
+
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.responses import Response
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_current_user, get_db
+from src.database import SessionLocal
 from src.integrations.base import EmailProvider
 from src.models import User
 from src.models.enums import IntegrationType
@@ -19,8 +25,12 @@ from src.services import (
 )
 from src.services.report_generator import create_report_generator
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+SendStatus = Literal["queued", "sending", "sent", "failed"]
+
 
 class SendReportRequest(BaseModel):
     """Schema for sending expense report via email."""
@@ -45,6 +55,32 @@ class SendReportResponse(BaseModel):
     success: bool
     message: str
     recipients: list[str] = []
+    job_id: str | None = None
+
+
+class SendReportStatus(BaseModel):
+    """Schema for the delivery status of a queued expense report email."""
+
+    job_id: str
+    event_id: str
+    status: SendStatus
+    message: str
+    recipients: list[str] = []
+
+
+# Delivery status of queued report emails by job ID, with the owning user ID.
+# Kept in memory: the app runs as a single process and the status is only
+# needed until the client has polled it.
+_send_jobs: TTLCache[str, tuple[str, SendReportStatus]] = TTLCache(
+    maxsize=256, ttl=3600
+)
+
+
+def _set_job_status(job_id: str, state: SendStatus, message: str) -> None:
+    """Record the progress of a queued report email, if still tracked."""
+    if (job := _send_jobs.get(job_id)) is not None:
+        job[1].status = state
+        job[1].message = message
 
 
 @router.get("/{event_id}/expense-report/preview")
@@ -62,11 +98,7 @@ async def preview_expense_report(
         )
 
     generator = await create_report_generator(db, event)
-    try:
-        return generator.get_preview(event)
-    finally:
-        if generator.paperless:
-            await generator.paperless.close()
+    return generator.get_preview(event)
 
 
 @router.post("/{event_id}/expense-report/generate")
@@ -84,30 +116,110 @@ async def generate_expense_report(
         )
 
     generator = await create_report_generator(db, event)
+    zip_bytes = await generator.generate(event)
+    filename = generator.get_filename(event)
+
+    return Response(
+        content=zip_bytes,
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
+    )
+
+
+async def _send_expense_report(
+    job_id: str,
+    event_id: str,
+    user_id: str,
+    template_id: str,
+    recipient_emails: list[str],
+    smtp_config_id: str,
+) -> None:
+    """Generate the expense report and email it. Runs as a background task.
+
+    The outcome is recorded under ``job_id`` for get_send_status().
+    """
+    _set_job_status(job_id, "sending", "Expense report is being sent")
+    db = SessionLocal()
     try:
+        event = event_service.get_event_for_user(
+            db,
+            event_id,
+            user_id,
+            include_expenses=True,
+            include_company_contacts=True,
+        )
+        user = db.get(User, user_id)
+        template = email_template_service.get_template(db, template_id)
+        smtp_config = integration_service.get_integration_config(db, smtp_config_id)
+        if not event or not user or not template or not smtp_config:
+            logger.warning("Expense report for event %s is no longer valid", event_id)
+            _set_job_status(
+                job_id,
+                "failed",
+                "Event, template or SMTP integration no longer exists",
+            )
+            return
+
+        provider = await integration_service.get_shared_provider(
+            smtp_config, EmailProvider
+        )
+        if not provider:
+            logger.error("Failed to create email provider for event %s", event_id)
+            _set_job_status(job_id, "failed", "Failed to create email provider")
+            return
+
+        # Generate the report
+        generator = await create_report_generator(db, event)
         zip_bytes = await generator.generate(event)
         filename = generator.get_filename(event)
 
-        return Response(
-            content=zip_bytes,
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-            },
+        # Build template context and render
+        context = email_template_service.build_expense_report_context(
+            event=event,
+            company=event.company,
+            expenses=event.expenses,
+            user=user,
+        )
+        subject, body_html, body_text = email_template_service.render_template(
+            template, context
         )
+
+        # Single email with multiple To addresses
+        success = await provider.send_email(
+            to=recipient_emails,
+            subject=subject,
+            body=body_text,
+            body_html=body_html,
+            attachments=[(filename, zip_bytes, "application/zip")],
+        )
+        if not success:
+            logger.error("Failed to send expense report for event %s", event_id)
+            _set_job_status(job_id, "failed", "Failed to send email")
+            return
+        recipients_str = ", ".join(recipient_emails)
+        _set_job_status(job_id, "sent", f"Expense report sent to {recipients_str}")
+    except Exception:
+        logger.exception("Error sending expense report for event %s", event_id)
+        _set_job_status(job_id, "failed", "Error sending expense report")
     finally:
-        if generator.paperless:
-            await generator.paperless.close()
+        db.close()
 
 
 @router.post("/{event_id}/expense-report/send", response_model=SendReportResponse)
 async def send_expense_report(
     event_id: str,
     data: SendReportRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> SendReportResponse:
-    """Generate and send expense report via email.
+    """Queue generating and sending the expense report via email.
+
+    The report is built and delivered in the background once the recipients
+    are resolved, so the request returns without waiting for SMTP. Poll
+    get_send_status() with the returned job_id for the outcome.
 
     Recipient selection:
     1. If recipient_emails is provided, use those
@@ -132,8 +244,7 @@ async def send_expense_report(
         )
 
     # Get active SMTP integration first
-    smtp_configs = integration_service.get_integration_configs(db, IntegrationType.SMTP)
-    active_smtp = next((c for c in smtp_configs if c.is_active), None)
+    active_smtp = integration_service.get_active_config(db, IntegrationType.SMTP)
     if not active_smtp:
         return SendReportResponse(
             success=False,
@@ -141,116 +252,101 @@ async def send_expense_report(
             recipients=[],
         )
 
-    # Create email provider
-    provider = integration_service.create_provider_instance(active_smtp)
-    if not provider or not isinstance(provider, EmailProvider):
-        return SendReportResponse(
-            success=False,
-            message="Failed to create email provider",
-            recipients=[],
-        )
-
-    try:
-        # Get email template
-        if data.template_id:
-            template = email_template_service.get_template(db, data.template_id)
-            if not template:
-                return SendReportResponse(
-                    success=False,
-                    message="Email template not found",
-                    recipients=[],
-                )
-        else:
-            # Use default template for the company
-            company_id = event.company.id
-            template = email_template_service.get_default_template(
-                db, company_id, "expense_report"
+    # Get email template
+    if data.template_id:
+        template = email_template_service.get_template(db, data.template_id)
+        if not template:
+            return SendReportResponse(
+                success=False,
+                message="Email template not found",
+                recipients=[],
             )
-            if not template:
-                return SendReportResponse(
-                    success=False,
-                    message="No default email template found. Configure one first.",
-                    recipients=[],
-                )
-
-        # Determine recipient emails
-        recipient_emails: list[str] = []
-
-        if data.recipient_emails:
-            # Use explicitly provided emails
-            recipient_emails = list(data.recipient_emails)
-        elif data.auto_select_contacts:
-            # Auto-select contacts based on template contact types
-            template_types = email_template_service.get_template_contact_types(template)
-
-            if template_types:
-                # Get contacts matching template types
-                matching_contacts = company_contact_service.get_contacts_by_type(
-                    db, event.company.id, template_types
-                )
-                recipient_emails = [c.email for c in matching_contacts]
-
-            if not recipient_emails:
-                # Fall back to main contact
-                main_contact = company_contact_service.get_main_contact(
-                    db, event.company.id
-                )
-                if main_contact:
-                    recipient_emails = [main_contact.email]
-
-        if not recipient_emails:
+    else:
+        # Use default template for the company
+        company_id = event.company.id
+        template = email_template_service.get_default_template(
+            db, company_id, "expense_report"
+        )
+        if not template:
             return SendReportResponse(
                 success=False,
-                message="No recipients found. Add contacts or provide emails.",
+                message="No default email template found. Configure one first.",
                 recipients=[],
             )
 
-        # Generate the report
-        generator = await create_report_generator(db, event)
-        try:
-            zip_bytes = await generator.generate(event)
-            filename = generator.get_filename(event)
-        finally:
-            if generator.paperless:
-                await generator.paperless.close()
+    # Determine recipient emails
+    recipient_emails: list[str] = []
 
-        # Build template context and render
-        context = email_template_service.build_expense_report_context(
-            event=event,
-            company=event.company,
-            expenses=event.expenses,
-            user=current_user,
-        )
-        subject, body_html, body_text = email_template_service.render_template(
-            template, context
-        )
+    if data.recipient_emails:
+        # Use explicitly provided emails
+        recipient_emails = list(data.recipient_emails)
+    elif data.auto_select_contacts:
+        # Auto-select contacts based on template contact types
+        template_types = email_template_service.get_template_contact_types(template)
 
-        # Send email to all recipients at once (single email with multiple To addresses)
-        success = await provider.send_email(
-            to=recipient_emails,
-            subject=subject,
-            body=body_text,
-            body_html=body_html,
-            attachments=[(filename, zip_bytes, "application/zip")],
-        )
+        if template_types:
+            # Get contacts matching template types
+            matching_contacts = company_contact_service.get_contacts_by_type(
+                db, event.company.id, template_types
+            )
+            recipient_emails = [c.email for c in matching_contacts]
 
-        if success:
-            recipients_str = ", ".join(recipient_emails)
-            return SendReportResponse(
-                success=True,
-                message=f"Expense report sent to {recipients_str}",
-                recipients=recipient_emails,
+        if not recipient_emails:
+            # Fall back to main contact
+            main_contact = company_contact_service.get_main_contact(
+                db, event.company.id
             )
+            if main_contact:
+                recipient_emails = [main_contact.email]
+
+    if not recipient_emails:
         return SendReportResponse(
             success=False,
-            message="Failed to send email",
+            message="No recipients found. Add contacts or provide emails.",
             recipients=[],
         )
-    except Exception as e:
-        return SendReportResponse(
-            success=False,
-            message=f"Error sending report: {e!s}",
-            recipients=[],
+
+    job_id = str(uuid.uuid4())
+    recipients_str = ", ".join(recipient_emails)
+    _send_jobs[job_id] = (
+        current_user.id,
+        SendReportStatus(
+            job_id=job_id,
+            event_id=event.id,
+            status="queued",
+            message=f"Expense report is queued for {recipients_str}",
+            recipients=recipient_emails,
+        ),
+    )
+    background_tasks.add_task(
+        _send_expense_report,
+        job_id,
+        event.id,
+        current_user.id,
+        template.id,
+        recipient_emails,
+        active_smtp.id,
+    )
+
+    return SendReportResponse(
+        success=True,
+        message=f"Expense report is being sent to {recipients_str}",
+        recipients=recipient_emails,
+        job_id=job_id,
+    )
+
+
+@router.get("/{event_id}/expense-report/send/{job_id}", response_model=SendReportStatus)
+async def get_send_status(
+    event_id: str,
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+) -> SendReportStatus:
+    """Get the delivery status of a queued expense report email."""
+    job = _send_jobs.get(job_id)
+    if job is None or job[0] != current_user.id or job[1].event_id != event_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Send job not found",
         )
-    finally:
-        await provider.close()
+    return job[1]
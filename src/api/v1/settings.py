@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Settings API endpoints."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_current_user, get_db
@@ -13,14 +13,22 @@ from src.services import settings_service
 router = APIRouter()
 
 
+def _json_response(settings: dict) -> Response:
+    """Serialize locale settings directly, skipping response_model validation."""
+    return Response(
+        LocaleSettingsResponse(**settings).model_dump_json(),
+        media_type="application/json",
+    )
+
+
 @router.get("/locale", response_model=LocaleSettingsResponse)
 def get_locale_settings(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> LocaleSettingsResponse:
+) -> Response:
     """Get locale settings (date format, time format, timezone)."""
     settings = settings_service.get_locale_settings(db)
-    return LocaleSettingsResponse(**settings)
+    return _json_response(settings)
 
 
 @router.put("/locale", response_model=LocaleSettingsResponse)
@@ -28,7 +36,7 @@ def update_locale_settings(
     data: LocaleSettingsUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> LocaleSettingsResponse:
+) -> Response:
     """Update locale settings. Admin only."""
     if not current_user.is_admin:
         from fastapi import HTTPException, status
@@ -44,4 +52,4 @@ def update_locale_settings(
         time_format=data.time_format,
         timezone=data.timezone,
     )
-    return LocaleSettingsResponse(**settings)
+    return _json_response(settings)
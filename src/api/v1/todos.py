@@ -2,31 +2,55 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Todo API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_current_user, get_db
 from src.models import Todo, User
 from src.schemas.todo import TodoCreate, TodoResponse, TodoUpdate
-from src.services import event_service
+from src.services import event_service, todo_service
 
 router = APIRouter()
 
+# Serializer for the todo list; returning the JSON directly skips FastAPI's
+# response_model validation pass
+_todo_list_adapter = TypeAdapter(list[TodoResponse])
+
+
+def _to_response(todo: Todo) -> TodoResponse:
+    """Copy a loaded todo into its response model without re-validating it."""
+    return TodoResponse.model_construct(
+        **{f: getattr(todo, f) for f in TodoResponse.model_fields}
+    )
+
+
+def _json_response(todo: Todo, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a single todo directly, skipping response_model validation."""
+    return Response(
+        _to_response(todo).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
 @router.get("/{event_id}/todos", response_model=list[TodoResponse])
 def list_todos(
     event_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> list[TodoResponse]:
+) -> Response:
     """List todos for an event."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
+    event = event_service.get_event_for_user(
+        db, event_id, current_user.id, include_todos=True
+    )
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found",
         )
-    return [TodoResponse.model_validate(t) for t in event.todos]
+    items = [_to_response(t) for t in event.todos]
+    return Response(_todo_list_adapter.dump_json(items), media_type="application/json")
 
 
 @router.post(
@@ -39,7 +63,7 @@ def create_todo(
     data: TodoCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> TodoResponse:
+) -> Response:
     """Create a new todo for an event."""
     event = event_service.get_event_for_user(db, event_id, current_user.id)
     if not event:
@@ -59,7 +83,7 @@ def create_todo(
     db.add(todo)
     db.commit()
     db.refresh(todo)
-    return TodoResponse.model_validate(todo)
+    return _json_response(todo, status.HTTP_201_CREATED)
 
 
 @router.get("/{event_id}/todos/{todo_id}", response_model=TodoResponse)
@@ -68,22 +92,15 @@ def get_todo(
     todo_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> TodoResponse:
+) -> Response:
     """Get a specific todo."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found",
-        )
-
-    todo = db.query(Todo).filter(Todo.id == todo_id, Todo.event_id == event_id).first()
+    todo = todo_service.get_todo_for_user(db, event_id, todo_id, current_user.id)
     if not todo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found",
         )
-    return TodoResponse.model_validate(todo)
+    return _json_response(todo)
 
 
 @router.put("/{event_id}/todos/{todo_id}", response_model=TodoResponse)
@@ -93,27 +110,25 @@ def update_todo(
     data: TodoUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> TodoResponse:
+) -> Response:
     """Update a todo."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found",
-        )
-
-    todo = db.query(Todo).filter(Todo.id == todo_id, Todo.event_id == event_id).first()
+    todo = todo_service.update_todo_for_user(
+        db,
+        event_id,
+        todo_id,
+        current_user.id,
+        data.model_dump(exclude_unset=True),
+    )
     if not todo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found",
         )
 
-    for field, value in data.model_dump(exclude_unset=True).items():
-        setattr(todo, field, value)
+    # Build the response before committing; commit expires the instance
+    response = _json_response(todo)
     db.commit()
-    db.refresh(todo)
-    return TodoResponse.model_validate(todo)
+    return response
 
 
 @router.delete("/{event_id}/todos/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -124,14 +139,7 @@ def delete_todo(
     current_user: User = Depends(get_current_user),
 ) -> None:
     """Delete a todo."""
-    event = event_service.get_event_for_user(db, event_id, current_user.id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found",
-        )
-
-    todo = db.query(Todo).filter(Todo.id == todo_id, Todo.event_id == event_id).first()
+    todo = todo_service.get_todo_for_user(db, event_id, todo_id, current_user.id)
     if not todo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2,18 +2,28 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Application configuration using pydantic-settings."""
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+    )
+
     secret_key: str
     database_url: str = "sqlite:///./data/travel_manager.db"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
 
+@lru_cache
+def get_settings() -> Settings:
+    """Get the application settings.
 
-settings = Settings()
+    The environment and ``.env`` file are read once per process.
+    """
+    return Settings()
@@ -4,22 +4,60 @@
 
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
-from src.config import settings
+from src.config import get_settings
+
+# Applied to every new SQLite connection. WAL lets readers proceed while a
+# write is in progress, and writers wait for the lock instead of failing.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=30000",
+)
+
+_settings = get_settings()
 
 # Create engine with appropriate settings for SQLite
+is_sqlite = _settings.database_url.startswith("sqlite")
 connect_args = {}
-if settings.database_url.startswith("sqlite"):
+if is_sqlite:
     connect_args["check_same_thread"] = False
 
+# Sync endpoints run in a thread pool; enough connections that most of those
+# threads get one without waiting. In-memory SQLite uses a per-thread pool
+# that takes no sizing.
+pool_args = {}
+if ":memory:" not in _settings.database_url and _settings.database_url != "sqlite://":
+    pool_args = {"pool_size": 20, "max_overflow": 60}
+
 engine = create_engine(
-    settings.database_url,
+    _settings.database_url,
     connect_args=connect_args,
     echo=False,
+    # Room for the compiled forms of all our statements; the default is 500
+    query_cache_size=1200,
+    **pool_args,
 )
 
+if is_sqlite:
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(
+        dbapi_connection: DBAPIConnection, _connection_record: ConnectionPoolEntry
+    ) -> None:
+        """Configure a new SQLite connection for concurrent access."""
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -5,21 +5,29 @@
 import base64
 import hashlib
 import json
+from functools import lru_cache
 from typing import Any
 
 from cryptography.fernet import Fernet
 
-from src.config import settings
+from src.config import get_settings
 
 
-def get_fernet() -> Fernet:
-    """Get Fernet instance using derived key from SECRET_KEY."""
-    key = base64.urlsafe_b64encode(
-        hashlib.sha256(settings.secret_key.encode()).digest()
-    )
+@lru_cache(maxsize=1)
+def _fernet_for(secret_key: str) -> Fernet:
+    """Build the Fernet instance for a secret key."""
+    key = base64.urlsafe_b64encode(hashlib.sha256(secret_key.encode()).digest())
     return Fernet(key)
 
 
+def get_fernet() -> Fernet:
+    """Get Fernet instance using derived key from SECRET_KEY.
+
+    The derived key is computed once per secret key and reused.
+    """
+    return _fernet_for(get_settings().secret_key)
+
+
 def encrypt_config(config: dict[str, Any]) -> str:
     """Encrypt a configuration dictionary to a string."""
     return get_fernet().encrypt(json.dumps(config).encode()).decode()
@@ -2,14 +2,25 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Base classes for integration providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+# Document downloads running at once in DocumentProvider.download_documents
+_MAX_CONCURRENT_DOWNLOADS = 8
 
 
 class IntegrationProvider(ABC):
     """Base class for all integrations."""
 
+    # Empty, so providers that declare __slots__ get no per-instance dict
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def get_type(cls) -> str:
@@ -24,7 +35,7 @@ class IntegrationProvider(ABC):
 
     @classmethod
     @abstractmethod
-    def get_config_schema(cls) -> dict[str, Any]:
+    def get_config_schema(cls) -> Mapping[str, Any]:
         """JSON Schema for configuration form generation."""
         ...
 
@@ -45,6 +56,8 @@ class IntegrationProvider(ABC):
 class DocumentProvider(IntegrationProvider):
     """Interface for document management systems (Paperless, etc.)."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def list_storage_paths(self) -> list[dict[str, Any]]:
         """List available storage paths."""
@@ -55,6 +68,22 @@ class DocumentProvider(IntegrationProvider):
         """List all tags."""
         ...
 
+    @abstractmethod
+    async def list_custom_fields(self) -> list[dict[str, Any]]:
+        """List all custom fields."""
+        ...
+
+    @abstractmethod
+    async def get_custom_field_by_name(self, name: str) -> dict[str, Any] | None:
+        """Get a custom field by name."""
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def parse_select_choices(field: dict[str, Any]) -> list[dict[str, str]]:
+        """Extract label/value choices from an already fetched custom field."""
+        ...
+
     @abstractmethod
     async def create_tag(self, name: str) -> dict[str, Any]:
         """Create a new tag."""
@@ -76,14 +105,63 @@ class DocumentProvider(IntegrationProvider):
         ...
 
     @abstractmethod
-    async def download_document(self, doc_id: int) -> tuple[bytes, str, str]:
-        """Download document. Returns (content, filename, mime_type)."""
+    async def download_document(
+        self,
+        doc_id: int,
+        sink: Callable[[bytes], Awaitable[None]] | None = None,
+    ) -> tuple[bytes, str, str]:
+        """Download document. Returns (content, filename, mime_type).
+
+        With ``sink``, the body is handed over chunk by chunk and the returned
+        content is empty.
+        """
+        ...
+
+    async def download_documents(
+        self,
+        doc_ids: Sequence[int],
+        sinks: Sequence[Callable[[bytes], Awaitable[None]]] | None = None,
+    ) -> list[tuple[bytes, str, str] | BaseException]:
+        """Download several documents concurrently.
+
+        Args:
+            doc_ids: IDs of the documents to download.
+            sinks: Optional sink per document, see :meth:`download_document`.
+
+        Returns:
+            One result per document ID, in order. A failed download is
+            returned as its exception instead of failing the whole batch.
+        """
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
+
+        async def download(
+            doc_id: int, sink: Callable[[bytes], Awaitable[None]] | None
+        ) -> tuple[bytes, str, str]:
+            async with limit:
+                return await self.download_document(doc_id, sink=sink)
+
+        return await asyncio.gather(
+            *(
+                download(doc_id, sinks[i] if sinks is not None else None)
+                for i, doc_id in enumerate(doc_ids)
+            ),
+            return_exceptions=True,
+        )
+
+    @abstractmethod
+    async def stream_document(self, doc_id: int) -> tuple[httpx.Response, str]:
+        """Open a streaming download. Returns (response, filename).
+
+        The caller must close the response once the body is consumed.
+        """
         ...
 
 
 class PhotoProvider(IntegrationProvider):
     """Interface for photo management systems (Immich, etc.)."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def list_albums(self) -> list[dict[str, Any]]:
         """List available albums."""
@@ -135,6 +213,8 @@ class PhotoProvider(IntegrationProvider):
 class EmailProvider(IntegrationProvider):
     """Interface for email sending (SMTP, etc.)."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def send_email(
         self,
@@ -151,6 +231,8 @@ class EmailProvider(IntegrationProvider):
 class ImageSearchProvider(IntegrationProvider):
     """Interface for image search services (Unsplash, etc.)."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def search_images(
         self,
@@ -2,18 +2,75 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Immich integration for photo management."""
 
+import asyncio
 import logging
 import math
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 import httpx
+from cachetools import TTLCache
 
 from src.integrations.base import PhotoProvider
 from src.integrations.registry import IntegrationRegistry
 
 logger = logging.getLogger(__name__)
 
+# Mean Earth radius used for distance calculations
+_EARTH_RADIUS_KM = 6371
+
+# Seconds an album listing is reused before Immich is asked again
+_LIST_CACHE_TTL = 60
+
+# Appended to the asset URL prefix to address an asset's preview thumbnail
+_THUMBNAIL_SUFFIX = "/thumbnail?size=preview"
+
+# Degrees to radians, multiplied in directly in the per-asset distance loop
+_DEG_TO_RAD = math.pi / 180
+
+# JSON Schema for the configuration form; shared, so it is read-only
+_CONFIG_SCHEMA: Mapping[str, Any] = MappingProxyType(
+    {
+        "type": "object",
+        "required": ["url", "api_key"],
+        "properties": {
+            "url": {
+                "type": "string",
+                "title": "Immich URL",
+                "description": "Base URL of your Immich instance (e.g., https://immich.example.com)",
+                "format": "uri",
+            },
+            "api_key": {
+                "type": "string",
+                "title": "API Key",
+                "description": "API key from Immich (Account Settings > API Keys)",
+                "format": "password",
+            },
+            "search_radius_km": {
+                "type": "number",
+                "title": "Default Search Radius (km)",
+                "description": "Default radius for location-based photo search",
+                "default": 50,
+            },
+        },
+    }
+)
+
+
+def _search_items(result: dict[str, Any]) -> list[dict[str, Any]]:
+    """Extract the asset list from a metadata search response.
+
+    Depending on the Immich version, assets are either nested under
+    ``assets`` or returned at the top level.
+    """
+    match result:
+        case {"assets": {"items": items}} | {"items": items}:
+            return items
+        case _:
+            return []
+
 
 @IntegrationRegistry.register
 class ImmichProvider(PhotoProvider):
@@ -30,32 +87,9 @@ class ImmichProvider(PhotoProvider):
         return "Immich"
 
     @classmethod
-    def get_config_schema(cls) -> dict[str, Any]:
+    def get_config_schema(cls) -> Mapping[str, Any]:
         """Return JSON Schema for the configuration form."""
-        return {
-            "type": "object",
-            "required": ["url", "api_key"],
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "title": "Immich URL",
-                    "description": "Base URL of your Immich instance (e.g., https://immich.example.com)",
-                    "format": "uri",
-                },
-                "api_key": {
-                    "type": "string",
-                    "title": "API Key",
-                    "description": "API key from Immich (Account Settings > API Keys)",
-                    "format": "password",
-                },
-                "search_radius_km": {
-                    "type": "number",
-                    "title": "Default Search Radius (km)",
-                    "description": "Default radius for location-based photo search",
-                    "default": 50,
-                },
-            },
-        }
+        return _CONFIG_SCHEMA
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the Immich provider with configuration.
@@ -66,6 +100,8 @@ class ImmichProvider(PhotoProvider):
         self.url = config["url"].rstrip("/")
         self.api_key = config["api_key"]
         self.search_radius_km = config.get("search_radius_km", 50)
+        # Owned by this instance; the registry keeps one live provider per
+        # integration config, so connections are still reused across requests
         self._client = httpx.AsyncClient(
             base_url=self.url,
             headers={
@@ -73,6 +109,12 @@ class ImmichProvider(PhotoProvider):
                 "Accept": "application/json",
             },
             timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+        self._asset_url_prefix = f"{self.url}/api/assets/"
+        self._albums: TTLCache[str, list[dict[str, Any]]] = TTLCache(
+            maxsize=1, ttl=_LIST_CACHE_TTL
         )
 
     async def close(self) -> None:
@@ -82,13 +124,19 @@ class ImmichProvider(PhotoProvider):
     async def health_check(self) -> tuple[bool, str]:
         """Check connectivity to Immich instance."""
         try:
-            # Ping endpoint
-            resp = await self._client.get("/api/server/ping")
+            # Ping and version lookup are independent, so issue them together
+            resp, version_resp = await asyncio.gather(
+                self._client.get("/api/server/ping"),
+                self._client.get("/api/server/version"),
+                return_exceptions=True,
+            )
+            if isinstance(resp, BaseException):
+                raise resp
             if resp.status_code != 200:
                 return False, f"HTTP {resp.status_code}"
 
-            # Get version
-            version_resp = await self._client.get("/api/server/version")
+            if isinstance(version_resp, BaseException):
+                raise version_resp
             if version_resp.status_code == 200:
                 version_data = version_resp.json()
                 version = (
@@ -105,10 +153,19 @@ class ImmichProvider(PhotoProvider):
             return False, str(e)
 
     async def list_albums(self) -> list[dict[str, Any]]:
-        """List all albums."""
+        """List all albums.
+
+        The listing is reused for a short time and dropped whenever this
+        provider changes an album.
+        """
+        if (cached := self._albums.get("albums")) is not None:
+            return list(cached)
+
         resp = await self._client.get("/api/albums")
         resp.raise_for_status()
-        return resp.json()
+        albums = resp.json()
+        self._albums["albums"] = albums
+        return list(albums)
 
     async def create_album(self, name: str) -> dict[str, Any]:
         """Create a new album."""
@@ -117,6 +174,7 @@ class ImmichProvider(PhotoProvider):
             json={"albumName": name},
         )
         resp.raise_for_status()
+        self._albums.clear()
         return resp.json()
 
     async def get_assets(
@@ -188,30 +246,53 @@ class ImmichProvider(PhotoProvider):
         resp.raise_for_status()
         result = resp.json()
 
-        # Handle different API response structures
-        items = []
-        if "assets" in result and "items" in result["assets"]:
-            items = result["assets"]["items"]
-        elif "items" in result:
-            items = result["items"]
+        items = _search_items(result)
 
         logger.info(f"Immich returned {len(items)} total assets")
 
-        # Filter by proximity
+        # Filter by proximity using the Haversine formula. Terms depending only
+        # on the search point are computed once, and assets are compared on the
+        # haversine value so asin/sqrt only run for matches.
+        sin, cos = math.sin, math.cos
+        lat0 = latitude * _DEG_TO_RAD
+        lon0 = longitude * _DEG_TO_RAD
+        cos_lat0 = cos(lat0)
+        max_hav = sin(min(radius_km / (2 * _EARTH_RADIUS_KM), math.pi / 2)) ** 2
+
+        # Bounding box around the search circle, checked before any trig. The
+        # longitude span widens with latitude and is unbounded near the poles.
+        angle = min(radius_km / _EARTH_RADIUS_KM, math.pi / 2)
+        max_dlat = math.degrees(angle)
+        max_dlon = 180.0
+        if sin(angle) < cos_lat0:
+            max_dlon = math.degrees(math.asin(sin(angle) / cos_lat0))
+
+        prefix = self._asset_url_prefix
         filtered_assets = []
         geotagged_count = 0
         for asset in items:
-            exif = asset.get("exifInfo", {})
-            lat = exif.get("latitude")
-            lon = exif.get("longitude")
-
-            if lat is not None and lon is not None:
+            if (
+                (exif := asset.get("exifInfo"))
+                and (lat := exif.get("latitude")) is not None
+                and (lon := exif.get("longitude")) is not None
+            ):
                 geotagged_count += 1
-                distance = self._haversine_distance(latitude, longitude, lat, lon)
-                if distance <= radius_km:
+                if abs(lat - latitude) > max_dlat:
+                    continue
+                dlon = abs(lon - longitude) % 360
+                if min(dlon, 360 - dlon) > max_dlon:
+                    continue
+
+                lat_rad = lat * _DEG_TO_RAD
+                hav = (
+                    sin((lat_rad - lat0) / 2) ** 2
+                    + cos_lat0 * cos(lat_rad) * sin((lon * _DEG_TO_RAD - lon0) / 2) ** 2
+                )
+                if hav <= max_hav:
+                    distance = 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(hav))
                     # Add computed fields
                     asset["_distance_km"] = round(distance, 2)
-                    asset["_thumbnail_url"] = self.get_thumbnail_url(asset["id"])
+                    asset["_thumbnail_url"] = prefix + asset["id"] + _THUMBNAIL_SUFFIX
                     filtered_assets.append(asset)
 
         logger.info(
@@ -245,18 +326,14 @@ class ImmichProvider(PhotoProvider):
         resp.raise_for_status()
         result = resp.json()
 
-        # Handle different API response structures
-        items = []
-        if "assets" in result and "items" in result["assets"]:
-            items = result["assets"]["items"]
-        elif "items" in result:
-            items = result["items"]
+        items = _search_items(result)
 
         logger.info(f"Immich date-only search returned {len(items)} assets")
 
         # Add thumbnail URLs
+        prefix = self._asset_url_prefix
         for asset in items:
-            asset["_thumbnail_url"] = self.get_thumbnail_url(asset["id"])
+            asset["_thumbnail_url"] = prefix + asset["id"] + _THUMBNAIL_SUFFIX
 
         return items
 
@@ -273,9 +350,27 @@ class ImmichProvider(PhotoProvider):
         content_type = resp.headers.get("content-type", "image/jpeg")
         return resp.content, content_type
 
+    async def stream_asset_thumbnail(
+        self, asset_id: str, size: str = "preview"
+    ) -> httpx.Response:
+        """Open a streaming response for an asset thumbnail.
+
+        The caller must close the returned response once the body is consumed.
+        """
+        request = self._client.build_request(
+            "GET",
+            f"/api/assets/{asset_id}/thumbnail",
+            params={"size": size},
+        )
+        resp = await self._client.send(request, stream=True)
+        if resp.is_error:
+            await resp.aclose()
+            resp.raise_for_status()
+        return resp
+
     def get_thumbnail_url(self, asset_id: str) -> str:
         """Generate thumbnail URL for an asset."""
-        return f"{self.url}/api/assets/{asset_id}/thumbnail?size=preview"
+        return self._asset_url_prefix + asset_id + _THUMBNAIL_SUFFIX
 
     async def get_asset_info(self, asset_id: str) -> dict[str, Any]:
         """Get detailed information about a specific asset."""
@@ -290,6 +385,7 @@ class ImmichProvider(PhotoProvider):
             json={"ids": asset_ids},
         )
         resp.raise_for_status()
+        self._albums.clear()
 
     async def remove_assets_from_album(
         self, album_id: str, asset_ids: list[str]
@@ -300,23 +396,4 @@ class ImmichProvider(PhotoProvider):
             json={"ids": asset_ids},
         )
         resp.raise_for_status()
-
-    @staticmethod
-    def _haversine_distance(
-        lat1: float, lon1: float, lat2: float, lon2: float
-    ) -> float:
-        """Calculate distance between two GPS points using Haversine formula."""
-        earth_radius_km = 6371
-
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
-
-        a = (
-            math.sin(delta_lat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
-
-        return earth_radius_km * c
+        self._albums.clear()
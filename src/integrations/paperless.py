@@ -2,18 +2,113 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Paperless-ngx integration provider."""
 
-from typing import Any
+import asyncio
+import json
+import math
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from email.message import Message
+from types import MappingProxyType
+from typing import Any, cast
 
 import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 
 from src.integrations.base import DocumentProvider
 from src.integrations.registry import IntegrationRegistry
 
+# Results requested per page; Paperless defaults to 25
+_PAGE_SIZE = 100
+
+# Chunk size used when streaming document downloads
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on page requests issued at once when walking a listing
+_MAX_CONCURRENT_PAGES = 8
+
+# Seconds tag, storage path and custom field lookups are reused before
+# Paperless is asked again
+_METADATA_CACHE_TTL = 60
+
+# Metadata responses kept for revalidation with If-None-Match
+_MAX_ETAG_ENTRIES = 64
+
+# Marks a cache miss, since None is a valid cached lookup result
+_MISSING = object()
+
+# Newest first like the Paperless UI; the ID breaks ties so concurrently
+# fetched pages never overlap or skip documents created at the same time
+_DOCUMENT_ORDERING = "-created,id"
+
+# Fields kept from Paperless documents, with the value used when missing;
+# defaults are shared by every document, so they must be immutable
+_DOCUMENT_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("id", None),
+    ("title", ""),
+    ("created", None),
+    ("added", None),
+    ("original_file_name", ""),
+)
+_LISTING_FIELDS = (*_DOCUMENT_FIELDS, ("tags", ()), ("storage_path", None))
+_EVENT_FIELDS = (
+    *_DOCUMENT_FIELDS,
+    ("correspondent", None),
+    ("document_type", None),
+    ("archive_serial_number", None),
+)
+
+
+def _project_doc(
+    doc: dict[str, Any], fields: tuple[tuple[str, Any], ...]
+) -> dict[str, Any]:
+    """Keep only the given fields of a Paperless document."""
+    return {key: doc.get(key, default) for key, default in fields}
+
+
+# JSON Schema for the configuration form; shared, so it is read-only
+_CONFIG_SCHEMA: Mapping[str, Any] = MappingProxyType(
+    {
+        "type": "object",
+        "required": ["url", "token"],
+        "properties": {
+            "url": {
+                "type": "string",
+                "title": "Paperless URL",
+                "description": "Base URL of your Paperless-ngx instance",
+                "format": "uri",
+            },
+            "token": {
+                "type": "string",
+                "title": "API Token",
+                "description": "API token from Paperless-ngx",
+                "format": "password",
+            },
+            "custom_field_name": {
+                "type": "string",
+                "title": "Event Field Name",
+                "description": "Custom field for tagging documents with events",
+                "default": "Trip",
+            },
+        },
+    }
+)
+
 
 @IntegrationRegistry.register
 class PaperlessProvider(DocumentProvider):
     """Paperless-ngx document management integration."""
 
+    __slots__ = (
+        "_cache",
+        "_cache_locks",
+        "_client",
+        "_etags",
+        "custom_field_name",
+        "token",
+        "url",
+    )
+
     @classmethod
     def get_type(cls) -> str:
         """Return the unique identifier for this integration type."""
@@ -25,32 +120,9 @@ class PaperlessProvider(DocumentProvider):
         return "Paperless-ngx"
 
     @classmethod
-    def get_config_schema(cls) -> dict[str, Any]:
+    def get_config_schema(cls) -> Mapping[str, Any]:
         """Return JSON Schema for the configuration form."""
-        return {
-            "type": "object",
-            "required": ["url", "token"],
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "title": "Paperless URL",
-                    "description": "Base URL of your Paperless-ngx instance",
-                    "format": "uri",
-                },
-                "token": {
-                    "type": "string",
-                    "title": "API Token",
-                    "description": "API token from Paperless-ngx",
-                    "format": "password",
-                },
-                "custom_field_name": {
-                    "type": "string",
-                    "title": "Event Field Name",
-                    "description": "Custom field for tagging documents with events",
-                    "default": "Trip",
-                },
-            },
-        }
+        return _CONFIG_SCHEMA
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the Paperless-ngx provider with configuration.
@@ -66,6 +138,28 @@ class PaperlessProvider(DocumentProvider):
             headers={"Authorization": f"Token {self.token}"},
             timeout=30.0,
             follow_redirects=True,
+            # Settings go on the transport; a custom transport ignores the
+            # client's own http2/limits arguments
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+                retries=1,
+            ),
+        )
+        # Metadata lookups keyed by (kind, *args); see _cached()
+        self._cache: TTLCache[tuple[Any, ...], Any] = TTLCache(
+            maxsize=128, ttl=_METADATA_CACHE_TTL
+        )
+        self._cache_locks: defaultdict[tuple[Any, ...], asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+        # Request URL -> (ETag, decoded body) of revalidated responses
+        self._etags: LRUCache[str, tuple[str, Any]] = LRUCache(
+            maxsize=_MAX_ETAG_ENTRIES
         )
 
     async def close(self) -> None:
@@ -76,8 +170,11 @@ class PaperlessProvider(DocumentProvider):
         """Check connectivity to Paperless-ngx."""
         try:
             # Use /api/ui_settings/ as it's a lightweight authenticated endpoint
-            # that doesn't redirect and confirms both connectivity and auth
-            resp = await self._client.get("/api/ui_settings/")
+            # that doesn't redirect and confirms both connectivity and auth;
+            # HEAD skips the JSON body unless the server does not allow it
+            resp = await self._client.head("/api/ui_settings/")
+            if resp.status_code == 405:
+                resp = await self._client.get("/api/ui_settings/")
             if resp.status_code == 200:
                 return True, "Connected"
             if resp.status_code == 401:
@@ -92,54 +189,175 @@ class PaperlessProvider(DocumentProvider):
         except Exception as e:
             return False, str(e)
 
-    async def list_storage_paths(self) -> list[dict[str, Any]]:
-        """List available storage paths from Paperless-ngx."""
-        results = []
-        url = "/api/storage_paths/"
-        while url:
-            resp = await self._client.get(url)
+    async def _cached[T](
+        self, key: tuple[Any, ...], load: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return a cached metadata lookup, loading it on a miss.
+
+        Concurrent misses for the same key share a single request.
+
+        Args:
+            key: Cache key; the first element names the kind of metadata.
+            load: Fetches the value from Paperless-ngx.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        # The cache holds values of every kind; the key decides which
+        if (value := self._cache.get(key, _MISSING)) is not _MISSING:
+            return cast(T, value)
+        async with self._cache_locks[key]:
+            if (value := self._cache.get(key, _MISSING)) is _MISSING:
+                value = await load()
+                self._cache[key] = value
+        self._cache_locks.pop(key, None)
+        return cast(T, value)
+
+    def _invalidate(self, kind: str) -> None:
+        """Drop all cached lookups of one kind of metadata."""
+        for key in [key for key in self._cache if key[0] == kind]:
+            self._cache.pop(key, None)
+
+    async def _get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Fetch and decode a JSON resource, revalidating it by ETag.
+
+        When an earlier response came with an ETag, the request is made
+        conditional and a 304 reuses the body decoded back then.
+
+        Args:
+            path: API path of the resource.
+            params: Query parameters of the request.
+
+        Returns:
+            The decoded response body.
+        """
+        key = str(httpx.URL(path, params=params))
+        headers: dict[str, str] = {}
+        if (stored := self._etags.get(key)) is not None:
+            headers["If-None-Match"] = stored[0]
+        resp = await self._client.get(path, params=params, headers=headers)
+        if resp.status_code == 304 and stored is not None:
+            return stored[1]
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        if etag := resp.headers.get("etag"):
+            self._etags[key] = (etag, data)
+        return data
+
+    async def _iter_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        revalidate: bool = False,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the result pages of a paginated Paperless-ngx listing in order.
+
+        The first page tells how many results and pages there are; the
+        remaining pages are then requested concurrently with the same params.
+        Pages not yet consumed when the caller stops iterating are cancelled.
+
+        Args:
+            path: API path of the listing.
+            params: Query parameters sent with every page request.
+            revalidate: Revalidate the first page by ETag; meant for small
+                metadata listings that usually fit on one page.
+
+        Yields:
+            The results of each page.
+        """
+        params = {"page_size": _PAGE_SIZE, **(params or {})}
+        if revalidate:
+            data = await self._get_json(path, params)
+        else:
+            resp = await self._client.get(path, params=params)
             resp.raise_for_status()
-            data = resp.json()
-            results.extend(data.get("results", []))
-            url = data.get("next")
-            if url:
-                # Handle relative URLs
-                url = url.replace(self.url, "")
-        return [
-            {"id": sp["id"], "name": sp["name"], "path": sp.get("path", "")}
-            for sp in results
+            data = orjson.loads(resp.content)
+        results: list[dict[str, Any]] = data.get("results", [])
+        yield results
+        if not data.get("next") or not results:
+            return
+
+        pages = math.ceil(data["count"] / len(results))
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            async with limit:
+                resp = await self._client.get(path, params={**params, "page": page})
+            resp.raise_for_status()
+            page_results: list[dict[str, Any]] = orjson.loads(resp.content).get(
+                "results", []
+            )
+            return page_results
+
+        tasks = [
+            asyncio.ensure_future(fetch_page(page)) for page in range(2, pages + 1)
         ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def list_storage_paths(self) -> list[dict[str, Any]]:
+        """List available storage paths from Paperless-ngx."""
+
+        async def load() -> list[dict[str, Any]]:
+            return [
+                {"id": sp["id"], "name": sp["name"], "path": sp.get("path", "")}
+                async for page in self._iter_pages(
+                    "/api/storage_paths/", revalidate=True
+                )
+                for sp in page
+            ]
+
+        return await self._cached(("storage_paths",), load)
 
     async def list_tags(self) -> list[dict[str, Any]]:
         """List all tags from Paperless-ngx."""
-        results = []
-        url = "/api/tags/"
-        while url:
-            resp = await self._client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
-            results.extend(data.get("results", []))
-            url = data.get("next")
-            if url:
-                url = url.replace(self.url, "")
-        return [{"id": tag["id"], "name": tag["name"]} for tag in results]
+
+        async def load() -> list[dict[str, Any]]:
+            return [
+                {"id": tag["id"], "name": tag["name"]}
+                async for page in self._iter_pages("/api/tags/", revalidate=True)
+                for tag in page
+            ]
+
+        return await self._cached(("tags",), load)
 
     async def create_tag(self, name: str) -> dict[str, Any]:
         """Create a new tag in Paperless-ngx."""
         resp = await self._client.post("/api/tags/", json={"name": name})
         resp.raise_for_status()
-        data = resp.json()
+        self._invalidate("tags")
+        data = orjson.loads(resp.content)
         return {"id": data["id"], "name": data["name"]}
 
     async def get_tag_by_name(self, name: str) -> dict[str, Any] | None:
-        """Get a tag by name from Paperless-ngx."""
-        resp = await self._client.get("/api/tags/", params={"name__iexact": name})
-        resp.raise_for_status()
-        data = resp.json()
-        results = data.get("results", [])
-        if results:
-            return {"id": results[0]["id"], "name": results[0]["name"]}
-        return None
+        """Get a tag by name from Paperless-ngx.
+
+        Served from the cached tag listing; Paperless is only asked directly
+        when the listing has no such tag, e.g. one created elsewhere.
+        """
+
+        async def index() -> dict[str, dict[str, Any]]:
+            return {tag["name"].casefold(): tag for tag in await self.list_tags()}
+
+        tags = await self._cached(("tags", "by_name"), index)
+        if (tag := tags.get(name.casefold())) is not None:
+            return tag
+
+        async def load() -> dict[str, Any] | None:
+            resp = await self._client.get("/api/tags/", params={"name__iexact": name})
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            results = data.get("results", [])
+            if results:
+                return {"id": results[0]["id"], "name": results[0]["name"]}
+            return None
+
+        return await self._cached(("tags", "name", name.casefold()), load)
 
     async def get_documents(
         self,
@@ -148,7 +366,25 @@ class PaperlessProvider(DocumentProvider):
         custom_field_value: str | None = None,
     ) -> list[dict[str, Any]]:
         """Query documents from Paperless-ngx."""
-        params: dict[str, Any] = {}
+        return [
+            doc
+            async for doc in self.iter_documents(
+                tag_id, storage_path_id, custom_field_value
+            )
+        ]
+
+    async def iter_documents(
+        self,
+        tag_id: int | None = None,
+        storage_path_id: int | None = None,
+        custom_field_value: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Query documents from Paperless-ngx one at a time.
+
+        Only one page is held at a time, and pages that are no longer needed
+        are not fetched when the caller stops early.
+        """
+        params: dict[str, Any] = {"ordering": _DOCUMENT_ORDERING}
         if tag_id is not None:
             params["tags__id__in"] = tag_id
         if storage_path_id is not None:
@@ -156,94 +392,124 @@ class PaperlessProvider(DocumentProvider):
         if custom_field_value is not None:
             params["custom_fields__icontains"] = custom_field_value
 
-        results = []
-        url = "/api/documents/"
-        while url:
-            resp = await self._client.get(
-                url, params=params if url == "/api/documents/" else None
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            results.extend(data.get("results", []))
-            url = data.get("next")
-            if url:
-                url = url.replace(self.url, "")
-                params = {}  # params already in URL
+        async for page in self._iter_pages("/api/documents/", params):
+            for doc in page:
+                yield _project_doc(doc, _LISTING_FIELDS)
 
-        return [
-            {
-                "id": doc["id"],
-                "title": doc.get("title", ""),
-                "created": doc.get("created"),
-                "added": doc.get("added"),
-                "original_file_name": doc.get("original_file_name", ""),
-                "tags": doc.get("tags", []),
-                "storage_path": doc.get("storage_path"),
-            }
-            for doc in results
-        ]
+    @staticmethod
+    def _download_filename(resp: httpx.Response, doc_id: int) -> str:
+        """Get the filename Paperless-ngx sent with a document download."""
+        header = Message()
+        header["content-disposition"] = resp.headers.get("content-disposition", "")
+        return header.get_filename() or f"document_{doc_id}.pdf"
 
-    async def download_document(self, doc_id: int) -> tuple[bytes, str, str]:
-        """Download a document from Paperless-ngx."""
-        # First get document metadata for filename
-        meta_resp = await self._client.get(f"/api/documents/{doc_id}/")
-        meta_resp.raise_for_status()
-        meta = meta_resp.json()
-        original_filename = meta.get("original_file_name", f"document_{doc_id}.pdf")
+    async def download_document(
+        self,
+        doc_id: int,
+        sink: Callable[[bytes], Awaitable[None]] | None = None,
+    ) -> tuple[bytes, str, str]:
+        """Download a document from Paperless-ngx.
 
-        # Download the actual document
-        resp = await self._client.get(f"/api/documents/{doc_id}/download/")
-        resp.raise_for_status()
+        Args:
+            doc_id: Paperless document ID.
+            sink: Receives the body chunk by chunk, so large scans are never
+                held in memory. Without it the body is returned.
 
-        content_type = resp.headers.get("content-type", "application/pdf")
-        return resp.content, original_filename, content_type
+        Returns:
+            Tuple of content (empty when a sink is given), original filename
+            and content type.
+        """
+        async with self._client.stream(
+            "GET", f"/api/documents/{doc_id}/download/"
+        ) as resp:
+            resp.raise_for_status()
+            # The filename comes with the download, no metadata request needed
+            original_filename = self._download_filename(resp, doc_id)
+            content_type = resp.headers.get("content-type", "application/pdf")
+            if sink is None:
+                content = await resp.aread()
+            else:
+                content = b""
+                async for chunk in resp.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    await sink(chunk)
+
+        return content, original_filename, content_type
+
+    async def stream_document(self, doc_id: int) -> tuple[httpx.Response, str]:
+        """Open a streaming download of a document from Paperless-ngx.
+
+        The caller must close the returned response once the body is consumed.
+        """
+        request = self._client.build_request(
+            "GET", f"/api/documents/{doc_id}/download/"
+        )
+        resp = await self._client.send(request, stream=True)
+        if resp.is_error:
+            await resp.aclose()
+            resp.raise_for_status()
+        return resp, self._download_filename(resp, doc_id)
 
     async def list_custom_fields(self) -> list[dict[str, Any]]:
         """List all custom fields from Paperless-ngx."""
-        results = []
-        url = "/api/custom_fields/"
-        while url:
-            resp = await self._client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
-            results.extend(data.get("results", []))
-            url = data.get("next")
-            if url:
-                url = url.replace(self.url, "")
-        return [
-            {
-                "id": cf["id"],
-                "name": cf["name"],
-                "data_type": cf.get("data_type", ""),
-                "extra_data": cf.get("extra_data", {}),
-            }
-            for cf in results
-        ]
+
+        async def load() -> list[dict[str, Any]]:
+            return [
+                {
+                    "id": cf["id"],
+                    "name": cf["name"],
+                    "data_type": cf.get("data_type", ""),
+                    "extra_data": cf.get("extra_data", {}),
+                }
+                async for page in self._iter_pages(
+                    "/api/custom_fields/", revalidate=True
+                )
+                for cf in page
+            ]
+
+        return await self._cached(("custom_fields",), load)
 
     async def get_custom_field_by_name(self, name: str) -> dict[str, Any] | None:
-        """Get a custom field by name from Paperless-ngx."""
-        resp = await self._client.get(
-            "/api/custom_fields/", params={"name__iexact": name}
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        results = data.get("results", [])
-        if results:
-            cf = results[0]
-            return {
-                "id": cf["id"],
-                "name": cf["name"],
-                "data_type": cf.get("data_type", ""),
-                "extra_data": cf.get("extra_data", {}),
-            }
-        return None
+        """Get a custom field by name from Paperless-ngx.
+
+        Served from the cached custom field listing like get_tag_by_name().
+        """
+
+        async def index() -> dict[str, dict[str, Any]]:
+            return {cf["name"].casefold(): cf for cf in await self.list_custom_fields()}
+
+        fields = await self._cached(("custom_fields", "by_name"), index)
+        if (field := fields.get(name.casefold())) is not None:
+            return field
+
+        async def load() -> dict[str, Any] | None:
+            resp = await self._client.get(
+                "/api/custom_fields/", params={"name__iexact": name}
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            results = data.get("results", [])
+            if results:
+                cf = results[0]
+                return {
+                    "id": cf["id"],
+                    "name": cf["name"],
+                    "data_type": cf.get("data_type", ""),
+                    "extra_data": cf.get("extra_data", {}),
+                }
+            return None
+
+        return await self._cached(("custom_fields", "name", name.casefold()), load)
 
     async def get_custom_field(self, field_id: int) -> dict[str, Any] | None:
         """Get a custom field by ID from Paperless-ngx."""
+        return await self._cached(
+            ("custom_fields", field_id), lambda: self._fetch_custom_field(field_id)
+        )
+
+    async def _fetch_custom_field(self, field_id: int) -> dict[str, Any] | None:
+        """Fetch a custom field by ID, bypassing the metadata cache."""
         try:
-            resp = await self._client.get(f"/api/custom_fields/{field_id}/")
-            resp.raise_for_status()
-            cf = resp.json()
+            cf = await self._get_json(f"/api/custom_fields/{field_id}/")
             return {
                 "id": cf["id"],
                 "name": cf["name"],
@@ -255,22 +521,23 @@ class PaperlessProvider(DocumentProvider):
                 return None
             raise
 
+    def _strong_etag(self, path: str) -> str | None:
+        """Return the stored ETag of a resource if it can be used with If-Match."""
+        stored = self._etags.get(str(httpx.URL(path)))
+        if stored is None or stored[0].startswith("W/"):
+            return None
+        return stored[0]
+
     async def add_custom_field_choice(self, field_id: int, choice: str) -> bool:
         """Add a new choice to a select-type custom field in Paperless-ngx.
 
+        The update replaces the whole option list. A cached copy of the field
+        is only used when its ETag makes the update conditional; if the field
+        changed meanwhile, it is fetched again and the update retried once.
+
         Returns True if the choice was added, False if it already exists.
         """
-        # First get the current field data
-        field = await self.get_custom_field(field_id)
-        if not field:
-            raise ValueError(f"Custom field {field_id} not found")
-
-        if field["data_type"] != "select":
-            raise ValueError(f"Custom field {field_id} is not a select type")
-
-        # Get current options
-        extra_data = field.get("extra_data") or {}
-        current_options = extra_data.get("select_options") or []
+        path = f"/api/custom_fields/{field_id}/"
 
         # Helper to extract string value from option (handles both str and dict)
         def get_option_value(opt: str | dict) -> str:
@@ -280,20 +547,44 @@ class PaperlessProvider(DocumentProvider):
                 return opt.get("label") or opt.get("value") or ""
             return ""
 
-        # Check if choice already exists (case-insensitive)
-        for opt in current_options:
-            if get_option_value(opt).lower() == choice.lower():
-                return False  # Already exists
-
-        # Add the new choice (as string - Paperless accepts both formats)
-        new_options = [*current_options, choice]
-        new_extra_data = {**extra_data, "select_options": new_options}
+        for attempt in range(2):
+            field = (
+                self._cache.get(("custom_fields", field_id)) if not attempt else None
+            )
+            if field is None or (etag := self._strong_etag(path)) is None:
+                field = await self._fetch_custom_field(field_id)
+                etag = self._strong_etag(path)
+            if not field:
+                raise ValueError(f"Custom field {field_id} not found")
+
+            if field["data_type"] != "select":
+                raise ValueError(f"Custom field {field_id} is not a select type")
+
+            # Get current options
+            extra_data = field.get("extra_data") or {}
+            current_options = extra_data.get("select_options") or []
+
+            # Check if choice already exists (case-insensitive)
+            existing = {get_option_value(opt).casefold() for opt in current_options}
+            if choice.casefold() in existing:
+                return False
+
+            # Add the new choice (as string - Paperless accepts both formats)
+            new_options = [*current_options, choice]
+            new_extra_data = {**extra_data, "select_options": new_options}
+
+            # Update the field
+            resp = await self._client.patch(
+                path,
+                json={"extra_data": new_extra_data},
+                headers={"If-Match": etag} if etag else None,
+            )
+            self._invalidate("custom_fields")
+            if resp.status_code != 412 or attempt:
+                break
+            # Changed since it was read; start over from a fresh copy
+            self._etags.pop(str(httpx.URL(path)), None)
 
-        # Update the field
-        resp = await self._client.patch(
-            f"/api/custom_fields/{field_id}/",
-            json={"extra_data": new_extra_data},
-        )
         resp.raise_for_status()
         return True
 
@@ -313,7 +604,14 @@ class PaperlessProvider(DocumentProvider):
         field = await self.get_custom_field(field_id)
         if not field:
             return []
+        return self.parse_select_choices(field)
 
+    @staticmethod
+    def parse_select_choices(field: dict[str, Any]) -> list[dict[str, str]]:
+        """Extract label/value choices from an already fetched custom field.
+
+        Returns an empty list for fields that are not select-type.
+        """
         if field["data_type"] != "select":
             return []
 
@@ -336,12 +634,20 @@ class PaperlessProvider(DocumentProvider):
                     result.append({"label": label or value, "value": value or label})
         return result
 
+    async def _choice_labels(self, field_id: int) -> frozenset[str]:
+        """Get the casefolded choice labels of a select-type custom field."""
+
+        async def load() -> frozenset[str]:
+            choices = await self.get_custom_field_choices(field_id)
+            return frozenset(c.casefold() for c in choices)
+
+        return await self._cached(("custom_fields", field_id, "labels"), load)
+
     async def check_custom_field_choice_exists(
         self, field_id: int, choice: str
     ) -> bool:
         """Check if a choice exists in a select-type custom field (case-insensitive)."""
-        choices = await self.get_custom_field_choices(field_id)
-        return any(c.lower() == choice.lower() for c in choices)
+        return choice.casefold() in await self._choice_labels(field_id)
 
     async def delete_document(self, doc_id: int) -> bool:
         """Delete a document from Paperless-ngx."""
@@ -378,22 +684,21 @@ class PaperlessProvider(DocumentProvider):
             return []
 
         # Build the query - Paperless uses a specific format for custom field queries
-        params: dict[str, Any] = {"page_size": 100}
+        params: dict[str, Any] = {"ordering": _DOCUMENT_ORDERING}
 
         if storage_path_id is not None:
             params["storage_path__id"] = storage_path_id
-
-        results = []
-        url = "/api/documents/"
-        while url:
-            resp = await self._client.get(
-                url, params=params if url == "/api/documents/" else None
+        if custom_field_id:
+            # Let Paperless 2.x filter by the field; older servers ignore the
+            # parameter and the check below still applies
+            params["custom_field_query"] = json.dumps(
+                [custom_field_id, "exact", custom_field_value]
             )
-            resp.raise_for_status()
-            data = resp.json()
 
-            # Filter by custom field value
-            for doc in data.get("results", []):
+        results = []
+        # Filter by custom field value
+        async for page in self._iter_pages("/api/documents/", params):
+            for doc in page:
                 if custom_field_id:
                     # Check if document has the custom field with matching value
                     custom_fields = doc.get("custom_fields", [])
@@ -408,22 +713,6 @@ class PaperlessProvider(DocumentProvider):
                     if not matches:
                         continue
 
-                results.append(
-                    {
-                        "id": doc["id"],
-                        "title": doc.get("title", ""),
-                        "created": doc.get("created"),
-                        "added": doc.get("added"),
-                        "original_file_name": doc.get("original_file_name", ""),
-                        "correspondent": doc.get("correspondent"),
-                        "document_type": doc.get("document_type"),
-                        "archive_serial_number": doc.get("archive_serial_number"),
-                    }
-                )
-
-            url = data.get("next")
-            if url:
-                url = url.replace(self.url, "")
-                params = {}  # params already in URL
+                results.append(_project_doc(doc, _EVENT_FIELDS))
 
         return results
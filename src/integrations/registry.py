@@ -2,22 +2,49 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Registry for integration providers."""
 
+import asyncio
+import contextlib
+from collections.abc import Callable
 from typing import Any, ClassVar
 
 from src.integrations.base import IntegrationProvider
 
+# How long a replaced provider stays open for requests still using it; well
+# above the 30 second client timeouts so streamed downloads can finish
+RETIRE_DELAY = 300.0
+
 
 class IntegrationRegistry:
     """Central registry for integration providers."""
 
     _providers: ClassVar[dict[str, type[IntegrationProvider]]] = {}
 
+    # Type, display name and config schema per type, built once on registration
+    _type_info: ClassVar[dict[str, dict[str, Any]]] = {}
+
+    # Live provider instances by integration config ID, with the config
+    # version they were built from
+    _instances: ClassVar[dict[str, tuple[str, IntegrationProvider]]] = {}
+
+    # Replaced providers waiting to be closed, by their delayed close task
+    _retiring: ClassVar[dict[asyncio.Task[None], IntegrationProvider]] = {}
+
+    # Loop the live instances belong to, so evict() can be called from
+    # sync handlers running in the thread pool
+    _loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+
     @classmethod
     def register(
         cls, provider_class: type[IntegrationProvider]
     ) -> type[IntegrationProvider]:
         """Register a provider class. Can be used as a decorator."""
-        cls._providers[provider_class.get_type()] = provider_class
+        integration_type = provider_class.get_type()
+        cls._providers[integration_type] = provider_class
+        cls._type_info[integration_type] = {
+            "type": integration_type,
+            "name": provider_class.get_display_name(),
+            "config_schema": provider_class.get_config_schema(),
+        }
         return provider_class
 
     @classmethod
@@ -33,14 +60,7 @@ class IntegrationRegistry:
     @classmethod
     def get_all_type_info(cls) -> list[dict[str, Any]]:
         """Get information about all registered types."""
-        return [
-            {
-                "type": provider_class.get_type(),
-                "name": provider_class.get_display_name(),
-                "config_schema": provider_class.get_config_schema(),
-            }
-            for provider_class in cls._providers.values()
-        ]
+        return list(cls._type_info.values())
 
     @classmethod
     def create_provider(
@@ -49,7 +69,84 @@ class IntegrationRegistry:
         config: dict[str, Any],
     ) -> IntegrationProvider | None:
         """Create a provider instance with the given config."""
-        provider_class = cls.get_provider(integration_type)
-        if provider_class is None:
+        # The registered classes are the factories; one lookup, no indirection
+        if (provider_class := cls._providers.get(integration_type)) is None:
             return None
         return provider_class(config)
+
+    @classmethod
+    async def get_or_create(
+        cls,
+        integration_id: str,
+        integration_type: str,
+        version: str,
+        load_config: Callable[[], dict[str, Any]],
+    ) -> IntegrationProvider | None:
+        """Get the live provider for an integration config, creating it if needed.
+
+        Instances are kept for the life of the process so their HTTP clients
+        can reuse connections. When ``version`` changes a new instance is
+        built and the old one is closed after :data:`RETIRE_DELAY`, so
+        requests still holding it are not cut off.
+
+        Args:
+            integration_id: Integration config ID.
+            integration_type: Registered integration type.
+            version: Value that changes whenever the config changes.
+            load_config: Returns the decrypted config; only called on a miss.
+
+        Returns:
+            The provider, or None if no provider is registered for the type.
+        """
+        cls._loop = asyncio.get_running_loop()
+        cached = cls._instances.get(integration_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # No await from the lookup to the store, so concurrent callers
+        # never build competing instances for the same version
+        provider = cls.create_provider(integration_type, load_config())
+        if provider is not None:
+            cls._instances[integration_id] = (version, provider)
+        else:
+            cls._instances.pop(integration_id, None)
+        if cached is not None:
+            cls._retire(cached[1])
+        return provider
+
+    @classmethod
+    def evict(cls, integration_id: str) -> None:
+        """Retire the live provider of a deleted integration config.
+
+        Safe to call from any thread.
+        """
+        cached = cls._instances.pop(integration_id, None)
+        if cached is None or cls._loop is None:
+            return
+        # A closed loop means shutdown already closed everything
+        with contextlib.suppress(RuntimeError):
+            cls._loop.call_soon_threadsafe(cls._retire, cached[1])
+
+    @classmethod
+    def _retire(cls, provider: IntegrationProvider) -> None:
+        """Close a provider once requests that still hold it are done."""
+        task = asyncio.create_task(cls._close_later(provider))
+        cls._retiring[task] = provider
+        task.add_done_callback(lambda done: cls._retiring.pop(done, None))
+
+    @staticmethod
+    async def _close_later(provider: IntegrationProvider) -> None:
+        await asyncio.sleep(RETIRE_DELAY)
+        await provider.close()
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all live provider instances. Called on application shutdown."""
+        providers = [provider for _, provider in cls._instances.values()]
+        providers.extend(cls._retiring.values())
+        for task in list(cls._retiring):
+            task.cancel()
+        cls._instances.clear()
+        cls._retiring.clear()
+        for provider in providers:
+            await provider.close()
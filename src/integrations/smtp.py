@@ -2,16 +2,94 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """SMTP email integration provider."""
 
+import asyncio
 import smtplib
-from email import encoders
+import threading
+from collections.abc import Mapping
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.policy import compat32
+from types import MappingProxyType
 from typing import Any
 
 from src.integrations.base import EmailProvider
 from src.integrations.registry import IntegrationRegistry
 
+try:
+    # Optional SIMD base64 encoder (the "speedups" extra); same output
+    from pybase64 import encodebytes
+except ImportError:
+    from base64 import encodebytes
+
+# Upper bound on SMTP sessions a provider keeps open at once
+_MAX_CONNECTIONS = 5
+
+# Messages sent over one session before it is replaced by a fresh one
+_MAX_MESSAGES_PER_CONNECTION = 100
+
+# Header handling of the message classes, but with the CRLF line endings
+# SMTP needs, so the serialized message can be sent without another pass
+_SMTP_POLICY = compat32.clone(linesep="\r\n")
+
+# Errors meaning an SMTP session is unusable
+_SESSION_ERRORS = (smtplib.SMTPException, OSError)
+
+# JSON Schema for the configuration form; shared, so it is read-only
+_CONFIG_SCHEMA: Mapping[str, Any] = MappingProxyType(
+    {
+        "type": "object",
+        "required": ["host", "port", "from_email"],
+        "properties": {
+            "host": {
+                "type": "string",
+                "title": "SMTP Host",
+                "description": "SMTP server hostname",
+            },
+            "port": {
+                "type": "integer",
+                "title": "SMTP Port",
+                "description": "SMTP port (587 for TLS, 465 for SSL)",
+                "default": 587,
+            },
+            "username": {
+                "type": "string",
+                "title": "Username",
+                "description": "SMTP authentication username (optional)",
+            },
+            "password": {
+                "type": "string",
+                "title": "Password",
+                "description": "SMTP authentication password (optional)",
+                "format": "password",
+            },
+            "from_email": {
+                "type": "string",
+                "title": "From Email",
+                "description": "Sender email address",
+                "format": "email",
+            },
+            "from_name": {
+                "type": "string",
+                "title": "From Name",
+                "description": "Sender display name (optional)",
+            },
+            "use_tls": {
+                "type": "boolean",
+                "title": "Use TLS",
+                "description": "Use STARTTLS encryption",
+                "default": True,
+            },
+            "use_ssl": {
+                "type": "boolean",
+                "title": "Use SSL",
+                "description": "Use SSL encryption (overrides TLS if enabled)",
+                "default": False,
+            },
+        },
+    }
+)
+
 
 @IntegrationRegistry.register
 class SmtpProvider(EmailProvider):
@@ -28,59 +106,9 @@ class SmtpProvider(EmailProvider):
         return "SMTP Email"
 
     @classmethod
-    def get_config_schema(cls) -> dict[str, Any]:
+    def get_config_schema(cls) -> Mapping[str, Any]:
         """Return JSON Schema for the configuration form."""
-        return {
-            "type": "object",
-            "required": ["host", "port", "from_email"],
-            "properties": {
-                "host": {
-                    "type": "string",
-                    "title": "SMTP Host",
-                    "description": "SMTP server hostname",
-                },
-                "port": {
-                    "type": "integer",
-                    "title": "SMTP Port",
-                    "description": "SMTP port (587 for TLS, 465 for SSL)",
-                    "default": 587,
-                },
-                "username": {
-                    "type": "string",
-                    "title": "Username",
-                    "description": "SMTP authentication username (optional)",
-                },
-                "password": {
-                    "type": "string",
-                    "title": "Password",
-                    "description": "SMTP authentication password (optional)",
-                    "format": "password",
-                },
-                "from_email": {
-                    "type": "string",
-                    "title": "From Email",
-                    "description": "Sender email address",
-                    "format": "email",
-                },
-                "from_name": {
-                    "type": "string",
-                    "title": "From Name",
-                    "description": "Sender display name (optional)",
-                },
-                "use_tls": {
-                    "type": "boolean",
-                    "title": "Use TLS",
-                    "description": "Use STARTTLS encryption",
-                    "default": True,
-                },
-                "use_ssl": {
-                    "type": "boolean",
-                    "title": "Use SSL",
-                    "description": "Use SSL encryption (overrides TLS if enabled)",
-                    "default": False,
-                },
-            },
-        }
+        return _CONFIG_SCHEMA
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the SMTP provider with configuration.
@@ -96,20 +124,92 @@ class SmtpProvider(EmailProvider):
         self.from_name = config.get("from_name", "")
         self.use_tls = config.get("use_tls", True)
         self.use_ssl = config.get("use_ssl", False)
+        # Authenticated sessions not in use, with the messages sent over each;
+        # providers are shared, so later mails skip the handshake and login
+        self._idle: list[tuple[smtplib.SMTP, int]] = []
+        self._idle_lock = threading.Lock()
+        self._connections = threading.BoundedSemaphore(_MAX_CONNECTIONS)
 
-    async def health_check(self) -> tuple[bool, str]:
-        """Check connectivity to SMTP server."""
+    async def close(self) -> None:
+        """Close the idle SMTP sessions."""
+        await asyncio.to_thread(self._close_idle)
+
+    def _close_idle(self) -> None:
+        """Quit all idle SMTP sessions. Blocking."""
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._discard(server)
+
+    @staticmethod
+    def _discard(server: smtplib.SMTP) -> None:
+        """Quit an SMTP session, dropping the connection if that fails."""
         try:
-            if self.use_ssl:
-                server = smtplib.SMTP_SSL(self.host, self.port, timeout=10)
+            server.quit()
+        except _SESSION_ERRORS:
+            server.close()
+
+    def _connect(self, timeout: float) -> smtplib.SMTP:
+        """Open an SMTP session, securing and authenticating it as configured.
+
+        smtplib is blocking, so this must run in a worker thread.
+        """
+        if self.use_ssl:
+            server: smtplib.SMTP = smtplib.SMTP_SSL(
+                self.host, self.port, timeout=timeout
+            )
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=timeout)
+            if self.use_tls:
+                server.starttls()
+
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        return server
+
+    def _check_connection(self) -> None:
+        """Connect to the SMTP server and disconnect again. Blocking."""
+        self._connect(timeout=10).quit()
+
+    def _lease(self) -> tuple[smtplib.SMTP, int]:
+        """Take an idle session that is still alive, or open a new one.
+
+        Returns:
+            The session and the number of messages already sent over it.
+        """
+        while True:
+            with self._idle_lock:
+                if not self._idle:
+                    break
+                server, sent = self._idle.pop()
+            try:
+                if server.noop()[0] == 250:
+                    return server, sent
+            except _SESSION_ERRORS:
+                pass
+            self._discard(server)
+        return self._connect(timeout=30), 0
+
+    def _deliver(self, to: list[str], msg: MIMEMultipart) -> None:
+        """Send a prepared message over a pooled SMTP session. Blocking."""
+        with self._connections:
+            server, sent = self._lease()
+            try:
+                server.sendmail(self.from_email, to, msg.as_bytes(policy=_SMTP_POLICY))
+            except BaseException:
+                self._discard(server)
+                raise
+            if sent + 1 >= _MAX_MESSAGES_PER_CONNECTION:
+                self._discard(server)
             else:
-                server = smtplib.SMTP(self.host, self.port, timeout=10)
-                if self.use_tls:
-                    server.starttls()
+                with self._idle_lock:
+                    self._idle.append((server, sent + 1))
 
-            if self.username and self.password:
-                server.login(self.username, self.password)
-            server.quit()
+    async def health_check(self) -> tuple[bool, str]:
+        """Check connectivity to SMTP server."""
+        try:
+            # Connecting, TLS and login would otherwise stall the event loop
+            await asyncio.to_thread(self._check_connection)
             return True, "Connected"
         except smtplib.SMTPAuthenticationError:
             return False, "Authentication failed"
@@ -168,26 +268,16 @@ class SmtpProvider(EmailProvider):
             if attachments:
                 for filename, content, mime_type in attachments:
                     part = MIMEBase(*mime_type.split("/", 1))
-                    part.set_payload(content)
-                    encoders.encode_base64(part)
+                    part.set_payload(encodebytes(content).decode("ascii"))
+                    part["Content-Transfer-Encoding"] = "base64"
                     part.add_header(
                         "Content-Disposition",
                         f"attachment; filename={filename}",
                     )
                     msg.attach(part)
 
-            # Send email
-            if self.use_ssl:
-                server = smtplib.SMTP_SSL(self.host, self.port, timeout=30)
-            else:
-                server = smtplib.SMTP(self.host, self.port, timeout=30)
-                if self.use_tls:
-                    server.starttls()
-
-            if self.username and self.password:
-                server.login(self.username, self.password)
-            server.sendmail(self.from_email, to, msg.as_string())
-            server.quit()
+            # Send email; smtplib blocks, so it runs off the event loop
+            await asyncio.to_thread(self._deliver, to, msg)
 
             return True
         except Exception:
@@ -2,13 +2,73 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Unsplash integration for image search."""
 
+from collections.abc import Mapping
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from src.integrations.base import ImageSearchProvider
 from src.integrations.registry import IntegrationRegistry
 
+# Seconds a photo's download location is remembered after a search or lookup
+_DOWNLOAD_LOCATION_TTL = 3600
+
+# Image sizes and user fields passed on from Unsplash photo objects
+_URL_KEYS = ("raw", "full", "regular", "small", "thumb")
+_get_urls = itemgetter(*_URL_KEYS)
+_get_user = itemgetter("name", "username")
+
+
+def _project_photo(photo: dict[str, Any]) -> dict[str, Any]:
+    """Reduce an Unsplash photo object to the fields the app uses."""
+    user = photo["user"]
+    links = photo["links"]
+    name, username = _get_user(user)
+    return {
+        "id": photo["id"],
+        "description": photo.get("description") or photo.get("alt_description"),
+        "width": photo["width"],
+        "height": photo["height"],
+        "color": photo.get("color"),
+        "urls": dict(zip(_URL_KEYS, _get_urls(photo["urls"]), strict=True)),
+        "user": {
+            "name": name,
+            "username": username,
+            "portfolio_url": user.get("portfolio_url"),
+        },
+        "links": {
+            "html": links["html"],
+            "download_location": links["download_location"],
+        },
+    }
+
+
+# JSON Schema for the configuration form; shared, so it is read-only
+_CONFIG_SCHEMA: Mapping[str, Any] = MappingProxyType(
+    {
+        "type": "object",
+        "required": ["access_key"],
+        "properties": {
+            "access_key": {
+                "type": "string",
+                "title": "Access Key",
+                "description": "Unsplash API Access Key (unsplash.com/developers)",
+                "format": "password",
+            },
+            "secret_key": {
+                "type": "string",
+                "title": "Secret Key",
+                "description": "Unsplash API Secret Key (optional, OAuth)",
+                "format": "password",
+            },
+        },
+    }
+)
+
 
 @IntegrationRegistry.register
 class UnsplashProvider(ImageSearchProvider):
@@ -27,26 +87,9 @@ class UnsplashProvider(ImageSearchProvider):
         return "Unsplash"
 
     @classmethod
-    def get_config_schema(cls) -> dict[str, Any]:
+    def get_config_schema(cls) -> Mapping[str, Any]:
         """Return JSON Schema for the configuration form."""
-        return {
-            "type": "object",
-            "required": ["access_key"],
-            "properties": {
-                "access_key": {
-                    "type": "string",
-                    "title": "Access Key",
-                    "description": "Unsplash API Access Key (unsplash.com/developers)",
-                    "format": "password",
-                },
-                "secret_key": {
-                    "type": "string",
-                    "title": "Secret Key",
-                    "description": "Unsplash API Secret Key (optional, OAuth)",
-                    "format": "password",
-                },
-            },
-        }
+        return _CONFIG_SCHEMA
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the Unsplash provider with configuration.
@@ -62,6 +105,22 @@ class UnsplashProvider(ImageSearchProvider):
                 "Accept-Version": "v1",
             },
             timeout=30.0,
+            # Settings go on the transport; a custom transport ignores the
+            # client's own http2/limits arguments
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=40,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+
+        # Image ID -> (download location, full-size URL) of photos seen in
+        # searches or lookups, so trigger_download can skip fetching them
+        self._downloads: TTLCache[str, tuple[str, str]] = TTLCache(
+            maxsize=1024, ttl=_DOWNLOAD_LOCATION_TTL
         )
 
     async def close(self) -> None:
@@ -83,6 +142,13 @@ class UnsplashProvider(ImageSearchProvider):
         except Exception as e:
             return False, str(e)
 
+    def _remember_download(self, photo: dict[str, Any]) -> None:
+        """Keep where to trigger the download of a photo from the API."""
+        self._downloads[photo["id"]] = (
+            photo["links"]["download_location"],
+            photo["urls"]["full"],
+        )
+
     async def search_images(
         self,
         query: str,
@@ -99,70 +165,24 @@ class UnsplashProvider(ImageSearchProvider):
             },
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
+        for photo in data.get("results", []):
+            self._remember_download(photo)
 
         # Transform to a simpler format
         return {
             "total": data.get("total", 0),
             "total_pages": data.get("total_pages", 0),
-            "results": [
-                {
-                    "id": photo["id"],
-                    "description": photo.get("description")
-                    or photo.get("alt_description"),
-                    "width": photo["width"],
-                    "height": photo["height"],
-                    "color": photo.get("color"),
-                    "urls": {
-                        "raw": photo["urls"]["raw"],
-                        "full": photo["urls"]["full"],
-                        "regular": photo["urls"]["regular"],
-                        "small": photo["urls"]["small"],
-                        "thumb": photo["urls"]["thumb"],
-                    },
-                    "user": {
-                        "name": photo["user"]["name"],
-                        "username": photo["user"]["username"],
-                        "portfolio_url": photo["user"].get("portfolio_url"),
-                    },
-                    "links": {
-                        "html": photo["links"]["html"],
-                        "download_location": photo["links"]["download_location"],
-                    },
-                }
-                for photo in data.get("results", [])
-            ],
+            "results": [_project_photo(photo) for photo in data.get("results", [])],
         }
 
     async def get_image(self, image_id: str) -> dict[str, Any]:
         """Get image details by ID."""
         resp = await self._client.get(f"/photos/{image_id}")
         resp.raise_for_status()
-        photo = resp.json()
-
-        return {
-            "id": photo["id"],
-            "description": photo.get("description") or photo.get("alt_description"),
-            "width": photo["width"],
-            "height": photo["height"],
-            "color": photo.get("color"),
-            "urls": {
-                "raw": photo["urls"]["raw"],
-                "full": photo["urls"]["full"],
-                "regular": photo["urls"]["regular"],
-                "small": photo["urls"]["small"],
-                "thumb": photo["urls"]["thumb"],
-            },
-            "user": {
-                "name": photo["user"]["name"],
-                "username": photo["user"]["username"],
-                "portfolio_url": photo["user"].get("portfolio_url"),
-            },
-            "links": {
-                "html": photo["links"]["html"],
-                "download_location": photo["links"]["download_location"],
-            },
-        }
+        photo = orjson.loads(resp.content)
+        self._remember_download(photo)
+        return _project_photo(photo)
 
     async def trigger_download(self, image_id: str) -> str:
         """Trigger download tracking (required by Unsplash API guidelines).
@@ -170,13 +190,15 @@ class UnsplashProvider(ImageSearchProvider):
         This must be called when an image is actually downloaded/used.
         Returns the download URL.
         """
-        # First get the download location
-        photo = await self.get_image(image_id)
-        download_location = photo["links"]["download_location"]
+        # First get the download location, unless the photo was just seen
+        if (cached := self._downloads.get(image_id)) is None:
+            photo = await self.get_image(image_id)
+            cached = photo["links"]["download_location"], photo["urls"]["full"]
+        download_location, full_url = cached
 
         # Trigger the download endpoint
         resp = await self._client.get(download_location)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
-        return data.get("url", photo["urls"]["full"])
+        return data.get("url", full_url)
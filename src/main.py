@@ -3,8 +3,11 @@
 """FastAPI application entry point."""
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
@@ -13,10 +16,28 @@ from fastapi.staticfiles import StaticFiles
 # Ensure avatar directory exists
 os.makedirs("static/avatars", exist_ok=True)
 
+# Worker threads for sync endpoints, which hold a database session while they
+# wait on SQLite or PostgreSQL; AnyIO's default of 40 queues requests early
+_THREADPOOL_TOKENS = 100
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Size the worker thread pool and release shared providers and HTTP clients."""
+    from src.api.v1 import locations
+    from src.integrations.registry import IntegrationRegistry
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _THREADPOOL_TOKENS
+    yield
+    await locations.close_http_client()
+    await IntegrationRegistry.close_all()
+
+
 app = FastAPI(
     title="Travel Manager",
     description="Self-hosted business trip management with expense tracking",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend development
@@ -3,9 +3,13 @@
 """Base model classes and mixins."""
 
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 
 class Base(DeclarativeBase):
@@ -14,17 +18,48 @@ class Base(DeclarativeBase):
     pass
 
 
+class UtcNow(FunctionElement[datetime]):
+    """Current UTC time as a naive timestamp, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _compile_utcnow(element: UtcNow, compiler: SQLCompiler, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcNow, "sqlite")
+def _compile_utcnow_sqlite(element: UtcNow, compiler: SQLCompiler, **kw: Any) -> str:
+    # 'now' is already UTC; CURRENT_TIMESTAMP would drop the fractional
+    # seconds, so keep milliseconds with %f
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+@compiles(UtcNow, "postgresql")
+def _compile_utcnow_postgresql(
+    element: UtcNow, compiler: SQLCompiler, **kw: Any
+) -> str:
+    # now() follows the session time zone; pin it to UTC like the Python side
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 class TimestampMixin:
-    """Mixin adding created_at and updated_at timestamps."""
+    """Mixin adding created_at and updated_at timestamps.
+
+    Both are filled in by the database, so no timestamp is computed in
+    Python or sent as a parameter.
+    """
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=UtcNow(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UtcNow(),
+        onupdate=UtcNow(),
         nullable=False,
     )
@@ -5,7 +5,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, Enum, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -19,6 +19,14 @@ class IntegrationConfig(Base, TimestampMixin):
     """Integration configuration model with encrypted credentials."""
 
     __tablename__ = "integration_configs"
+    __table_args__ = (
+        Index(
+            "ix_integration_configs_active_type",
+            "integration_type",
+            sqlite_where=text("is_active"),
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -19,6 +19,14 @@ class PhotoReference(Base, TimestampMixin):
     """Photo reference model linking Immich assets to events."""
 
     __tablename__ = "photo_references"
+    __table_args__ = (
+        Index(
+            "uq_photo_references_event_id_immich_asset_id",
+            "event_id",
+            "immich_asset_id",
+            unique=True,
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
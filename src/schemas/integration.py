@@ -90,6 +90,14 @@ class CustomFieldResponse(BaseModel):
     extra_data: dict[str, Any] | None = None
 
 
+class PaperlessBundleResponse(BaseModel):
+    """Schema for the tags, custom fields and storage paths of a Paperless."""
+
+    tags: list[TagResponse]
+    custom_fields: list[CustomFieldResponse]
+    storage_paths: list[StoragePathResponse]
+
+
 class CustomFieldChoicesResponse(BaseModel):
     """Schema for custom field choices."""
 
@@ -9,6 +9,9 @@ from src.services import (
     event_service,
     expense_service,
     integration_service,
+    note_service,
+    thumbnail_cache,
+    todo_service,
 )
 
 __all__ = [
@@ -18,4 +21,7 @@ __all__ = [
     "event_service",
     "expense_service",
     "integration_service",
+    "note_service",
+    "thumbnail_cache",
+    "todo_service",
 ]
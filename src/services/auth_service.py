@@ -127,7 +127,7 @@ def delete_session(db: Session, token: str) -> bool:
 
 def get_user_by_id(db: Session, user_id: str) -> User | None:
     """Get a user by ID."""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.get(User, user_id)
 
 
 def get_user_by_username(db: Session, username: str) -> User | None:
@@ -12,7 +12,7 @@ import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 
-from src.config import settings
+from src.config import get_settings
 from src.encryption import decrypt_config, encrypt_config
 from src.services.backup_encryption import (
     encrypt_backup_archive,
@@ -31,8 +31,9 @@ DB_PATH = DATA_DIR / "travel_manager.db"
 PRE_RESTORE_BACKUP_DIR = Path("./backups/pre_restore")
 
 # If using custom database URL, extract the path
-if settings.database_url.startswith("sqlite:///"):
-    db_path_str = settings.database_url.replace("sqlite:///", "")
+_database_url = get_settings().database_url
+if _database_url.startswith("sqlite:///"):
+    db_path_str = _database_url.replace("sqlite:///", "")
     if db_path_str.startswith("./"):
         db_path_str = db_path_str[2:]
     DB_PATH = Path(db_path_str)
@@ -623,10 +624,17 @@ def perform_restore(
                 manifest_data = json.load(f)
                 backup_secret_key = manifest_data.get("secret_key")
 
-        # Replace database
+        # Replace database through the backup API; a plain file copy would
+        # clash with the live database's write-ahead log
         src_db = backup_dir / "travel_manager.db"
         DATA_DIR.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_db, DB_PATH)
+        src_conn = sqlite3.connect(str(src_db))
+        dest_conn = sqlite3.connect(str(DB_PATH))
+        try:
+            src_conn.backup(dest_conn)
+        finally:
+            dest_conn.close()
+            src_conn.close()
 
         # Replace avatars
         src_avatars = backup_dir / "avatars"
@@ -27,7 +27,7 @@ def get_contacts(db: Session, company_id: str) -> list[CompanyContact]:
 
 def get_contact(db: Session, contact_id: str) -> CompanyContact | None:
     """Get a single contact by ID."""
-    return db.query(CompanyContact).filter(CompanyContact.id == contact_id).first()
+    return db.get(CompanyContact, contact_id)
 
 
 def get_contact_by_company(
@@ -17,7 +17,7 @@ def get_companies(db: Session) -> list[Company]:
 
 def get_company(db: Session, company_id: str) -> Company | None:
     """Get a company by ID."""
-    return db.query(Company).filter(Company.id == company_id).first()
+    return db.get(Company, company_id)
 
 
 def get_company_by_name(db: Session, name: str) -> Company | None:
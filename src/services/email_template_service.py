@@ -179,7 +179,7 @@ def get_templates_for_company(
 
 def get_template(db: Session, template_id: str) -> EmailTemplate | None:
     """Get a template by ID."""
-    return db.query(EmailTemplate).filter(EmailTemplate.id == template_id).first()
+    return db.get(EmailTemplate, template_id)
 
 
 def get_default_template(
@@ -2,10 +2,10 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Event service."""
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from src.integrations.base import DocumentProvider
-from src.models import Event
+from src.models import Company, Event
 from src.models.enums import EventStatus
 from src.schemas.event import EventCreate, EventUpdate
 from src.services import integration_service
@@ -33,19 +33,44 @@ def get_events(
 
 def get_event(db: Session, event_id: str) -> Event | None:
     """Get an event by ID."""
-    return db.query(Event).filter(Event.id == event_id).first()
+    return db.get(Event, event_id)
 
 
 def get_event_for_user(
-    db: Session, event_id: str, user_id: str, include_company: bool = False
+    db: Session,
+    event_id: str,
+    user_id: str,
+    include_company: bool = False,
+    include_notes: bool = False,
+    include_todos: bool = False,
+    include_expenses: bool = False,
+    include_company_contacts: bool = False,
 ) -> Event | None:
     """Get an event by ID that belongs to a specific user."""
     query = db.query(Event)
-    if include_company:
+    if include_company_contacts:
+        query = query.options(joinedload(Event.company).selectinload(Company.contacts))
+    elif include_company:
         query = query.options(joinedload(Event.company))
+    if include_expenses:
+        query = query.options(selectinload(Event.expenses))
+    if include_notes:
+        query = query.options(joinedload(Event.notes))
+    if include_todos:
+        query = query.options(joinedload(Event.todos))
     return query.filter(Event.id == event_id, Event.user_id == user_id).first()
 
 
+def user_owns_event(db: Session, event_id: str, user_id: str) -> bool:
+    """Check whether an event exists and belongs to a user without loading it."""
+    owned = (
+        db.query(Event.id)
+        .filter(Event.id == event_id, Event.user_id == user_id)
+        .exists()
+    )
+    return bool(db.query(owned).scalar())
+
+
 def create_event(db: Session, data: EventCreate, user_id: str) -> Event:
     """Create a new event."""
     event = Event(
@@ -136,20 +161,19 @@ async def sync_event_tag_to_paperless(db: Session, event: Event) -> dict | None:
     if not paperless_config:
         return None
 
-    provider = integration_service.create_provider_instance(paperless_config)
-    if not provider or not isinstance(provider, DocumentProvider):
+    provider = await integration_service.get_shared_provider(
+        paperless_config, DocumentProvider
+    )
+    if not provider:
         return None
 
-    try:
-        # Check if tag exists
-        existing_tag = await provider.get_tag_by_name(event.external_tag or event.name)
-        if existing_tag:
-            return existing_tag
+    # Check if tag exists
+    existing_tag = await provider.get_tag_by_name(event.external_tag or event.name)
+    if existing_tag:
+        return existing_tag
 
-        # Create new tag
-        return await provider.create_tag(event.external_tag or event.name)
-    finally:
-        await provider.close()
+    # Create new tag
+    return await provider.create_tag(event.external_tag or event.name)
 
 
 async def sync_event_to_paperless_custom_field(db: Session, event: Event) -> bool:
@@ -161,8 +185,10 @@ async def sync_event_to_paperless_custom_field(db: Session, event: Event) -> boo
     if not paperless_config:
         return False
 
-    provider = integration_service.create_provider_instance(paperless_config)
-    if not provider or not isinstance(provider, DocumentProvider):
+    provider = await integration_service.get_shared_provider(
+        paperless_config, DocumentProvider
+    )
+    if not provider:
         return False
 
     try:
@@ -195,8 +221,6 @@ async def sync_event_to_paperless_custom_field(db: Session, event: Event) -> boo
         return True
     except Exception:
         return False
-    finally:
-        await provider.close()
 
 
 def can_transition_status(current: EventStatus, new: EventStatus) -> bool:
@@ -23,7 +23,7 @@ def get_expenses(
 
 def get_expense(db: Session, expense_id: str) -> Expense | None:
     """Get an expense by ID."""
-    return db.query(Expense).filter(Expense.id == expense_id).first()
+    return db.get(Expense, expense_id)
 
 
 def get_expense_for_event(
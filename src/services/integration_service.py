@@ -2,17 +2,51 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Integration configuration service."""
 
-from typing import Any
+import threading
+from collections.abc import Callable
+from typing import Any, cast
 
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, defer, make_transient_to_detached
 
 from src.encryption import decrypt_config, encrypt_config
-from src.integrations.base import IntegrationProvider
+from src.integrations.base import (
+    DocumentProvider,
+    EmailProvider,
+    ImageSearchProvider,
+    IntegrationProvider,
+    PhotoProvider,
+)
 from src.integrations.registry import IntegrationRegistry
 from src.models import IntegrationConfig
 from src.models.enums import IntegrationType
 from src.schemas.integration import IntegrationConfigCreate, IntegrationConfigUpdate
 
+# Provider interface implemented by each integration type; plain ``type``
+# because mypy rejects abstract classes as ``type[IntegrationProvider]``
+_PROVIDER_KINDS: dict[IntegrationType, type] = {
+    IntegrationType.PAPERLESS: DocumentProvider,
+    IntegrationType.IMMICH: PhotoProvider,
+    IntegrationType.SMTP: EmailProvider,
+    IntegrationType.UNSPLASH: ImageSearchProvider,
+}
+
+
+# Detached copies of recently loaded configs, keyed by config ID
+_config_cache: TTLCache[str, IntegrationConfig] = TTLCache(maxsize=256, ttl=30)
+
+# Decrypted configs keyed by their ciphertext, so a changed config never hits
+_decrypted_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=64, ttl=300)
+
+# Guards both caches; they are used from sync handlers in the thread pool
+# and from async dependencies on the event loop at the same time
+_cache_lock = threading.Lock()
+
+
+class ProviderKindError(TypeError):
+    """Raised when an integration does not implement the requested interface."""
+
 
 def list_integration_types() -> list[dict[str, Any]]:
     """List all available integration types with their schemas."""
@@ -23,9 +57,16 @@ def get_integration_configs(
     db: Session,
     integration_type: IntegrationType | None = None,
     active_only: bool = False,
+    include_secrets: bool = True,
 ) -> list[IntegrationConfig]:
-    """Get all integration configurations."""
+    """Get all integration configurations.
+
+    Pass ``include_secrets=False`` when only listing metadata; the encrypted
+    config blob is then left out of the SELECT.
+    """
     query = db.query(IntegrationConfig)
+    if not include_secrets:
+        query = query.options(defer(IntegrationConfig.config_encrypted))
     if integration_type:
         query = query.filter(IntegrationConfig.integration_type == integration_type)
     if active_only:
@@ -34,8 +75,34 @@ def get_integration_configs(
 
 
 def get_integration_config(db: Session, config_id: str) -> IntegrationConfig | None:
-    """Get a single integration configuration by ID."""
-    return db.query(IntegrationConfig).filter(IntegrationConfig.id == config_id).first()
+    """Get a single integration configuration by ID.
+
+    Rows are cached for a short time so that the burst of provider calls made
+    when the UI opens an integration does not re-select the same row.
+    """
+    with _cache_lock:
+        snapshot = _config_cache.get(config_id)
+    if snapshot is not None:
+        return db.merge(snapshot, load=False)
+
+    config = db.get(IntegrationConfig, config_id)
+    if config is not None:
+        snapshot = _detached_copy(config)
+        with _cache_lock:
+            _config_cache[config_id] = snapshot
+    return config
+
+
+def _detached_copy(config: IntegrationConfig) -> IntegrationConfig:
+    """Copy the column values of a config into a new detached instance."""
+    snapshot = IntegrationConfig(
+        **{
+            attr.key: getattr(config, attr.key)
+            for attr in inspect(IntegrationConfig).column_attrs
+        }
+    )
+    make_transient_to_detached(snapshot)
+    return snapshot
 
 
 def create_integration_config(
@@ -80,30 +147,108 @@ def update_integration_config(
     if data.is_active is not None:
         config.is_active = data.is_active
     db.commit()
+    # Only after the commit, or a read in between would cache the old row
+    _forget_config(config.id)
     db.refresh(config)
     return config
 
 
 def delete_integration_config(db: Session, config: IntegrationConfig) -> None:
     """Delete an integration configuration."""
+    config_id = config.id
     db.delete(config)
     db.commit()
+    _forget_config(config_id)
+    IntegrationRegistry.evict(config_id)
+
+
+def _forget_config(config_id: str) -> None:
+    """Drop the cached row of a changed or deleted integration configuration."""
+    with _cache_lock:
+        _config_cache.pop(config_id, None)
 
 
 def get_decrypted_config(config: IntegrationConfig) -> dict[str, Any]:
-    """Get the decrypted configuration for an integration."""
-    return decrypt_config(config.config_encrypted)
+    """Get the decrypted configuration for an integration.
+
+    Returns a fresh copy; callers may modify it.
+    """
+    with _cache_lock:
+        decrypted = _decrypted_cache.get(config.config_encrypted)
+    if decrypted is None:
+        decrypted = decrypt_config(config.config_encrypted)
+        with _cache_lock:
+            _decrypted_cache[config.config_encrypted] = decrypted
+    return dict(decrypted)
+
+
+def _check_provider_kind(
+    config: IntegrationConfig, kind: Callable[..., IntegrationProvider]
+) -> None:
+    """Raise ProviderKindError unless the integration type implements ``kind``."""
+    kind_class = cast(type[IntegrationProvider], kind)
+    provider_kind = _PROVIDER_KINDS.get(config.integration_type)
+    if provider_kind is None or not issubclass(provider_kind, kind_class):
+        raise ProviderKindError(
+            f"{config.integration_type.value} integration is not a "
+            f"{kind_class.__name__}"
+        )
 
 
-def create_provider_instance(config: IntegrationConfig) -> IntegrationProvider | None:
-    """Create a provider instance from an integration configuration."""
+# ``kind`` is one of the abstract provider interfaces. It is typed as a
+# callable because mypy only accepts concrete classes for ``type[P]``.
+def create_provider_instance[P: IntegrationProvider](
+    config: IntegrationConfig,
+    kind: Callable[..., P],
+) -> P | None:
+    """Create a provider instance from an integration configuration.
+
+    The integration type is checked against ``kind`` before anything is
+    decrypted or constructed.
+
+    Returns:
+        The provider, or None if no provider is registered for the type.
+
+    Raises:
+        ProviderKindError: If the integration type does not implement ``kind``.
+    """
+    _check_provider_kind(config, kind)
     decrypted = get_decrypted_config(config)
-    return IntegrationRegistry.create_provider(config.integration_type.value, decrypted)
+    provider = IntegrationRegistry.create_provider(
+        config.integration_type.value, decrypted
+    )
+    return cast(P | None, provider)
+
+
+async def get_shared_provider[P: IntegrationProvider](
+    config: IntegrationConfig,
+    kind: Callable[..., P],
+) -> P | None:
+    """Get the long-lived provider instance for an integration configuration.
+
+    Unlike :func:`create_provider_instance`, the provider is shared between
+    requests and must not be closed by the caller. The config is only
+    decrypted when the provider has to be (re)built.
+
+    Returns:
+        The provider, or None if no provider is registered for the type.
+
+    Raises:
+        ProviderKindError: If the integration type does not implement ``kind``.
+    """
+    _check_provider_kind(config, kind)
+    provider = await IntegrationRegistry.get_or_create(
+        config.id,
+        config.integration_type.value,
+        config.config_encrypted,
+        lambda: get_decrypted_config(config),
+    )
+    return cast(P | None, provider)
 
 
 async def test_integration_connection(config: IntegrationConfig) -> tuple[bool, str]:
     """Test connectivity for an integration configuration."""
-    provider = create_provider_instance(config)
+    provider = create_provider_instance(config, IntegrationProvider)
     if provider is None:
         return False, f"Unknown integration type: {config.integration_type}"
     try:
@@ -113,14 +258,37 @@ async def test_integration_connection(config: IntegrationConfig) -> tuple[bool,
         await provider.close()
 
 
+async def test_integration_by_id(
+    db: Session, config_id: str
+) -> tuple[bool, str] | None:
+    """Test connectivity for an integration by ID.
+
+    Returns:
+        The health check result, or None if the integration does not exist.
+    """
+    config = get_integration_config(db, config_id)
+    if config is None:
+        return None
+    return await test_integration_connection(config)
+
+
+def get_active_config(
+    db: Session, integration_type: IntegrationType
+) -> IntegrationConfig | None:
+    """Get the first active configuration of an integration type."""
+    return (
+        db.query(IntegrationConfig)
+        .filter(
+            IntegrationConfig.integration_type == integration_type,
+            IntegrationConfig.is_active == True,  # noqa: E712
+        )
+        .first()
+    )
+
+
 def get_active_document_provider(db: Session) -> IntegrationConfig | None:
     """Get the active document provider (Paperless) configuration."""
-    configs = get_integration_configs(
-        db,
-        integration_type=IntegrationType.PAPERLESS,
-        active_only=True,
-    )
-    return configs[0] if configs else None
+    return get_active_config(db, IntegrationType.PAPERLESS)
 
 
 def get_masked_config(config: IntegrationConfig) -> dict[str, Any]:
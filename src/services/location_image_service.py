@@ -4,6 +4,7 @@
 
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -203,13 +204,21 @@ def clear_expired_cache(db: Session) -> int:
     return result
 
 
-def get_attribution_html(image: LocationImage) -> str:
-    """Generate Unsplash attribution HTML (required by their API guidelines)."""
-    if image.photographer_name and image.photographer_url:
+@lru_cache(maxsize=1024)
+def _attribution_html(
+    photographer_name: str | None, photographer_url: str | None
+) -> str:
+    """Build the attribution HTML for a photographer."""
+    if photographer_name and photographer_url:
         return (
-            f'Photo by <a href="{image.photographer_url}?utm_source=travel_manager'
-            f'&utm_medium=referral">{image.photographer_name}</a> on '
+            f'Photo by <a href="{photographer_url}?utm_source=travel_manager'
+            f'&utm_medium=referral">{photographer_name}</a> on '
             f'<a href="https://unsplash.com?utm_source=travel_manager'
             f'&utm_medium=referral">Unsplash</a>'
         )
     return 'Photo from <a href="https://unsplash.com">Unsplash</a>'
+
+
+def get_attribution_html(image: LocationImage) -> str:
+    """Generate Unsplash attribution HTML (required by their API guidelines)."""
+    return _attribution_html(image.photographer_name, image.photographer_url)
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Note service."""
+
+from typing import Any
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from src.models import Event, Note
+from src.schemas.note import NoteCreate
+
+
+def create_note(db: Session, event_id: str, data: NoteCreate) -> Note:
+    """Create a note for an event.
+
+    The row is inserted and read back in one INSERT ... RETURNING statement.
+    The caller is responsible for committing.
+    """
+    stmt = (
+        insert(Note)
+        .values(event_id=event_id, content=data.content, note_type=data.note_type)
+        .returning(Note)
+    )
+    return db.execute(stmt).scalar_one()
+
+
+def get_note_for_user(
+    db: Session, event_id: str, note_id: str, user_id: str
+) -> Note | None:
+    """Get a note of an event that belongs to a specific user.
+
+    The ownership check is joined into the note lookup, so this is a single
+    query.
+    """
+    stmt = (
+        select(Note)
+        .join(Event, Event.id == Note.event_id)
+        .where(
+            Note.id == note_id,
+            Note.event_id == event_id,
+            Event.user_id == user_id,
+        )
+    )
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def update_note_for_user(
+    db: Session,
+    event_id: str,
+    note_id: str,
+    user_id: str,
+    values: dict[str, Any],
+) -> Note | None:
+    """Update a note of an event that belongs to a specific user.
+
+    The ownership check, update and reload happen in one UPDATE ... RETURNING
+    statement. The caller is responsible for committing.
+    """
+    owned_events = select(Event.id).where(Event.user_id == user_id)
+    stmt = (
+        update(Note)
+        .where(
+            Note.id == note_id,
+            Note.event_id == event_id,
+            Note.event_id.in_(owned_events),
+        )
+        .values(**values)
+        .returning(Note)
+    )
+    return db.execute(stmt).scalar_one_or_none()
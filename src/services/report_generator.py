@@ -2,11 +2,15 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Expense report generator service."""
 
+import asyncio
 import io
+import shutil
+import tempfile
 import zipfile
-from datetime import datetime
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Any
+from typing import IO, Any
 
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
@@ -18,6 +22,13 @@ from src.integrations.base import DocumentProvider
 from src.models import Event, Expense
 from src.services import expense_service, integration_service
 
+# Downloaded documents stay in memory up to this size and spill to disk beyond
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Spreadsheet row: date, description, category, payment type, amount and
+# whether a document is attached
+_ExcelRow = tuple[date, str, str, str, Decimal, bool]
+
 
 def _slugify_filename(name: str, max_length: int = 50) -> str:
     """Create a slug suitable for filenames."""
@@ -81,12 +92,33 @@ class ExpenseReportGenerator:
             "paperless_configured": self.paperless is not None,
         }
 
+    @staticmethod
+    def _excel_rows(expenses: list[Expense]) -> list[_ExcelRow]:
+        """Read the spreadsheet values out of the expense rows."""
+        return [
+            (
+                expense.date,
+                expense.description or "",
+                expense.category.value,
+                expense.payment_type.value,
+                expense.amount,
+                bool(expense.paperless_doc_id),
+            )
+            for expense in expenses
+        ]
+
+    @staticmethod
     def _create_excel(
-        self,
-        event: Event,
-        expenses: list[Expense],
+        event_name: str,
+        company_name: str,
+        period: str,
+        rows: list[_ExcelRow],
     ) -> bytes:
-        """Create Excel spreadsheet for expenses."""
+        """Create Excel spreadsheet for expenses.
+
+        Takes plain values only, so it can run in a worker thread without
+        touching the database session.
+        """
         wb = Workbook()
         ws = wb.active
         ws.title = "Expenses"
@@ -109,15 +141,13 @@ class ExpenseReportGenerator:
         # Title row
         ws.merge_cells("A1:G1")
         title_cell = ws["A1"]
-        title_cell.value = f"Expense Report: {event.name}"
+        title_cell.value = f"Expense Report: {event_name}"
         title_cell.font = Font(bold=True, size=14)
         title_cell.alignment = Alignment(horizontal="center")
 
         # Info rows
-        ws["A2"] = f"Company: {event.company.name if event.company else 'N/A'}"
-        start = _format_date(event.start_date)
-        end = _format_date(event.end_date)
-        ws["A3"] = f"Period: {start} to {end}"
+        ws["A2"] = f"Company: {company_name}"
+        ws["A3"] = f"Period: {period}"
         ws["A4"] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
 
         # Headers
@@ -140,24 +170,31 @@ class ExpenseReportGenerator:
 
         # Data rows
         total = Decimal(0)
-        for idx, expense in enumerate(expenses, 1):
+        for idx, (
+            day,
+            description,
+            category,
+            payment_type,
+            amount,
+            has_doc,
+        ) in enumerate(rows, 1):
             row = header_row + idx
             ws.cell(row=row, column=1, value=idx).border = border
-            date_cell = ws.cell(row=row, column=2, value=expense.date)
+            date_cell = ws.cell(row=row, column=2, value=day)
             date_cell.number_format = date_format
             date_cell.border = border
-            ws.cell(row=row, column=3, value=expense.description or "").border = border
-            ws.cell(row=row, column=4, value=expense.category.value).border = border
-            ws.cell(row=row, column=5, value=expense.payment_type.value).border = border
-            amount_cell = ws.cell(row=row, column=6, value=float(expense.amount))
+            ws.cell(row=row, column=3, value=description).border = border
+            ws.cell(row=row, column=4, value=category).border = border
+            ws.cell(row=row, column=5, value=payment_type).border = border
+            amount_cell = ws.cell(row=row, column=6, value=float(amount))
             amount_cell.number_format = currency_format
             amount_cell.border = border
-            doc_ref = f"{idx:02d}_*.pdf" if expense.paperless_doc_id else "N/A"
+            doc_ref = f"{idx:02d}_*.pdf" if has_doc else "N/A"
             ws.cell(row=row, column=7, value=doc_ref).border = border
-            total += expense.amount
+            total += amount
 
         # Total row
-        total_row = header_row + len(expenses) + 1
+        total_row = header_row + len(rows) + 1
         ws.cell(row=total_row, column=5, value="Total:").font = Font(bold=True)
         total_cell = ws.cell(row=total_row, column=6, value=float(total))
         total_cell.font = Font(bold=True)
@@ -173,55 +210,117 @@ class ExpenseReportGenerator:
         wb.save(output)
         return output.getvalue()
 
-    async def generate(self, event: Event) -> bytes:
-        """Generate ZIP with Excel and documents."""
-        expenses = expense_service.get_expenses(self.db, event.id)
-        expenses.sort(key=lambda e: e.date)
+    @staticmethod
+    def _document_filename(idx: int, expense: Expense, original_name: str) -> str:
+        """Build the standardized archive filename for an expense document."""
+        # Extract extension from original filename
+        ext = "pdf"
+        if "." in original_name:
+            ext = original_name.rsplit(".", 1)[-1].lower()
+
+        desc_slug = _slugify_filename(expense.description or "document", 30)
+        date_fmt = _format_date(expense.date)
+        return f"{idx:02d}_{date_fmt}_{desc_slug}.{ext}"
+
+    async def _download_documents(
+        self, expenses: list[Expense]
+    ) -> list[tuple[str, IO[bytes]]]:
+        """Download Paperless documents for expenses as (filename, file).
+
+        Each document is streamed into a spooled temporary file, which the
+        caller must close. Documents that fail to download are skipped.
+        """
+        if not self.paperless:
+            return []
+
+        numbered = [
+            (idx, expense, doc_id)
+            for idx, expense in enumerate(expenses, 1)
+            if (doc_id := expense.paperless_doc_id)
+        ]
+        # Closed by generate() once the archive is built, or below on failure
+        spools = [
+            tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)  # noqa: SIM115
+            for _ in numbered
+        ]
 
-        # Create the Excel file
-        excel_bytes = self._create_excel(event, expenses)
+        def writer(spool: IO[bytes]) -> Callable[[bytes], Awaitable[None]]:
+            async def write(chunk: bytes) -> None:
+                spool.write(chunk)
 
-        # Create ZIP file
+            return write
+
+        results = await self.paperless.download_documents(
+            [doc_id for _, _, doc_id in numbered],
+            sinks=[writer(spool) for spool in spools],
+        )
+
+        documents: list[tuple[str, IO[bytes]]] = []
+        for (idx, expense, _), spool, result in zip(
+            numbered, spools, results, strict=True
+        ):
+            if isinstance(result, BaseException):
+                spool.close()
+                continue
+            spool.seek(0)
+            _, original_name, _mime_type = result
+            documents.append(
+                (self._document_filename(idx, expense, original_name), spool)
+            )
+        return documents
+
+    @staticmethod
+    def _create_zip(
+        excel_name: str,
+        excel_bytes: bytes,
+        documents: list[tuple[str, IO[bytes]]],
+    ) -> bytes:
+        """Package the Excel file and documents into a ZIP archive."""
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            # Add Excel file
-            event_slug = _slugify_filename(event.name)
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            excel_name = f"expense_report_{event_slug}_{date_str}.xlsx"
             zip_file.writestr(excel_name, excel_bytes)
+            for filename, content in documents:
+                with zip_file.open(f"documents/{filename}", "w") as entry:
+                    shutil.copyfileobj(content, entry)
 
-            # Add documents from Paperless if available
-            if self.paperless:
-                for idx, expense in enumerate(expenses, 1):
-                    if expense.paperless_doc_id:
-                        try:
-                            (
-                                content,
-                                original_name,
-                                _mime_type,
-                            ) = await self.paperless.download_document(
-                                expense.paperless_doc_id
-                            )
-                            # Extract extension from original filename or mime type
-                            ext = "pdf"
-                            if "." in original_name:
-                                ext = original_name.rsplit(".", 1)[-1].lower()
-
-                            # Create standardized filename
-                            desc_slug = _slugify_filename(
-                                expense.description or "document", 30
-                            )
-                            date_fmt = _format_date(expense.date)
-                            new_filename = f"{idx:02d}_{date_fmt}_{desc_slug}.{ext}"
-
-                            zip_file.writestr(f"documents/{new_filename}", content)
-                        except Exception:  # noqa: S110
-                            # Skip documents that fail to download
-                            pass
-
-        zip_buffer.seek(0)
         return zip_buffer.getvalue()
 
+    async def generate(self, event: Event) -> bytes:
+        """Generate ZIP with Excel and documents.
+
+        Building the spreadsheet and compressing the archive run in worker
+        threads so large reports do not stall the event loop. Documents are
+        downloaded concurrently while the spreadsheet is built.
+        """
+        expenses = expense_service.get_expenses(self.db, event.id)
+        expenses.sort(key=lambda e: e.date)
+
+        # Sessions are not thread-safe, so everything the sheet needs is read
+        # here and the worker thread only sees plain values
+        company_name = event.company.name if event.company else "N/A"
+        period = f"{_format_date(event.start_date)} to {_format_date(event.end_date)}"
+        rows = self._excel_rows(expenses)
+
+        # The Excel file is built while documents download from Paperless
+        excel_bytes, documents = await asyncio.gather(
+            asyncio.to_thread(
+                self._create_excel, event.name, company_name, period, rows
+            ),
+            self._download_documents(expenses),
+        )
+
+        event_slug = _slugify_filename(event.name)
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        excel_name = f"expense_report_{event_slug}_{date_str}.xlsx"
+
+        try:
+            return await asyncio.to_thread(
+                self._create_zip, excel_name, excel_bytes, documents
+            )
+        finally:
+            for _, content in documents:
+                content.close()
+
     def get_filename(self, event: Event) -> str:
         """Get the filename for the ZIP file."""
         event_slug = _slugify_filename(event.name)
@@ -235,11 +334,11 @@ async def create_report_generator(
 ) -> ExpenseReportGenerator:
     """Create a report generator with optional Paperless provider."""
     paperless_config = integration_service.get_active_document_provider(db)
-    paperless = None
+    paperless: DocumentProvider | None = None
 
     if paperless_config:
-        paperless = integration_service.create_provider_instance(paperless_config)
-        if not isinstance(paperless, DocumentProvider):
-            paperless = None
+        paperless = await integration_service.get_shared_provider(
+            paperless_config, DocumentProvider
+        )
 
     return ExpenseReportGenerator(db, paperless)
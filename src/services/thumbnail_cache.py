@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""In-memory cache for proxied Immich thumbnails."""
+
+from collections.abc import AsyncIterator
+
+from cachetools import LRUCache
+
+# Upper bound for the total size of cached thumbnail bytes
+_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Thumbnails larger than this are streamed but never cached
+_MAX_ENTRY_BYTES = 1024 * 1024
+
+# (integration config id, config version, asset id) -> (content, content
+# type), bounded by total bytes. The version is the encrypted config, so
+# thumbnails fetched with old credentials are not served after a change.
+_thumbnails: LRUCache[tuple[str, str, str], tuple[bytes, str]] = LRUCache(
+    maxsize=_MAX_CACHE_BYTES, getsizeof=lambda entry: len(entry[0])
+)
+
+
+def get_thumbnail(
+    integration_id: str, version: str, asset_id: str
+) -> tuple[bytes, str] | None:
+    """Get a cached thumbnail.
+
+    Args:
+        integration_id: ID of the Immich integration config.
+        version: Encrypted config the thumbnail was fetched with.
+        asset_id: Immich asset ID.
+
+    Returns:
+        Tuple of thumbnail bytes and content type, or None if not cached.
+    """
+    return _thumbnails.get((integration_id, version, asset_id))
+
+
+async def cache_stream(
+    integration_id: str,
+    version: str,
+    asset_id: str,
+    chunks: AsyncIterator[bytes],
+    content_type: str,
+) -> AsyncIterator[bytes]:
+    """Pass a thumbnail stream through while storing it in the cache.
+
+    The thumbnail is only cached once the stream has been fully consumed,
+    so aborted downloads never leave partial images behind.
+
+    Args:
+        integration_id: ID of the Immich integration config.
+        version: Encrypted config the thumbnail is fetched with.
+        asset_id: Immich asset ID.
+        chunks: Upstream thumbnail byte stream.
+        content_type: Content type of the thumbnail.
+
+    Yields:
+        The upstream chunks, unchanged.
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        if len(buffer) <= _MAX_ENTRY_BYTES:
+            buffer.extend(chunk)
+        yield chunk
+
+    if len(buffer) <= _MAX_ENTRY_BYTES:
+        _thumbnails[integration_id, version, asset_id] = (
+            bytes(buffer),
+            content_type,
+        )
+
+
+def clear() -> None:
+    """Drop all cached thumbnails."""
+    _thumbnails.clear()
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Todo service."""
+
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.models import Event, Todo
+
+
+def get_todo_for_user(
+    db: Session, event_id: str, todo_id: str, user_id: str
+) -> Todo | None:
+    """Get a todo of an event that belongs to a specific user.
+
+    The ownership check is joined into the todo lookup, so this is a single
+    query.
+    """
+    stmt = (
+        select(Todo)
+        .join(Event, Event.id == Todo.event_id)
+        .where(
+            Todo.id == todo_id,
+            Todo.event_id == event_id,
+            Event.user_id == user_id,
+        )
+    )
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def update_todo_for_user(
+    db: Session,
+    event_id: str,
+    todo_id: str,
+    user_id: str,
+    values: dict[str, Any],
+) -> Todo | None:
+    """Update a todo of an event that belongs to a specific user.
+
+    The ownership check, update and reload happen in one UPDATE ... RETURNING
+    statement. The caller is responsible for committing.
+    """
+    owned_events = select(Event.id).where(Event.user_id == user_id)
+    stmt = (
+        update(Todo)
+        .where(
+            Todo.id == todo_id,
+            Todo.event_id == event_id,
+            Todo.event_id.in_(owned_events),
+        )
+        .values(**values)
+        .returning(Todo)
+    )
+    return db.execute(stmt).scalar_one_or_none()
@@ -1,6 +1,17 @@
 # SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
 # SPDX-License-Identifier: GPL-2.0-only
+import io
 import os
+import time
+import zipfile
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import event
+
+from src.database import engine
+from src.integrations.smtp import SmtpProvider
+from src.schemas.location import LocationSuggestion
+from src.services import integration_service, thumbnail_cache
 
 # Set test environment
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only-32chars!"
@@ -188,6 +199,24 @@ class TestCompaniesAPI:
         assert response.json()["name"] == "Updated Company"
         assert response.json()["type"] == "third_party"
 
+    def test_timestamps_are_set_by_database(self, authenticated_client):
+        """Test that created_at is kept and updated_at moves on update."""
+        created = authenticated_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        ).json()
+        # The database keeps milliseconds; make sure the clock moves past them
+        time.sleep(0.01)
+
+        updated = authenticated_client.put(
+            f"/api/v1/companies/{created['id']}",
+            json={"name": "Updated Company", "type": "employer"},
+        ).json()
+
+        assert created["created_at"] == created["updated_at"]
+        assert updated["created_at"] == created["created_at"]
+        assert updated["updated_at"] > created["updated_at"]
+
     def test_delete_company(self, authenticated_client):
         """Test deleting a company."""
         # Create company first
@@ -263,6 +292,51 @@ class TestEventsAPI:
         assert len(data) == 1
         assert data[0]["name"] == "Test Event"
 
+    def test_document_preview_is_streamed(self, admin_client, respx_mock):
+        """Test that Paperless documents are passed through for preview."""
+        admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Paperless",
+                "integration_type": "paperless",
+                "config": {
+                    "url": "https://paperless.example.com",
+                    "token": "test-token",
+                    "custom_field_name": "Trip",
+                },
+            },
+        )
+        company_response = admin_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = admin_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        respx_mock.get(
+            "https://paperless.example.com/api/documents/7/download/"
+        ).respond(
+            content=b"%PDF-1.7",
+            headers={
+                "content-type": "application/pdf",
+                "content-disposition": 'attachment; filename="receipt.pdf"',
+            },
+        )
+
+        response = admin_client.get(f"/api/v1/events/{event_id}/documents/7/preview")
+
+        assert response.status_code == 200
+        assert response.content == b"%PDF-1.7"
+        assert response.headers["content-type"] == "application/pdf"
+        assert 'filename="receipt.pdf"' in response.headers["content-disposition"]
+
 
 class TestExpensesAPI:
     """Test expenses API endpoints."""
@@ -343,6 +417,562 @@ class TestExpensesAPI:
         data = response.json()
         assert len(data) == 1
 
+    def test_generate_expense_report(self, authenticated_client):
+        """Test downloading the expense report archive."""
+        company_response = authenticated_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = authenticated_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        authenticated_client.post(
+            f"/api/v1/events/{event_id}/expenses",
+            json={
+                "date": "2024-01-16",
+                "amount": 50.00,
+                "currency": "EUR",
+                "payment_type": "cash",
+                "category": "meals",
+            },
+        )
+
+        response = authenticated_client.post(
+            f"/api/v1/events/{event_id}/expense-report/generate"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = archive.namelist()
+        assert len(names) == 1
+        assert names[0].endswith(".xlsx")
+
+    def test_send_expense_report_is_queued(self, admin_client):
+        """Test that the report email is sent after the response is built."""
+        admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test SMTP",
+                "integration_type": "smtp",
+                "config": {
+                    "host": "smtp.example.com",
+                    "port": 587,
+                    "from_email": "travel@example.com",
+                },
+            },
+        )
+        company_response = admin_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = admin_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        admin_client.post(
+            "/api/v1/email-templates",
+            json={
+                "name": "Expense Report",
+                "reason": "expense_report",
+                "subject": "Expenses for {{event.name}}",
+                "body_html": "<p>{{expense.total_amount}}</p>",
+                "body_text": "{{expense.total_amount}}",
+                "is_default": True,
+            },
+        )
+
+        with patch.object(
+            SmtpProvider, "send_email", AsyncMock(return_value=True)
+        ) as send_email:
+            response = admin_client.post(
+                f"/api/v1/events/{event_id}/expense-report/send",
+                json={"recipient_emails": ["finance@example.com"]},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["recipients"] == ["finance@example.com"]
+        send_email.assert_awaited_once()
+        assert send_email.call_args.kwargs["to"] == ["finance@example.com"]
+
+        status_response = admin_client.get(
+            f"/api/v1/events/{event_id}/expense-report/send/{data['job_id']}"
+        )
+        assert status_response.status_code == 200
+        assert status_response.json()["status"] == "sent"
+
+    def test_send_expense_report_failure_is_reported(self, admin_client):
+        """Test that a failed delivery is visible through the send status."""
+        admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test SMTP",
+                "integration_type": "smtp",
+                "config": {
+                    "host": "smtp.example.com",
+                    "port": 587,
+                    "from_email": "travel@example.com",
+                },
+            },
+        )
+        company_response = admin_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = admin_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        admin_client.post(
+            "/api/v1/email-templates",
+            json={
+                "name": "Expense Report",
+                "reason": "expense_report",
+                "subject": "Expenses for {{event.name}}",
+                "body_html": "<p>{{expense.total_amount}}</p>",
+                "body_text": "{{expense.total_amount}}",
+                "is_default": True,
+            },
+        )
+
+        with patch.object(SmtpProvider, "send_email", AsyncMock(return_value=False)):
+            response = admin_client.post(
+                f"/api/v1/events/{event_id}/expense-report/send",
+                json={"recipient_emails": ["finance@example.com"]},
+            )
+        job_id = response.json()["job_id"]
+
+        status_response = admin_client.get(
+            f"/api/v1/events/{event_id}/expense-report/send/{job_id}"
+        )
+        assert status_response.status_code == 200
+        assert status_response.json()["status"] == "failed"
+        assert status_response.json()["message"] == "Failed to send email"
+
+        response = admin_client.get(
+            f"/api/v1/events/{event_id}/expense-report/send/unknown"
+        )
+        assert response.status_code == 404
+
+
+class TestNotesAPI:
+    """Test notes API endpoints."""
+
+    def test_note_lifecycle(self, authenticated_client):
+        """Test creating, listing, fetching, updating and deleting a note."""
+        company_response = authenticated_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        company_id = company_response.json()["id"]
+
+        event_response = authenticated_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_id,
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+
+        create = authenticated_client.post(
+            f"/api/v1/events/{event_id}/notes",
+            json={"content": "Bring adapter"},
+        )
+        assert create.status_code == 201
+        note_id = create.json()["id"]
+
+        response = authenticated_client.get(f"/api/v1/events/{event_id}/notes")
+        assert [n["id"] for n in response.json()] == [note_id]
+
+        response = authenticated_client.put(
+            f"/api/v1/events/{event_id}/notes/{note_id}",
+            json={"content": "Bring two adapters"},
+        )
+        assert response.json()["content"] == "Bring two adapters"
+        assert response.json()["updated_at"] >= create.json()["updated_at"]
+
+        response = authenticated_client.get(
+            f"/api/v1/events/{event_id}/notes/{note_id}"
+        )
+        assert response.json()["content"] == "Bring two adapters"
+
+        response = authenticated_client.delete(
+            f"/api/v1/events/{event_id}/notes/{note_id}"
+        )
+        assert response.status_code == 204
+
+        response = authenticated_client.get(
+            f"/api/v1/events/{event_id}/notes/{note_id}"
+        )
+        assert response.status_code == 404
+
+
+class TestTodosAPI:
+    """Test todo API endpoints."""
+
+    def test_list_todos(self, authenticated_client):
+        """Test listing the todos of an event."""
+        company_response = authenticated_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = authenticated_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        for title in ("Book hotel", "Pack charger"):
+            response = authenticated_client.post(
+                f"/api/v1/events/{event_id}/todos",
+                json={"title": title, "category": "preparation"},
+            )
+            assert response.status_code == 201
+
+        response = authenticated_client.get(f"/api/v1/events/{event_id}/todos")
+
+        assert response.status_code == 200
+        assert sorted(t["title"] for t in response.json()) == [
+            "Book hotel",
+            "Pack charger",
+        ]
+
+        response = authenticated_client.get("/api/v1/events/missing/todos")
+        assert response.status_code == 404
+
+    def test_todo_lifecycle(self, authenticated_client):
+        """Test reading, updating and deleting a todo."""
+        company_response = authenticated_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = authenticated_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        response = authenticated_client.post(
+            f"/api/v1/events/{event_id}/todos", json={"title": "Book hotel"}
+        )
+        todo_id = response.json()["id"]
+
+        response = authenticated_client.get(
+            f"/api/v1/events/{event_id}/todos/{todo_id}"
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Book hotel"
+
+        response = authenticated_client.put(
+            f"/api/v1/events/{event_id}/todos/{todo_id}", json={"completed": True}
+        )
+        assert response.status_code == 200
+        assert response.json()["completed"] is True
+
+        response = authenticated_client.get(f"/api/v1/events/missing/todos/{todo_id}")
+        assert response.status_code == 404
+
+        response = authenticated_client.delete(
+            f"/api/v1/events/{event_id}/todos/{todo_id}"
+        )
+        assert response.status_code == 204
+
+        response = authenticated_client.get(
+            f"/api/v1/events/{event_id}/todos/{todo_id}"
+        )
+        assert response.status_code == 404
+
+
+class TestSettingsAPI:
+    """Test locale settings endpoints."""
+
+    def test_get_and_update_locale(self, admin_client):
+        """Test reading defaults and updating locale settings."""
+        response = admin_client.get("/api/v1/settings/locale")
+        assert response.status_code == 200
+        assert response.json() == {
+            "date_format": "YYYY-MM-DD",
+            "time_format": "24h",
+            "timezone": "UTC",
+        }
+
+        response = admin_client.put(
+            "/api/v1/settings/locale",
+            json={"date_format": "DD.MM.YYYY", "timezone": "Europe/Vienna"},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "date_format": "DD.MM.YYYY",
+            "time_format": "24h",
+            "timezone": "Europe/Vienna",
+        }
+
+
+class TestPhotosAPI:
+    """Test photo API endpoints."""
+
+    def test_thumbnail_requires_owned_event(self, authenticated_client):
+        """Test that thumbnails are only proxied for the user's own events."""
+        company_response = authenticated_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = authenticated_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+
+        response = authenticated_client.get(
+            "/api/v1/events/missing/photos/asset-1/thumbnail"
+        )
+        assert response.status_code == 404
+
+        # Owned event passes the check and fails on the missing integration
+        response = authenticated_client.get(
+            f"/api/v1/events/{event_id}/photos/asset-1/thumbnail"
+        )
+        assert response.status_code == 400
+
+    def test_photo_reference_update_and_delete(self, authenticated_client):
+        """Test updating and removing a photo reference on an owned event."""
+        company_response = authenticated_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = authenticated_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        response = authenticated_client.post(
+            f"/api/v1/events/{event_id}/photos",
+            json={"immich_asset_id": "asset-1"},
+        )
+        assert response.status_code == 200
+        photo_id = response.json()["id"]
+
+        response = authenticated_client.post(
+            f"/api/v1/events/{event_id}/photos",
+            json={"immich_asset_id": "asset-1"},
+        )
+        assert response.status_code == 400
+
+        response = authenticated_client.put(
+            f"/api/v1/events/{event_id}/photos/{photo_id}",
+            json={"caption": "Harbour", "include_in_report": True},
+        )
+        assert response.status_code == 200
+        assert response.json()["caption"] == "Harbour"
+        assert response.json()["include_in_report"] is True
+
+        response = authenticated_client.get(
+            f"/api/v1/events/{event_id}/photos/references"
+        )
+        assert response.status_code == 200
+        assert [r["caption"] for r in response.json()] == ["Harbour"]
+
+        response = authenticated_client.put(
+            f"/api/v1/events/missing/photos/{photo_id}", json={"caption": "x"}
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Event not found"
+
+        response = authenticated_client.delete(
+            f"/api/v1/events/{event_id}/photos/{photo_id}"
+        )
+        assert response.status_code == 200
+
+        response = authenticated_client.delete(
+            f"/api/v1/events/{event_id}/photos/{photo_id}"
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Photo reference not found"
+
+    def test_thumbnail_is_streamed(self, admin_client, respx_mock):
+        """Test that the Immich thumbnail is passed through with caching."""
+        admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Immich",
+                "integration_type": "immich",
+                "config": {"url": "https://immich.example.com", "api_key": "key"},
+            },
+        )
+        company_response = admin_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = admin_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        respx_mock.get(
+            "https://immich.example.com/api/assets/asset-1/thumbnail"
+        ).respond(content=b"jpeg-bytes", headers={"content-type": "image/webp"})
+
+        response = admin_client.get(
+            f"/api/v1/events/{event_id}/photos/asset-1/thumbnail"
+        )
+
+        assert response.status_code == 200
+        assert response.content == b"jpeg-bytes"
+        assert response.headers["content-type"] == "image/webp"
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_search_photos_by_date(self, admin_client, respx_mock):
+        """Test that Immich assets are returned with their linked state."""
+        admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Immich",
+                "integration_type": "immich",
+                "config": {"url": "https://immich.example.com", "api_key": "key"},
+            },
+        )
+        company_response = admin_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = admin_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        admin_client.post(
+            f"/api/v1/events/{event_id}/photos", json={"immich_asset_id": "asset-1"}
+        )
+        respx_mock.post("https://immich.example.com/api/search/metadata").respond(
+            json={
+                "assets": {
+                    "items": [
+                        {
+                            "id": "asset-1",
+                            "originalFileName": "IMG_0001.jpg",
+                            "exifInfo": {
+                                "dateTimeOriginal": "2024-01-16T10:00:00+00:00"
+                            },
+                        },
+                        {"id": "asset-2", "originalFileName": "IMG_0002.jpg"},
+                    ]
+                }
+            }
+        )
+
+        response = admin_client.get(f"/api/v1/events/{event_id}/photos/by-date")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [(p["id"], p["is_linked"]) for p in data] == [
+            ("asset-1", True),
+            ("asset-2", False),
+        ]
+        assert data[0]["taken_at"] == "2024-01-16T10:00:00Z"
+        assert data[1]["distance_km"] is None
+
+    def test_thumbnail_is_cached(self, admin_client, respx_mock):
+        """Test that repeated thumbnail requests are served without Immich."""
+        thumbnail_cache.clear()
+        create = admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Immich",
+                "integration_type": "immich",
+                "config": {"url": "https://immich.example.com", "api_key": "key"},
+            },
+        )
+        company_response = admin_client.post(
+            "/api/v1/companies",
+            json={"name": "Test Company", "type": "employer"},
+        )
+        event_response = admin_client.post(
+            "/api/v1/events",
+            json={
+                "name": "Test Event",
+                "company_id": company_response.json()["id"],
+                "start_date": "2024-01-15",
+                "end_date": "2024-01-20",
+            },
+        )
+        event_id = event_response.json()["id"]
+        route = respx_mock.get(
+            "https://immich.example.com/api/assets/asset-2/thumbnail"
+        ).respond(content=b"jpeg-bytes", headers={"content-type": "image/jpeg"})
+
+        for _ in range(2):
+            response = admin_client.get(
+                f"/api/v1/events/{event_id}/photos/asset-2/thumbnail"
+            )
+            assert response.status_code == 200
+            assert response.content == b"jpeg-bytes"
+            assert "immutable" in response.headers["cache-control"]
+
+        assert route.call_count == 1
+
+        # New credentials may see a different library, so fetch again
+        admin_client.put(
+            f"/api/v1/integrations/{create.json()['id']}",
+            json={"config": {"url": "https://immich.example.com", "api_key": "new"}},
+        )
+        response = admin_client.get(
+            f"/api/v1/events/{event_id}/photos/asset-2/thumbnail"
+        )
+        assert response.status_code == 200
+        assert route.call_count == 2
+
 
 class TestIntegrationsAPI:
     """Test integrations API endpoints."""
@@ -356,6 +986,19 @@ class TestIntegrationsAPI:
         assert len(data) > 0
         assert any(t["type"] == "paperless" for t in data)
 
+    def test_list_integration_types_not_modified(self, admin_client):
+        """Test that a matching If-None-Match yields 304 without a body."""
+        first = admin_client.get("/api/v1/integrations/types")
+        etag = first.headers["ETag"]
+
+        response = admin_client.get(
+            "/api/v1/integrations/types", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
     def test_create_integration_admin_only(self, authenticated_client):
         """Test that non-admin users cannot create integrations."""
         response = authenticated_client.post(
@@ -392,3 +1035,178 @@ class TestIntegrationsAPI:
         data = response.json()
         assert data["name"] == "Test Paperless"
         assert data["integration_type"] == "paperless"
+
+    def test_list_integrations(self, admin_client):
+        """Test listing integrations neither loads nor decrypts the config."""
+        admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Paperless",
+                "integration_type": "paperless",
+                "config": {
+                    "url": "https://paperless.example.com",
+                    "token": "test-token",
+                },
+            },
+        )
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with patch.object(integration_service, "decrypt_config") as decrypt:
+                response = admin_client.get("/api/v1/integrations")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["name"] == "Test Paperless"
+        assert "config_encrypted" not in data[0]
+        decrypt.assert_not_called()
+        selects = [s for s in statements if "FROM integration_configs" in s]
+        assert selects
+        assert not any("config_encrypted" in s for s in selects)
+
+    def test_update_integration_invalidates_cache(self, admin_client):
+        """Test that a renamed integration is not served from the cache."""
+        create = admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Paperless",
+                "integration_type": "paperless",
+                "config": {
+                    "url": "https://paperless.example.com",
+                    "token": "test-token",
+                },
+            },
+        )
+        config_id = create.json()["id"]
+        admin_client.get(f"/api/v1/integrations/{config_id}")
+
+        admin_client.put(
+            f"/api/v1/integrations/{config_id}", json={"name": "Renamed Paperless"}
+        )
+        response = admin_client.get(f"/api/v1/integrations/{config_id}")
+        assert response.json()["name"] == "Renamed Paperless"
+
+        admin_client.delete(f"/api/v1/integrations/{config_id}")
+        response = admin_client.get(f"/api/v1/integrations/{config_id}")
+        assert response.status_code == 404
+
+    def test_paperless_bundle(self, admin_client, respx_mock):
+        """Test the bundle endpoint combines tags, custom fields and paths."""
+        create = admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Paperless",
+                "integration_type": "paperless",
+                "config": {
+                    "url": "https://paperless.example.com",
+                    "token": "test-token",
+                },
+            },
+        )
+        config_id = create.json()["id"]
+        base = "https://paperless.example.com/api"
+        respx_mock.get(f"{base}/tags/").respond(
+            json={"results": [{"id": 1, "name": "Travel"}], "next": None}
+        )
+        respx_mock.get(f"{base}/custom_fields/").respond(
+            json={
+                "results": [{"id": 2, "name": "Trip", "data_type": "select"}],
+                "next": None,
+            }
+        )
+        respx_mock.get(f"{base}/storage_paths/").respond(
+            json={"results": [{"id": 3, "name": "Trips", "path": "trips"}]}
+        )
+
+        response = admin_client.get(
+            f"/api/v1/integrations/{config_id}/paperless/bundle"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tags"] == [{"id": 1, "name": "Travel"}]
+        assert data["custom_fields"][0]["name"] == "Trip"
+        assert data["storage_paths"][0]["path"] == "trips"
+
+    def test_provider_endpoint_checks_integration(self, admin_client):
+        """Test provider endpoints reject unknown and mismatched integrations."""
+        response = admin_client.get("/api/v1/integrations/missing/tags")
+        assert response.status_code == 404
+
+        create = admin_client.post(
+            "/api/v1/integrations",
+            json={
+                "name": "Test Paperless",
+                "integration_type": "paperless",
+                "config": {
+                    "url": "https://paperless.example.com",
+                    "token": "test-token",
+                },
+            },
+        )
+        config_id = create.json()["id"]
+
+        response = admin_client.get(
+            f"/api/v1/integrations/{config_id}/unsplash/search",
+            params={"query": "berlin"},
+        )
+        assert response.status_code == 400
+        assert "Unsplash" in response.json()["detail"]
+
+
+class TestLocationsAPI:
+    """Test location autocomplete endpoint."""
+
+    def test_autocomplete_is_cached(self, client, respx_mock):
+        """Test that repeated queries are answered without calling Nominatim."""
+        route = respx_mock.get("https://nominatim.openstreetmap.org/search").respond(
+            json=[
+                {
+                    "lat": "52.5170365",
+                    "lon": "13.3888599",
+                    "display_name": "Berlin, Deutschland",
+                    "address": {
+                        "city": "Berlin",
+                        "country": "Deutschland",
+                        "country_code": "de",
+                    },
+                }
+            ]
+        )
+
+        first = client.get("/api/v1/locations/autocomplete?q=Berlin-cache")
+        second = client.get("/api/v1/locations/autocomplete?q=berlin-cache ")
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert first.json()[0]["country_code"] == "DE"
+        assert route.call_count == 1
+
+    def test_autocomplete_fields_match_schema(self, client, respx_mock):
+        """Test that unvalidated suggestions carry exactly the schema fields."""
+        respx_mock.get("https://nominatim.openstreetmap.org/search").respond(
+            json=[
+                {
+                    "lat": "48.2083537",
+                    "lon": "16.3725042",
+                    "display_name": "Wien, Österreich",
+                    "address": {"town": "Wien", "country": "Österreich"},
+                }
+            ]
+        )
+
+        response = client.get("/api/v1/locations/autocomplete?q=Wien-fields")
+
+        assert response.status_code == 200
+        suggestion = response.json()[0]
+        assert set(suggestion) == set(LocationSuggestion.model_fields)
+        assert suggestion["city"] == "Wien"
+        assert suggestion["latitude"] == 48.2083537
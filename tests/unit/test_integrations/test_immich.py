@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Unit tests for the Immich provider."""
+
+from src.integrations.immich import ImmichProvider
+
+
+def _asset(asset_id: str, latitude: float | None, longitude: float | None) -> dict:
+    return {
+        "id": asset_id,
+        "exifInfo": {"latitude": latitude, "longitude": longitude},
+    }
+
+
+class TestSearchByLocation:
+    """Test proximity filtering of Immich search results."""
+
+    async def test_filters_and_sorts_by_distance(self, respx_mock):
+        """Test that only nearby geotagged assets are returned, nearest first."""
+        respx_mock.post("https://immich.example.com/api/search/metadata").respond(
+            json={
+                "assets": {
+                    "items": [
+                        _asset("bratislava", 48.1486, 17.1077),
+                        _asset("untagged", None, None),
+                        {"id": "no-exif"},
+                        _asset("stephansplatz", 48.2085, 16.3731),
+                        _asset("sydney", -33.8688, 151.2093),
+                    ]
+                }
+            }
+        )
+        provider = ImmichProvider(
+            {"url": "https://immich.example.com", "api_key": "key"}
+        )
+
+        try:
+            assets = await provider.search_by_location_and_date(
+                latitude=48.2082, longitude=16.3738, radius_km=60
+            )
+        finally:
+            await provider.close()
+
+        assert [a["id"] for a in assets] == ["stephansplatz", "bratislava"]
+        assert assets[0]["_distance_km"] == 0.06
+        assert assets[1]["_distance_km"] == 54.82
+        assert assets[0]["_thumbnail_url"] == (
+            "https://immich.example.com/api/assets/stephansplatz/thumbnail?size=preview"
+        )
+
+    async def test_close_releases_client(self):
+        """Test that closing a provider closes only its own HTTP client."""
+        config = {"url": "https://immich.example.com", "api_key": "key"}
+        first = ImmichProvider(config)
+        second = ImmichProvider({**config, "api_key": "other"})
+
+        try:
+            await first.close()
+
+            assert first._client.is_closed
+            assert not second._client.is_closed
+        finally:
+            await second.close()
+
+    async def test_matches_across_the_antimeridian(self, respx_mock):
+        """Test that the bounding box wraps around longitude +/-180."""
+        respx_mock.post("https://immich.example.com/api/search/metadata").respond(
+            json={"items": [_asset("taveuni", -16.85, -179.95)]}
+        )
+        provider = ImmichProvider(
+            {"url": "https://immich.example.com", "api_key": "key"}
+        )
+
+        try:
+            assets = await provider.search_by_location_and_date(
+                latitude=-16.85, longitude=179.95, radius_km=50
+            )
+        finally:
+            await provider.close()
+
+        assert [a["id"] for a in assets] == ["taveuni"]
+
+
+class TestHealthCheck:
+    """Test the Immich connectivity check."""
+
+    async def test_reports_server_version(self, respx_mock):
+        """Test that a reachable server reports its version."""
+        respx_mock.get("https://immich.example.com/api/server/ping").respond(
+            json={"res": "pong"}
+        )
+        respx_mock.get("https://immich.example.com/api/server/version").respond(
+            json={"major": 1, "minor": 120, "patch": 2}
+        )
+        provider = ImmichProvider(
+            {"url": "https://immich.example.com", "api_key": "key"}
+        )
+
+        try:
+            result = await provider.health_check()
+        finally:
+            await provider.close()
+
+        assert result == (True, "Connected to Immich v1.120.2")
+
+    async def test_failed_ping_wins_over_version(self, respx_mock):
+        """Test that an unhealthy ping is reported even if the version loads."""
+        respx_mock.get("https://immich.example.com/api/server/ping").respond(503)
+        respx_mock.get("https://immich.example.com/api/server/version").respond(
+            json={"major": 1, "minor": 120, "patch": 2}
+        )
+        provider = ImmichProvider(
+            {"url": "https://immich.example.com", "api_key": "key"}
+        )
+
+        try:
+            result = await provider.health_check()
+        finally:
+            await provider.close()
+
+        assert result == (False, "HTTP 503")
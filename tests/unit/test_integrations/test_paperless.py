@@ -0,0 +1,365 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Unit tests for the Paperless-ngx provider."""
+
+import asyncio
+import json
+
+import httpx
+
+from src.integrations.paperless import PaperlessProvider
+
+
+class TestParseSelectChoices:
+    """Test extracting select options from a custom field."""
+
+    def test_mixed_option_formats(self):
+        """Test that string and dict options both become label/value pairs."""
+        field = {
+            "id": 1,
+            "name": "Trip",
+            "data_type": "select",
+            "extra_data": {
+                "select_options": [
+                    "Berlin",
+                    {"id": "abc", "label": "Vienna"},
+                    {"value": "xyz"},
+                ]
+            },
+        }
+
+        assert PaperlessProvider.parse_select_choices(field) == [
+            {"label": "Berlin", "value": "Berlin"},
+            {"label": "Vienna", "value": "abc"},
+            {"label": "xyz", "value": "xyz"},
+        ]
+
+    def test_non_select_field(self):
+        """Test that non-select fields have no choices."""
+        field = {"id": 2, "name": "Notes", "data_type": "string", "extra_data": {}}
+
+        assert PaperlessProvider.parse_select_choices(field) == []
+
+
+class TestHealthCheck:
+    """Test the Paperless-ngx connectivity check."""
+
+    async def test_falls_back_to_get_without_head(self, respx_mock):
+        """Test that a server rejecting HEAD is checked with GET instead."""
+        url = "https://paperless.example.com/api/ui_settings/"
+        respx_mock.head(url).respond(405)
+        get_route = respx_mock.get(url).respond(json={})
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            result = await provider.health_check()
+        finally:
+            await provider.close()
+
+        assert result == (True, "Connected")
+        assert get_route.call_count == 1
+
+
+class TestListTags:
+    """Test the short-lived tag listing cache."""
+
+    async def test_reuses_listing_until_a_tag_is_created(self, respx_mock):
+        """Test that tags are fetched once and refetched after create_tag."""
+        tags_route = respx_mock.get("https://paperless.example.com/api/tags/")
+        tags_route.respond(json={"results": [{"id": 1, "name": "Travel"}]})
+        respx_mock.post("https://paperless.example.com/api/tags/").respond(
+            json={"id": 2, "name": "Vienna"}
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            first = await provider.list_tags()
+            second = await provider.list_tags()
+            assert tags_route.call_count == 1
+
+            await provider.create_tag("Vienna")
+            await provider.list_tags()
+        finally:
+            await provider.close()
+
+        assert first == second == [{"id": 1, "name": "Travel"}]
+        assert tags_route.call_count == 2
+
+    async def test_name_lookup_uses_listing(self, respx_mock):
+        """Test that by-name lookups hit the listing and query only on a miss."""
+
+        def tags(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("name__iexact") == "Vienna":
+                return httpx.Response(
+                    200, json={"results": [{"id": 2, "name": "Vienna"}]}
+                )
+            return httpx.Response(200, json={"results": [{"id": 1, "name": "Travel"}]})
+
+        route = respx_mock.get("https://paperless.example.com/api/tags/").mock(
+            side_effect=tags
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            upper = await provider.get_tag_by_name("TRAVEL")
+            lower = await provider.get_tag_by_name("travel")
+            assert route.call_count == 1
+
+            missing = await provider.get_tag_by_name("Vienna")
+        finally:
+            await provider.close()
+
+        assert upper == lower == {"id": 1, "name": "Travel"}
+        assert missing == {"id": 2, "name": "Vienna"}
+        assert route.call_count == 2
+
+    async def test_expired_listing_is_revalidated(self, respx_mock):
+        """Test that a 304 after cache expiry reuses the earlier listing."""
+
+        def tags(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"results": [{"id": 1, "name": "Travel"}]},
+                headers={"etag": '"v1"'},
+            )
+
+        route = respx_mock.get("https://paperless.example.com/api/tags/").mock(
+            side_effect=tags
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            first = await provider.list_tags()
+            provider._cache.clear()
+            second = await provider.list_tags()
+        finally:
+            await provider.close()
+
+        assert first == second == [{"id": 1, "name": "Travel"}]
+        assert route.call_count == 2
+        assert route.calls.last.response.status_code == 304
+
+
+class TestPagination:
+    """Test fetching paginated Paperless listings."""
+
+    async def test_fetches_remaining_pages_with_filters(self, respx_mock):
+        """Test that all pages are fetched in order with the original filters."""
+        base = "https://paperless.example.com/api/documents/"
+
+        def page(request: httpx.Request) -> httpx.Response:
+            number = int(request.url.params.get("page", 1))
+            assert request.url.params["storage_path__id"] == "7"
+            assert request.url.params["page_size"] == "100"
+            assert request.url.params["ordering"] == "-created,id"
+            ids = range(number * 2 - 1, min(number * 2, 5) + 1)
+            return httpx.Response(
+                200,
+                json={
+                    "count": 5,
+                    "next": f"{base}?page={number + 1}" if number < 3 else None,
+                    "results": [{"id": i} for i in ids],
+                },
+            )
+
+        route = respx_mock.get(base).mock(side_effect=page)
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            documents = await provider.get_documents(storage_path_id=7)
+        finally:
+            await provider.close()
+
+        assert [d["id"] for d in documents] == [1, 2, 3, 4, 5]
+        assert route.call_count == 3
+
+
+class TestDocumentsForEvent:
+    """Test finding the documents that belong to an event."""
+
+    async def test_filters_on_server_and_locally(self, respx_mock):
+        """Test that the custom field query is sent and still checked locally."""
+        route = respx_mock.get("https://paperless.example.com/api/documents/")
+        route.respond(
+            json={
+                "count": 2,
+                "next": None,
+                "results": [
+                    {"id": 1, "custom_fields": [{"field": 3, "value": "vie"}]},
+                    {"id": 2, "custom_fields": [{"field": 3, "value": "bts"}]},
+                ],
+            }
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            documents = await provider.get_documents_for_event(
+                storage_path_id=7, custom_field_id=3, custom_field_value="vie"
+            )
+        finally:
+            await provider.close()
+
+        assert [d["id"] for d in documents] == [1]
+        params = route.calls.last.request.url.params
+        assert json.loads(params["custom_field_query"]) == [3, "exact", "vie"]
+        assert params["storage_path__id"] == "7"
+
+
+class TestMetadataCache:
+    """Test caching of custom field lookups."""
+
+    async def test_concurrent_lookups_share_a_request(self, respx_mock):
+        """Test that simultaneous misses for one key hit Paperless once."""
+        route = respx_mock.get("https://paperless.example.com/api/custom_fields/")
+        route.respond(
+            json={"results": [{"id": 3, "name": "Trip", "data_type": "select"}]}
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            first, second = await asyncio.gather(
+                provider.get_custom_field_by_name("Trip"),
+                provider.get_custom_field_by_name("trip"),
+            )
+        finally:
+            await provider.close()
+
+        assert first == second
+        assert first["id"] == 3
+        assert route.call_count == 1
+
+    async def test_adding_a_choice_invalidates_fields(self, respx_mock):
+        """Test that custom field lookups are refetched after a new choice."""
+        field = {
+            "id": 3,
+            "name": "Trip",
+            "data_type": "select",
+            "extra_data": {"select_options": ["Berlin"]},
+        }
+        route = respx_mock.get("https://paperless.example.com/api/custom_fields/3/")
+        route.respond(json=field)
+        respx_mock.patch("https://paperless.example.com/api/custom_fields/3/").respond(
+            json=field
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            await provider.get_custom_field(3)
+            await provider.get_custom_field(3)
+            assert route.call_count == 1
+
+            assert await provider.add_custom_field_choice(3, "Vienna")
+            await provider.get_custom_field(3)
+        finally:
+            await provider.close()
+
+        assert route.call_count == 3
+
+    async def test_adding_a_choice_is_conditional(self, respx_mock):
+        """Test that a cached field is patched with If-Match and retried on 412."""
+        versions = iter(['"v1"', '"v2"'])
+
+        def field(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "id": 3,
+                    "name": "Trip",
+                    "data_type": "select",
+                    "extra_data": {"select_options": ["Berlin"]},
+                },
+                headers={"etag": next(versions)},
+            )
+
+        url = "https://paperless.example.com/api/custom_fields/3/"
+        get_route = respx_mock.get(url).mock(side_effect=field)
+        patch_route = respx_mock.patch(url).mock(
+            side_effect=[httpx.Response(412), httpx.Response(200, json={})]
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            await provider.get_custom_field(3)
+            assert await provider.add_custom_field_choice(3, "Vienna")
+        finally:
+            await provider.close()
+
+        assert get_route.call_count == 2
+        assert [c.request.headers["if-match"] for c in patch_route.calls] == [
+            '"v1"',
+            '"v2"',
+        ]
+
+    async def test_choice_check_ignores_case(self, respx_mock):
+        """Test that choices match case-insensitively and are checked once."""
+        route = respx_mock.get("https://paperless.example.com/api/custom_fields/3/")
+        route.respond(
+            json={
+                "id": 3,
+                "name": "Trip",
+                "data_type": "select",
+                "extra_data": {"select_options": [{"id": "a1", "label": "Straße"}]},
+            }
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+
+        try:
+            assert await provider.check_custom_field_choice_exists(3, "STRASSE")
+            assert not await provider.check_custom_field_choice_exists(3, "Vienna")
+        finally:
+            await provider.close()
+
+        assert route.call_count == 1
+
+
+class TestDownloadDocument:
+    """Test downloading document files."""
+
+    async def test_streams_into_sink(self, respx_mock):
+        """Test that a sink receives the body and no content is returned."""
+        respx_mock.get(
+            "https://paperless.example.com/api/documents/5/download/"
+        ).respond(
+            content=b"%PDF-1.7",
+            headers={
+                "content-type": "application/pdf",
+                "content-disposition": "attachment; filename*=utf-8''r%C3%A9%20cu.pdf",
+            },
+        )
+        provider = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+        received = bytearray()
+
+        async def sink(chunk: bytes) -> None:
+            received.extend(chunk)
+
+        try:
+            result = await provider.download_document(5, sink=sink)
+        finally:
+            await provider.close()
+
+        assert result == (b"", "ré cu.pdf", "application/pdf")
+        assert bytes(received) == b"%PDF-1.7"
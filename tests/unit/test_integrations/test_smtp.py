@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Unit tests for the SMTP email provider."""
+
+import email
+import smtplib
+import threading
+from unittest.mock import MagicMock, patch
+
+from src.integrations.smtp import SmtpProvider
+
+
+def _provider(**overrides) -> SmtpProvider:
+    return SmtpProvider(
+        {
+            "host": "smtp.example.com",
+            "port": 587,
+            "username": "user",
+            "password": "secret",
+            "from_email": "trips@example.com",
+            **overrides,
+        }
+    )
+
+
+class TestSendEmail:
+    """Test sending mail through the SMTP provider."""
+
+    async def test_session_runs_off_the_event_loop(self):
+        """Test that the blocking SMTP session runs in a worker thread."""
+        loop_thread = threading.get_ident()
+        threads = []
+        server = MagicMock()
+        server.sendmail.side_effect = lambda *args: threads.append(
+            threading.get_ident()
+        )
+
+        with patch.object(smtplib, "SMTP", return_value=server) as smtp:
+            sent = await _provider().send_email(
+                ["finance@example.com"],
+                "Expenses",
+                "See attached",
+                attachments=[("report.pdf", b"%PDF-1.7", "application/pdf")],
+            )
+
+        assert sent is True
+        smtp.assert_called_once_with("smtp.example.com", 587, timeout=30)
+        server.starttls.assert_called_once()
+        server.login.assert_called_once_with("user", "secret")
+        assert server.sendmail.call_args.args[:2] == (
+            "trips@example.com",
+            ["finance@example.com"],
+        )
+        assert threads and threads[0] != loop_thread
+
+        raw = server.sendmail.call_args.args[2]
+        assert isinstance(raw, bytes)
+        assert b"\r\n" in raw and b"\n" not in raw.replace(b"\r\n", b"")
+        message = email.message_from_bytes(raw)
+        attachment = message.get_payload()[-1]
+        assert attachment.get_filename() == "report.pdf"
+        assert attachment.get_payload(decode=True) == b"%PDF-1.7"
+
+    async def test_reuses_live_session(self):
+        """Test that later mails reuse the session and close() quits it."""
+        server = MagicMock()
+        server.noop.return_value = (250, b"OK")
+        provider = _provider()
+
+        with patch.object(smtplib, "SMTP", return_value=server) as smtp:
+            for subject in ("First", "Second"):
+                assert await provider.send_email(["a@example.com"], subject, "Body")
+            await provider.close()
+
+        smtp.assert_called_once()
+        server.login.assert_called_once()
+        assert server.sendmail.call_count == 2
+        server.noop.assert_called_once()
+        server.quit.assert_called_once()
+
+    async def test_dead_session_is_replaced(self):
+        """Test that a session the server dropped is not used again."""
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected()
+        provider = _provider()
+
+        with patch.object(smtplib, "SMTP", side_effect=[stale, fresh]):
+            assert await provider.send_email(["a@example.com"], "First", "Body")
+            assert await provider.send_email(["a@example.com"], "Second", "Body")
+
+        assert stale.sendmail.call_count == 1
+        assert fresh.sendmail.call_count == 1
+        stale.quit.assert_called_once()
+
+    async def test_failure_is_reported(self):
+        """Test that SMTP errors make send_email return False."""
+        server = MagicMock()
+        server.login.side_effect = smtplib.SMTPAuthenticationError(535, b"no")
+
+        with patch.object(smtplib, "SMTP", return_value=server):
+            sent = await _provider().send_email(["a@example.com"], "Hi", "Body")
+
+        assert sent is False
+
+
+class TestHealthCheck:
+    """Test the SMTP connectivity check."""
+
+    async def test_authentication_failure(self):
+        """Test that a rejected login is reported as such."""
+        server = MagicMock()
+        server.login.side_effect = smtplib.SMTPAuthenticationError(535, b"no")
+
+        with patch.object(smtplib, "SMTP", return_value=server):
+            result = await _provider(use_tls=False).health_check()
+
+        assert result == (False, "Authentication failed")
+        server.starttls.assert_not_called()
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Unit tests for the Unsplash provider."""
+
+from src.integrations.unsplash import UnsplashProvider
+
+_PHOTO = {
+    "id": "abc",
+    "description": "Vienna at night",
+    "width": 4000,
+    "height": 3000,
+    "color": "#101010",
+    "urls": {
+        "raw": "https://images.unsplash.com/abc?raw",
+        "full": "https://images.unsplash.com/abc?full",
+        "regular": "https://images.unsplash.com/abc?regular",
+        "small": "https://images.unsplash.com/abc?small",
+        "thumb": "https://images.unsplash.com/abc?thumb",
+    },
+    "user": {"name": "Jane", "username": "jane"},
+    "links": {
+        "html": "https://unsplash.com/photos/abc",
+        "download_location": "https://api.unsplash.com/photos/abc/download",
+    },
+}
+
+
+class TestTriggerDownload:
+    """Test download tracking for chosen images."""
+
+    async def test_searched_photo_skips_lookup(self, respx_mock):
+        """Test that a photo from a search is not fetched again."""
+        respx_mock.get("https://api.unsplash.com/search/photos").respond(
+            json={"total": 1, "total_pages": 1, "results": [_PHOTO]}
+        )
+        lookup = respx_mock.get("https://api.unsplash.com/photos/abc")
+        download = respx_mock.get("https://api.unsplash.com/photos/abc/download")
+        download.respond(json={"url": "https://images.unsplash.com/abc?dl"})
+        provider = UnsplashProvider({"access_key": "key"})
+
+        try:
+            result = await provider.search_images("vienna")
+            url = await provider.trigger_download("abc")
+        finally:
+            await provider.close()
+
+        photo = result["results"][0]
+        assert photo["urls"] == _PHOTO["urls"]
+        assert photo["user"] == {
+            "name": "Jane",
+            "username": "jane",
+            "portfolio_url": None,
+        }
+        assert url == "https://images.unsplash.com/abc?dl"
+        assert not lookup.called
+        assert download.call_count == 1
+
+    async def test_unknown_photo_is_looked_up(self, respx_mock):
+        """Test that the download location is fetched for an unseen photo."""
+        lookup = respx_mock.get("https://api.unsplash.com/photos/abc")
+        lookup.respond(json=_PHOTO)
+        respx_mock.get("https://api.unsplash.com/photos/abc/download").respond(json={})
+        provider = UnsplashProvider({"access_key": "key"})
+
+        try:
+            url = await provider.trigger_download("abc")
+        finally:
+            await provider.close()
+
+        assert url == _PHOTO["urls"]["full"]
+        assert lookup.call_count == 1
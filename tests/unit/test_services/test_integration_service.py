@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Unit tests for integration service."""
+
+import asyncio
+from unittest.mock import patch
+
+from src.encryption import decrypt_config, encrypt_config
+from src.integrations.base import DocumentProvider
+from src.integrations.paperless import PaperlessProvider
+from src.integrations.registry import IntegrationRegistry
+from src.models import IntegrationConfig
+from src.models.enums import IntegrationType
+from src.services import integration_service
+
+
+def _config(values: dict) -> IntegrationConfig:
+    return IntegrationConfig(
+        id="cfg-1",
+        integration_type=IntegrationType.PAPERLESS,
+        name="Paperless",
+        config_encrypted=encrypt_config(values),
+    )
+
+
+class TestDecryptedConfigCache:
+    """Test memoisation of decrypted integration configs."""
+
+    def test_decrypts_once_per_ciphertext(self):
+        """Test that repeated lookups of one config decrypt only once."""
+        config = _config({"url": "https://paperless.example.com", "token": "a"})
+
+        with patch.object(
+            integration_service, "decrypt_config", wraps=decrypt_config
+        ) as decrypt:
+            first = integration_service.get_decrypted_config(config)
+            second = integration_service.get_decrypted_config(config)
+
+        assert decrypt.call_count == 1
+        assert first == second
+
+    def test_returns_independent_copies(self):
+        """Test that callers masking fields do not affect the cached value."""
+        values = {"url": "https://paperless.example.com", "token": "b"}
+        config = _config(values)
+
+        masked = integration_service.get_masked_config(config)
+
+        assert not masked["token"]
+        assert integration_service.get_decrypted_config(config) == values
+
+    def test_changed_config_is_decrypted_again(self):
+        """Test that re-encrypted configs are never served from the cache."""
+        config = _config({"url": "https://paperless.example.com", "token": "c"})
+        integration_service.get_decrypted_config(config)
+
+        values = {"url": "https://paperless.example.com", "token": "d"}
+        config.config_encrypted = encrypt_config(values)
+
+        assert integration_service.get_decrypted_config(config) == values
+
+
+class TestSharedProvider:
+    """Test reuse of live provider instances across requests."""
+
+    async def test_reuses_provider_until_config_changes(self):
+        """Test that a provider is rebuilt and the old one retired on change."""
+        config = _config({"url": "https://paperless.example.com", "token": "e"})
+        config.id = "cfg-shared"
+
+        first = await integration_service.get_shared_provider(config, DocumentProvider)
+        again = await integration_service.get_shared_provider(config, DocumentProvider)
+        assert again is first
+
+        config.config_encrypted = encrypt_config(
+            {"url": "https://paperless.example.com", "token": "f"}
+        )
+        with patch.object(
+            PaperlessProvider,
+            "close",
+            autospec=True,
+            side_effect=PaperlessProvider.close,
+        ) as close:
+            rebuilt = await integration_service.get_shared_provider(
+                config, DocumentProvider
+            )
+            # Requests that already hold the old provider can still use it
+            close.assert_not_awaited()
+
+            await IntegrationRegistry.close_all()
+
+        assert rebuilt is not first
+        assert {call.args[0] for call in close.await_args_list} == {first, rebuilt}
+
+    async def test_deleted_config_is_evicted(self):
+        """Test that evicting from a worker thread drops the live provider."""
+        config = _config({"url": "https://paperless.example.com", "token": "g"})
+        config.id = "cfg-evicted"
+        first = await integration_service.get_shared_provider(config, DocumentProvider)
+
+        with patch.object(
+            PaperlessProvider,
+            "close",
+            autospec=True,
+            side_effect=PaperlessProvider.close,
+        ) as close:
+            await asyncio.to_thread(IntegrationRegistry.evict, config.id)
+            again = await integration_service.get_shared_provider(
+                config, DocumentProvider
+            )
+            close.assert_not_awaited()
+
+            await IntegrationRegistry.close_all()
+
+        assert again is not first
+        assert {call.args[0] for call in close.await_args_list} == {first, again}
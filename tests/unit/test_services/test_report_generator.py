@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Unit tests for the expense report generator."""
+
+from datetime import date
+from decimal import Decimal
+
+from src.integrations.paperless import PaperlessProvider
+from src.models import Expense
+from src.models.enums import ExpenseCategory, PaymentType
+from src.services.report_generator import ExpenseReportGenerator
+
+
+def _expense(description: str, doc_id: int | None) -> Expense:
+    return Expense(
+        event_id="event-1",
+        paperless_doc_id=doc_id,
+        date=date(2024, 1, 16),
+        amount=Decimal("10.00"),
+        payment_type=PaymentType.CASH,
+        category=ExpenseCategory.MEALS,
+        description=description,
+    )
+
+
+class TestDownloadDocuments:
+    """Test fetching Paperless documents for a report."""
+
+    async def test_keeps_expense_order_and_skips_failures(self, respx_mock):
+        """Test that documents keep their numbering and failures are dropped."""
+        base = "https://paperless.example.com/api/documents"
+        for doc_id in (1, 3):
+            respx_mock.get(f"{base}/{doc_id}/download/").respond(
+                content=f"doc-{doc_id}".encode(),
+                headers={
+                    "content-type": "image/png",
+                    "content-disposition": f'attachment; filename="scan{doc_id}.png"',
+                },
+            )
+        respx_mock.get(f"{base}/2/download/").respond(404)
+        paperless = PaperlessProvider(
+            {"url": "https://paperless.example.com", "token": "token"}
+        )
+        generator = ExpenseReportGenerator(db=None, paperless=paperless)  # type: ignore[arg-type]
+        expenses = [
+            _expense("Taxi", 1),
+            _expense("Lunch", None),
+            _expense("Hotel", 2),
+            _expense("Train", 3),
+        ]
+
+        try:
+            documents = await generator._download_documents(expenses)
+        finally:
+            await paperless.close()
+
+        assert [(name, file.read()) for name, file in documents] == [
+            ("01_2024-01-16_taxi.png", b"doc-1"),
+            ("04_2024-01-16_train.png", b"doc-3"),
+        ]
+        assert respx_mock.calls.call_count == 3